@@ -0,0 +1,20 @@
+-- Composite indexes for the enrollment list endpoints.
+--
+-- Context: /enrollments/my-students filters on
+--   tutor_id = ? AND enrollment_type = 'Regular'
+--   AND payment_status != 'Cancelled' AND first_lesson_date >= cutoff
+-- and /enrollments/overdue on
+--   payment_status = 'Pending Payment' AND first_lesson_date <= week_from_now.
+-- Only single-column indexes covered these, so MySQL picked one (usually
+-- tutor_id or first_lesson_date) and filtered the rest row by row.
+--
+-- Equality columns lead; first_lesson_date is last so the cutoff becomes a
+-- range scan within each (tutor, type, status) group. The overdue index
+-- complements idx_enrollments_payment_deadline, which only serves the
+-- payment_deadline side of that endpoint's OR.
+
+CREATE INDEX idx_enrollments_tutor_type_status_date
+  ON enrollments (tutor_id, enrollment_type, payment_status, first_lesson_date);
+
+CREATE INDEX idx_enrollments_status_first_lesson
+  ON enrollments (payment_status, first_lesson_date);
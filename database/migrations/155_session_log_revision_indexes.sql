@@ -0,0 +1,42 @@
+-- Composite indexes for the exam revision eligibility queries.
+--
+-- Context: the eligible-student lists and calendar counts probe session_log
+-- per student for a "consumable" session:
+--   student_id = ? AND location = ? AND (
+--     (session_status IN (pending make-up statuses) AND rescheduled_to_id IS NULL)
+--     OR (session_status IN (scheduled statuses) AND session_date > today))
+-- and per slot for enrolled rows:
+--   exam_revision_slot_id = ? AND session_status IN (enrolled statuses).
+-- idx_session_log_student_date and idx_session_revision_slot only cover the
+-- leading column, so every candidate row was fetched to check the rest.
+--
+-- MySQL has no partial indexes, so the predicate columns are indexed in full:
+-- location and session_status are equality/IN lookups and lead after
+-- student_id, session_date is the range column, and rescheduled_to_id is
+-- trailing so the EXISTS probe is answered from the index alone.
+--
+-- Each new index starts with the single column of an older one, which is
+-- dropped here:
+--   idx_session_log_student (student_id): idx_session_log_consumable,
+--     idx_session_log_student_date and unique_student_tutor_session all lead
+--     with student_id, so student lookups and the foreign key keep an index.
+--   idx_session_revision_slot (exam_revision_slot_id):
+--     idx_session_log_slot_status leads with the slot, as does
+--     uq_revision_slot_student, and either backs fk_session_revision_slot.
+--
+-- Kept alongside: idx_session_log_student_date serves per-student history
+-- ordered or ranged by session_date (no location/status equality to use the
+-- consumable index), and uq_revision_slot_student answers the per-student
+-- "already enrolled in this slot" probe. idx_session_log_slot_status is
+-- for the correlated enrolled count on every slot listing
+-- (exam_revision_slot_id = ? AND session_status IN (...)), which it answers
+-- from the index alone.
+
+CREATE INDEX idx_session_log_consumable
+  ON session_log (student_id, location, session_status, session_date, rescheduled_to_id);
+
+CREATE INDEX idx_session_log_slot_status
+  ON session_log (exam_revision_slot_id, session_status);
+
+ALTER TABLE session_log DROP INDEX idx_session_log_student;
+ALTER TABLE session_log DROP INDEX idx_session_revision_slot;
@@ -0,0 +1,35 @@
+-- Composite indexes for revision slot auto-adoption and tutor conflict checks.
+--
+-- Context: auto-adoption looks for unlinked sessions in the slot's cell:
+--   session_date = ? AND time_slot = ? AND location = ?
+--   AND session_status IN (...) AND exam_revision_slot_id IS NULL
+-- idx_location_date_status serves location/date/status but not time_slot, so
+-- every session at that branch on that day was read to match the slot time.
+--
+-- The tutor conflict check filters
+--   tutor_id = ? AND session_date = ? AND session_status IN (...)
+--   AND exam_revision_slot_id IS NULL
+-- idx_session_tutor_date stops at the date; the new index adds the status
+-- and slot link so non-matching rows are rejected from the index.
+--
+-- No student_id/session_date/session_status index is added:
+-- idx_session_log_student_date and idx_session_log_consumable (155) already
+-- lead with student_id and narrow each student to a handful of rows.
+--
+-- idx_session_log_tutor_date_status makes two older tutor indexes
+-- redundant, so both are dropped:
+--   idx_session_log_tutor (tutor_id), from migration 044
+--   idx_session_tutor_date (tutor_id, session_date), from the
+--     unchecked_attendance_reminders view script
+-- Tutor/date range lookups and the tutor_id foreign key use the new index's
+-- prefix instead. idx_location_date_status stays: it serves location-wide
+-- date ranges (calendars, attendance), which have no time_slot to match.
+
+CREATE INDEX idx_session_log_slot_cell
+  ON session_log (session_date, location, time_slot, session_status, exam_revision_slot_id);
+
+CREATE INDEX idx_session_log_tutor_date_status
+  ON session_log (tutor_id, session_date, session_status, exam_revision_slot_id);
+
+ALTER TABLE session_log DROP INDEX idx_session_log_tutor;
+ALTER TABLE session_log DROP INDEX idx_session_tutor_date;
@@ -0,0 +1,11 @@
+-- Index for narrowing exam eligible-student counts to the targeted students.
+--
+-- Context: the exam revision calendar counts eligible students per exam by
+-- matching students against each event's school/grade/stream. When every
+-- exam in a count targets a specific school and grade, the count query adds
+--   (students.school, students.grade) IN ((?, ?), ...)
+-- so only those students are joined to their enrollments and sessions,
+-- instead of every student with an active enrollment.
+
+CREATE INDEX idx_students_school_grade
+  ON students (school, grade);
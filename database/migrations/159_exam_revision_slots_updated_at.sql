@@ -0,0 +1,12 @@
+-- Modification time for exam revision slots.
+--
+-- Context: the revision slot list answers If-None-Match from an aggregate
+-- probe over the listed slots (count, MAX(id), enrolled sessions) instead of
+-- building and hashing the list. Editing a slot's tutor, date, time,
+-- location or notes changes none of those, so MAX(updated_at) is added to
+-- the probe. Microsecond precision keeps two edits in the same second apart.
+--
+-- Existing rows take the migration time; only changes after it matter.
+
+ALTER TABLE exam_revision_slots
+  ADD COLUMN updated_at DATETIME(6) NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
@@ -181,6 +181,5 @@ WHERE
 CREATE INDEX idx_session_attendance_check 
 ON session_log(session_date, session_status, attendance_marked_by);
 
--- Index for tutor-based queries
-CREATE INDEX idx_session_tutor_date 
-ON session_log(tutor_id, session_date);
\ No newline at end of file
+-- Tutor-based queries use idx_session_log_tutor_date_status
+-- (migration 156), which replaced idx_session_tutor_date
\ No newline at end of file
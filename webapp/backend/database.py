@@ -40,12 +40,22 @@ else:
         "write_timeout": 30,
     }
 
+# Connection pool sizing. Sync endpoints run on FastAPI's threadpool (40
+# threads by default), so pool_size + max_overflow matches it: a request never
+# waits on the pool unless background work also holds connections. Keeping
+# more of those connections persistent avoids reconnect handshakes on bursts
+# (e.g. a tutor creating several revision slots in a row), and a shorter
+# pool_timeout fails fast instead of hanging a request for 30s.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+
 # Create database engine with connection pooling
 engine = create_engine(
     DATABASE_URL,
-    pool_size=15,
-    max_overflow=25,
-    pool_timeout=30,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
     pool_recycle=3600,
     pool_pre_ping=True,  # Re-enabled for connection health checks
     echo=False,  # Set to True for SQL debugging
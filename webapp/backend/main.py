@@ -291,6 +291,10 @@ app.add_middleware(
         "X-Effective-Role",  # Custom header for role switching
         "X-Branch-Pin",  # PIN for public prospect page access
     ],
+    expose_headers=[
+        "X-Next-Cursor",  # Keyset pagination cursor on list endpoints
+        "X-Total-Count",  # Full size of paged computed lists
+    ],
 )
 
 
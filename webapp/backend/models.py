@@ -106,6 +106,10 @@ class Enrollment(Base):
         Index('idx_enrollment_student', 'student_id'),
         Index('idx_enrollment_tutor', 'tutor_id'),
         Index('idx_enrollment_location', 'location'),
+        # Composite lookups for my-students and overdue (migration 154)
+        Index('idx_enrollments_tutor_type_status_date',
+              'tutor_id', 'enrollment_type', 'payment_status', 'first_lesson_date'),
+        Index('idx_enrollments_status_first_lesson', 'payment_status', 'first_lesson_date'),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -213,10 +217,19 @@ class SessionLog(Base):
         UniqueConstraint('exam_revision_slot_id', 'student_id', name='uq_revision_slot_student'),
         # Performance indexes for frequently filtered columns
         # Note: session_status already indexed via idx_location_date_status
-        Index('idx_session_log_student', 'student_id'),
         Index('idx_session_log_student_date', 'student_id', 'session_date'),
-        Index('idx_session_log_tutor', 'tutor_id'),
         Index('idx_session_log_enrollment', 'enrollment_id'),
+        # Exam revision eligibility probes (migration 155, which drops the
+        # student_id and exam_revision_slot_id single-column indexes they cover)
+        Index('idx_session_log_consumable', 'student_id', 'location', 'session_status',
+              'session_date', 'rescheduled_to_id'),
+        Index('idx_session_log_slot_status', 'exam_revision_slot_id', 'session_status'),
+        # Revision slot auto-adoption and tutor conflict checks (migration 156,
+        # which drops the tutor_id and tutor_id/session_date indexes it covers)
+        Index('idx_session_log_slot_cell', 'session_date', 'location', 'time_slot',
+              'session_status', 'exam_revision_slot_id'),
+        Index('idx_session_log_tutor_date_status', 'tutor_id', 'session_date',
+              'session_status', 'exam_revision_slot_id'),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -951,6 +964,8 @@ class ExamRevisionSlot(Base):
     notes = Column(Text)
     created_at = Column(DateTime, server_default=func.now())
     created_by = Column(String(255))
+    # Set in Python so edits within one second stay distinct (migration 159)
+    updated_at = Column(DateTime, default=hk_now, onupdate=hk_now, server_default=func.now())
 
     # Relationships
     calendar_event = relationship("CalendarEvent", back_populates="revision_slots")
@@ -2,13 +2,17 @@
 Enrollments API endpoints.
 Provides CRUD access to enrollment data with filtering and session generation.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, select
+from sqlalchemy import and_, case, or_, func, select
 from typing import List, Optional
+from pydantic import TypeAdapter
 from datetime import date, datetime, timedelta
 from constants import hk_now, CONFLICTING_SESSION_STATUSES, CANCELLED_OR_MAKEUP_BOOKED_STATUSES, BASE_FEE_PER_LESSON, REGISTRATION_FEE, MIN_LESSONS_FOR_DISCOUNT, PER_TWO_LESSONS_DISCOUNT_TYPE, ACTIVE_GRACE_PERIOD_DAYS
 from collections import defaultdict
+import base64
+import binascii
+import time
 from database import get_db
 from models import Enrollment, Student, Tutor, Discount, Holiday, SessionLog, StudentCoupon, TutorMemo, SummerApplication, SummerCourseConfig
 from schemas import (
@@ -23,7 +27,8 @@ from schemas import (
     DiscountOverrideRequest,
 )
 from auth.dependencies import require_admin_write, get_current_user
-from utils.query_helpers import enrollment_with_relations, enrollment_with_student_tutor
+from utils.query_helpers import enrollment_with_relations, enrollment_list_relations, enrollment_with_student_tutor
+from utils.cache_invalidation import invalidate_on_commit
 import logging
 
 logger = logging.getLogger(__name__)
@@ -528,6 +533,46 @@ def calculate_effective_end_date_bulk(
     return _count_lesson_dates(enrollment.id, enrollment.first_lesson_date, total_lesson_dates, holidays)
 
 
+# Validates a whole list of ORM rows in one call instead of one per row.
+_ENROLLMENT_LIST_ADAPTER = TypeAdapter(List[EnrollmentResponse])
+
+
+def _set_enrollment_display_fields(enrollment_data: EnrollmentResponse, enrollment: Enrollment) -> None:
+    """Copy the student/tutor/discount display fields onto a response.
+
+    Resolves each relationship once instead of once per field.
+    """
+    student, tutor, discount = enrollment.student, enrollment.tutor, enrollment.discount
+    if student:
+        enrollment_data.student_name = student.student_name
+        enrollment_data.grade = student.grade
+        enrollment_data.school = student.school
+        enrollment_data.school_student_id = student.school_student_id
+        enrollment_data.lang_stream = student.lang_stream
+    if tutor:
+        enrollment_data.tutor_name = tutor.tutor_name
+    if discount:
+        enrollment_data.discount_name = discount.discount_name
+
+
+def _build_enrollment_response(enrollment: Enrollment) -> EnrollmentResponse:
+    """Base EnrollmentResponse with the student/tutor/discount display fields.
+
+    Callers fill in the computed fields (effective_end_date, fees, ...) themselves.
+    """
+    enrollment_data = EnrollmentResponse.model_validate(enrollment)
+    _set_enrollment_display_fields(enrollment_data, enrollment)
+    return enrollment_data
+
+
+def _build_enrollment_responses(enrollments: List[Enrollment]) -> List[EnrollmentResponse]:
+    """List form of _build_enrollment_response(), validated as one batch."""
+    results = _ENROLLMENT_LIST_ADAPTER.validate_python(enrollments, from_attributes=True)
+    for enrollment_data, enrollment in zip(results, enrollments):
+        _set_enrollment_display_fields(enrollment_data, enrollment)
+    return results
+
+
 # ============================================
 # Enrollment Creation Endpoints
 # ============================================
@@ -782,10 +827,9 @@ async def create_enrollment(
 
     db.commit()
 
-    # Re-query with joins to return full response
-    enrollment = db.query(Enrollment).options(
-        *enrollment_with_relations()
-    ).filter(Enrollment.id == enrollment.id).first()
+    # Re-query to return full response. The relationship fields come from the
+    # student/tutor/discount already in hand, so no eager loads are needed.
+    enrollment = db.query(Enrollment).filter(Enrollment.id == enrollment.id).first()
 
     # Build response
     enrollment_response = EnrollmentResponse.model_validate(enrollment)
@@ -1196,8 +1240,125 @@ async def get_renewal_counts(
     )
 
 
+def _encode_enrollment_cursor(enrollment: Enrollment) -> str:
+    """Opaque keyset cursor for the (first_lesson_date DESC, id DESC) ordering."""
+    first_lesson = enrollment.first_lesson_date.isoformat() if enrollment.first_lesson_date else ""
+    raw = f"{first_lesson}|{enrollment.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_enrollment_cursor(cursor: str) -> tuple[Optional[date], int]:
+    """Inverse of _encode_enrollment_cursor; 400 on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        first_lesson, enrollment_id = raw.split("|")
+        return (date.fromisoformat(first_lesson) if first_lesson else None), int(enrollment_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _enrollment_after_cursor(cursor_date: Optional[date], cursor_id: int):
+    """Filter for rows that sort after the cursor row.
+
+    NULL first_lesson_date rows sort last under DESC, so they follow every
+    dated row and are then paged by id alone.
+    """
+    if cursor_date is None:
+        return and_(Enrollment.first_lesson_date.is_(None), Enrollment.id < cursor_id)
+    return or_(
+        Enrollment.first_lesson_date < cursor_date,
+        and_(Enrollment.first_lesson_date == cursor_date, Enrollment.id < cursor_id),
+        Enrollment.first_lesson_date.is_(None),
+    )
+
+
+# Per-process TTL cache for the dashboard lists (active, overdue), which are
+# polled with the same few parameter combinations. Any committed ORM write to
+# a table these lists read clears it, from whichever router (see
+# utils.cache_invalidation). Raw SQL edits and writes served by a different
+# worker process show up once the entry expires, i.e. within
+# _ENROLLMENT_LIST_CACHE_TTL seconds.
+_enrollment_list_cache: dict[tuple, tuple[list, float]] = {}
+_ENROLLMENT_LIST_CACHE_TTL = 30  # seconds
+
+
+def _get_cached_enrollment_list(cache_key: tuple) -> Optional[list]:
+    """Cached rows for cache_key, or None if absent or expired."""
+    entry = _enrollment_list_cache.get(cache_key)
+    if entry is not None and time.time() < entry[1]:
+        return entry[0]
+    return None
+
+
+def _set_cached_enrollment_list(cache_key: tuple, rows: list) -> None:
+    """Store rows for cache_key and prune expired entries."""
+    now = time.time()
+    _enrollment_list_cache[cache_key] = (rows, now + _ENROLLMENT_LIST_CACHE_TTL)
+    for k in [k for k, (_, exp) in _enrollment_list_cache.items() if now >= exp]:
+        del _enrollment_list_cache[k]
+
+
+def clear_enrollment_list_cache() -> None:
+    """Drop this process's cached dashboard lists."""
+    _enrollment_list_cache.clear()
+
+
+invalidate_on_commit(
+    (Enrollment, Student, Tutor, Discount, Holiday, SummerApplication),
+    clear_enrollment_list_cache,
+)
+
+
+def _load_list_display_columns(db: Session, enrollments: List[Enrollment]):
+    """Student display columns and tutor names for a batch of enrollments.
+
+    One IN-list query per table returning plain rows, for compact list
+    responses that need a few names but no Student/Tutor instances.
+
+    Returns:
+        (students_by_id, tutor_names) — student id -> row with student_name,
+        school_student_id and grade; tutor id -> tutor_name.
+    """
+    student_ids = {e.student_id for e in enrollments if e.student_id}
+    tutor_ids = {e.tutor_id for e in enrollments if e.tutor_id}
+    students_by_id = {}
+    if student_ids:
+        students_by_id = {
+            row.id: row for row in db.execute(
+                select(Student.id, Student.student_name, Student.school_student_id, Student.grade)
+                .where(Student.id.in_(student_ids))
+            )
+        }
+    tutor_names = {}
+    if tutor_ids:
+        tutor_names = dict(db.execute(
+            select(Tutor.id, Tutor.tutor_name).where(Tutor.id.in_(tutor_ids))
+        ).all())
+    return students_by_id, tutor_names
+
+
+# Largest page a client may ask for from lists whose membership and order are
+# computed in Python (active, my-students, overdue). Paging is opt-in: without
+# a limit these lists are returned whole.
+COMPUTED_LIST_MAX_LIMIT = 1000
+
+
+def _page_computed_list(rows: list, limit: Optional[int], offset: int, response: Response) -> list:
+    """Slice a fully computed list and report its size in X-Total-Count.
+
+    These lists are filtered and sorted after loading, so a SQL keyset cursor
+    can't apply; the total lets clients tell when more pages exist. With no
+    limit, everything from offset on is returned.
+    """
+    response.headers["X-Total-Count"] = str(len(rows))
+    if limit is None:
+        return rows[offset:]
+    return rows[offset:offset + limit]
+
+
 @router.get("/enrollments", response_model=List[EnrollmentResponse])
 async def get_enrollments(
+    response: Response,
     student_id: Optional[int] = Query(None, description="Filter by student ID"),
     tutor_id: Optional[int] = Query(None, description="Filter by tutor ID"),
     location: Optional[str] = Query(None, description="Filter by location"),
@@ -1206,7 +1367,8 @@ async def get_enrollments(
     from_date: Optional[date] = Query(None, description="Filter by first_lesson_date >= this date"),
     to_date: Optional[date] = Query(None, description="Filter by first_lesson_date <= this date"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    offset: int = Query(0, ge=0, description="Number of results to skip (deprecated, use cursor)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -1220,10 +1382,14 @@ async def get_enrollments(
     - **from_date**: Filter enrollments starting from this date
     - **to_date**: Filter enrollments up to this date
     - **limit**: Maximum number of results (default 100, max 500)
-    - **offset**: Pagination offset (default 0)
+    - **cursor**: Keyset cursor for the next page; takes precedence over offset
+    - **offset**: Pagination offset (default 0, deprecated — deep offsets scan and discard rows)
+
+    When a full page is returned, the cursor for the next page is sent in the
+    X-Next-Cursor response header.
     """
     query = db.query(Enrollment).options(
-        *enrollment_with_relations()
+        *enrollment_list_relations()
     ).filter(
         # Exclude orphaned enrollments with NULL foreign keys
         Enrollment.student_id.isnot(None),
@@ -1255,8 +1421,16 @@ async def get_enrollments(
     # Order by most recent first, with secondary sort by id for stable pagination
     query = query.order_by(Enrollment.first_lesson_date.desc(), Enrollment.id.desc())
 
-    # Apply pagination
-    enrollments = query.offset(offset).limit(limit).all()
+    # Apply pagination: keyset when a cursor is given, legacy offset otherwise
+    if cursor:
+        cursor_date, cursor_id = _decode_enrollment_cursor(cursor)
+        query = query.filter(_enrollment_after_cursor(cursor_date, cursor_id))
+    elif offset:
+        query = query.offset(offset)
+    enrollments = query.limit(limit).all()
+
+    if len(enrollments) == limit:
+        response.headers["X-Next-Cursor"] = _encode_enrollment_cursor(enrollments[-1])
 
     # Load holidays once for bulk calculation
     today = hk_now().date()
@@ -1265,28 +1439,23 @@ async def get_enrollments(
     summer_unavailability = bulk_load_summer_unavailability_notes(db, enrollments)
 
     # Build response with related data
-    result = []
-    for enrollment in enrollments:
-        enrollment_data = EnrollmentResponse.model_validate(enrollment)
-        enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-        enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-        enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-        enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-        enrollment_data.school = enrollment.student.school if enrollment.student else None
-        enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-        enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    result = _build_enrollment_responses(enrollments)
+    for enrollment_data, enrollment in zip(result, enrollments):
         enrollment_data.effective_end_date = calculate_effective_end_date_bulk(enrollment, holidays, summer_end_dates)
         enrollment_data.summer_unavailability_notes = summer_unavailability.get(enrollment.summer_application_id)
         # Rows reach the enrollment detail popover, whose new-student badge
         # only claims the materials fee when it was actually charged. Costs a
         # lookup only for new students published from an application.
         enrollment_data.registration_fee = enrollment_registration_fee(enrollment, db)
-        result.append(enrollment_data)
 
     return result
 
 
-def get_active_enrollment_objects(db: Session, location: Optional[str] = None):
+def get_active_enrollment_objects(
+    db: Session,
+    location: Optional[str] = None,
+    with_relations: bool = True,
+):
     """
     Single source of truth for "active enrollments" — returns the latest
     Regular enrollment per student that's still within its effective end
@@ -1299,6 +1468,10 @@ def get_active_enrollment_objects(db: Session, location: Optional[str] = None):
         summer-end-date maps are returned so callers that need to recompute
         per-enrollment effective_end_date for response shaping can reuse the
         bulk-loaded data instead of re-querying.
+
+    Pass with_relations=False when only ids are needed (e.g. the /students
+    tutor filter) to skip joining student, tutor and discount. With relations,
+    the result is ordered by student name.
     """
     today = hk_now().date()
 
@@ -1310,9 +1483,6 @@ def get_active_enrollment_objects(db: Session, location: Optional[str] = None):
 
     query = (
         db.query(Enrollment)
-        .options(
-            *enrollment_with_relations()
-        )
         .filter(
             Enrollment.payment_status != "Cancelled",
             Enrollment.enrollment_type == "Regular",
@@ -1325,6 +1495,16 @@ def get_active_enrollment_objects(db: Session, location: Optional[str] = None):
             )
         )
     )
+    if with_relations:
+        # Responses list students by name; sorting in SQL keeps the grouping
+        # below in name order so callers don't re-sort. An outer join, so an
+        # enrollment whose student row is missing is kept exactly as on the
+        # with_relations=False path.
+        query = (
+            query.outerjoin(Enrollment.student)
+            .options(*enrollment_list_relations(student_joined=True))
+            .order_by(Student.student_name, Enrollment.id)
+        )
 
     # Apply location filter if provided
     if location:
@@ -1364,7 +1544,10 @@ def get_active_enrollment_objects(db: Session, location: Optional[str] = None):
 
 @router.get("/enrollments/active", response_model=List[EnrollmentResponse])
 async def get_active_enrollments(
+    response: Response,
     location: Optional[str] = Query(None, description="Filter by location"),
+    limit: Optional[int] = Query(None, ge=1, le=COMPUTED_LIST_MAX_LIMIT, description="Maximum number of results (omit for the full list)"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
     db: Session = Depends(get_db)
 ):
     """
@@ -1376,36 +1559,35 @@ async def get_active_enrollments(
     effective_end_date = first_lesson_date + (lessons_paid + deadline_extension_weeks) weeks
 
     - **location**: Filter by location (optional, omit for all locations)
-    """
-    latest_enrollments, holidays, summer_end_dates = get_active_enrollment_objects(db, location=location)
+    - **limit** / **offset**: Optional paging (limit max 1000); omit limit for the full list. Total in X-Total-Count
 
-    # Sort by student name for easier viewing
-    latest_enrollments = sorted(latest_enrollments, key=lambda e: e.student.student_name if e.student else "")
+    The full list is cached per location (see _enrollment_list_cache).
+    """
+    cache_key = ("active", location)
+    result = _get_cached_enrollment_list(cache_key)
+    if result is None:
+        # Already sorted by student name for easier viewing
+        latest_enrollments, holidays, summer_end_dates = get_active_enrollment_objects(db, location=location)
 
-    # Build response with related data
-    result = []
-    for enrollment in latest_enrollments:
-        enrollment_data = EnrollmentResponse.model_validate(enrollment)
-        enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-        enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-        enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-        enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-        enrollment_data.school = enrollment.student.school if enrollment.student else None
-        enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-        enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
-        enrollment_data.effective_end_date = calculate_effective_end_date_bulk(enrollment, holidays, summer_end_dates)
-        # Same badge rule as the main list: only claim the materials fee when
-        # it was actually charged.
-        enrollment_data.registration_fee = enrollment_registration_fee(enrollment, db)
-        result.append(enrollment_data)
+        # Build response with related data
+        result = _build_enrollment_responses(latest_enrollments)
+        for enrollment_data, enrollment in zip(result, latest_enrollments):
+            enrollment_data.effective_end_date = calculate_effective_end_date_bulk(enrollment, holidays, summer_end_dates)
+            # Same badge rule as the main list: only claim the materials fee when
+            # it was actually charged.
+            enrollment_data.registration_fee = enrollment_registration_fee(enrollment, db)
+        _set_cached_enrollment_list(cache_key, result)
 
-    return result
+    return _page_computed_list(result, limit, offset, response)
 
 
 @router.get("/enrollments/overdue", response_model=List[OverdueEnrollment])
 async def get_overdue_enrollments(
+    response: Response,
     location: Optional[str] = Query(None, description="Filter by location"),
     tutor_id: Optional[int] = Query(None, description="Filter by tutor ID"),
+    limit: Optional[int] = Query(None, ge=1, le=COMPUTED_LIST_MAX_LIMIT, description="Maximum number of results (omit for the full list)"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
     db: Session = Depends(get_db)
 ):
     """
@@ -1421,7 +1603,17 @@ async def get_overdue_enrollments(
     Includes enrollments where the effective deadline is within 7 days or
     already past. Rows with an admin override stay visible (payment is still
     pending), but their tier stays locked at the override value.
+
+    Supports optional limit/offset paging (limit max 1000); without a limit the
+    full list is returned. The total is in X-Total-Count.
+    Urgency is computed per row, so paging happens after the final sort.
+    The full list is cached per (location, tutor_id) (see _enrollment_list_cache).
     """
+    cache_key = ("overdue", location, tutor_id)
+    cached = _get_cached_enrollment_list(cache_key)
+    if cached is not None:
+        return _page_computed_list(cached, limit, offset, response)
+
     today = hk_now().date()
     week_from_now = today + timedelta(days=7)
 
@@ -1433,9 +1625,9 @@ async def get_overdue_enrollments(
     query = (
         db.query(Enrollment)
         .options(
-            # discount is loaded too so the per-row fee can be computed without
-            # an N+1 lazy-load on each regular enrollment's discount.
-            *enrollment_with_relations()
+            # Only discount is eager-loaded, for the per-row fee; the few
+            # student/tutor columns shown come from the IN-list fetch below.
+            joinedload(Enrollment.discount)
         )
         .filter(
             Enrollment.payment_status == "Pending Payment",
@@ -1453,7 +1645,15 @@ async def get_overdue_enrollments(
     if tutor_id:
         query = query.filter(Enrollment.tutor_id == tutor_id)
 
-    overdue_enrollments = query.all()
+    # Most overdue first by the stored deadline (same rule as the row-level
+    # pick below). Summer rows can still move once their live tier deadline
+    # is known, so the final sort stays — but it now runs over
+    # already-ordered input with a deterministic tiebreak.
+    stored_effective_deadline = case(
+        (Enrollment.payment_deadline < Enrollment.first_lesson_date, Enrollment.payment_deadline),
+        else_=Enrollment.first_lesson_date,
+    )
+    overdue_enrollments = query.order_by(stored_effective_deadline, Enrollment.id).all()
 
     # Live-recompute the tier for Summer rows without an override. The stored
     # snapshot is updated at publish + on paid_at/payment_date edits, but can
@@ -1500,8 +1700,13 @@ async def get_overdue_enrollments(
                 live_deadline[e.id] = compute_payment_deadline(result_tier, e.first_lesson_date)
             summer_fee[e.id] = effective_final_fee(e, app, app.config, result_tier)
 
-    result = []
-    for enrollment in overdue_enrollments:
+    students_by_id, tutor_names = _load_list_display_columns(db, overdue_enrollments)
+
+    # Day counts as ordinal differences — no timedelta per row.
+    today_ord = today.toordinal()
+
+    def build_row(enrollment: Enrollment) -> OverdueEnrollment:
+        student = students_by_id.get(enrollment.student_id)
         # Prefer the live tier's deadline over the stored snapshot; overrides
         # and rows without a config keep the snapshot.
         payment_deadline = live_deadline.get(enrollment.id, enrollment.payment_deadline)
@@ -1519,7 +1724,7 @@ async def get_overdue_enrollments(
         else:
             effective = enrollment.first_lesson_date
             deadline_source = "first_lesson"
-        days_overdue = (today - effective).days
+        days_overdue = today_ord - effective.toordinal()
 
         # Apply live-computed tier when available; snapshot otherwise.
         tier_code = enrollment.locked_discount_code
@@ -1534,14 +1739,14 @@ async def get_overdue_enrollments(
         else:
             total_fee = compute_enrollment_total_fee(enrollment, db)
 
-        result.append(OverdueEnrollment(
+        return OverdueEnrollment(
             id=enrollment.id,
             student_id=enrollment.student_id,
-            student_name=enrollment.student.student_name if enrollment.student else "",
-            school_student_id=enrollment.student.school_student_id if enrollment.student else None,
-            grade=enrollment.student.grade if enrollment.student else None,
+            student_name=student.student_name if student else "",
+            school_student_id=student.school_student_id if student else None,
+            grade=student.grade if student else None,
             tutor_id=enrollment.tutor_id,
-            tutor_name=enrollment.tutor.tutor_name if enrollment.tutor else None,
+            tutor_name=tutor_names.get(enrollment.tutor_id),
             assigned_day=enrollment.assigned_day,
             assigned_time=enrollment.assigned_time,
             location=enrollment.location,
@@ -1557,17 +1762,26 @@ async def get_overdue_enrollments(
             discount_override_reason=enrollment.discount_override_reason,
             total_fee=total_fee,
             registration_fee=enrollment_registration_fee(enrollment, db),
-        ))
-
-    result.sort(key=lambda x: x.days_overdue, reverse=True)
+        )
 
-    return result
+    # Rows arrive ordered by stored deadline; the stable sort only has to
+    # move Summer rows whose live deadline differs.
+    result = sorted(
+        (build_row(e) for e in overdue_enrollments),
+        key=lambda x: x.days_overdue,
+        reverse=True,
+    )
+    _set_cached_enrollment_list(cache_key, result)
+    return _page_computed_list(result, limit, offset, response)
 
 
 @router.get("/enrollments/my-students", response_model=List[EnrollmentResponse])
 async def get_my_students(
+    response: Response,
     tutor_id: int = Query(..., description="Filter by tutor ID (required)"),
     location: Optional[str] = Query(None, description="Filter by location"),
+    limit: Optional[int] = Query(None, ge=1, le=COMPUTED_LIST_MAX_LIMIT, description="Maximum number of results (omit for the full list)"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
     db: Session = Depends(get_db)
 ):
     """
@@ -1581,6 +1795,9 @@ async def get_my_students(
     - effective_end_date >= today (enrollment still active)
 
     effective_end_date = first_lesson_date + (lessons_paid + deadline_extension_weeks) weeks
+
+    Supports optional limit/offset paging (limit max 1000); without a limit the
+    full list is returned. The total is in X-Total-Count.
     """
     today = hk_now().date()
 
@@ -1588,11 +1805,12 @@ async def get_my_students(
     max_possible_weeks = 60  # Conservative upper bound
     cutoff_date = today - timedelta(weeks=max_possible_weeks)
 
-    # Query enrollments for this tutor
+    # Query enrollments for this tutor, sorted by student name in SQL
     query = (
         db.query(Enrollment)
+        .outerjoin(Enrollment.student)
         .options(
-            *enrollment_with_relations()
+            *enrollment_list_relations(student_joined=True)
         )
         .filter(
             Enrollment.tutor_id == tutor_id,
@@ -1611,7 +1829,7 @@ async def get_my_students(
     if location:
         query = query.filter(Enrollment.location == location)
 
-    all_enrollments = query.all()
+    all_enrollments = query.order_by(Student.student_name, Enrollment.id).all()
 
     # Load holidays once for bulk calculation
     holidays = get_holidays_in_range(db, today - timedelta(weeks=52), today + timedelta(weeks=104))
@@ -1639,28 +1857,15 @@ async def get_my_students(
             # No first_lesson_date - include it (enrollment hasn't started yet)
             active_enrollments.append(latest)
 
-    # Sort by student name for easier viewing
-    active_enrollments = sorted(
-        active_enrollments,
-        key=lambda e: e.student.student_name if e.student else ""
-    )
+    active_enrollments = _page_computed_list(active_enrollments, limit, offset, response)
 
     # Build response with related data
-    result = []
-    for enrollment in active_enrollments:
-        enrollment_data = EnrollmentResponse.model_validate(enrollment)
-        enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-        enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-        enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-        enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-        enrollment_data.school = enrollment.student.school if enrollment.student else None
-        enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-        enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    result = _build_enrollment_responses(active_enrollments)
+    for enrollment_data, enrollment in zip(result, active_enrollments):
         enrollment_data.effective_end_date = calculate_effective_end_date_bulk(enrollment, holidays, summer_end_dates)
         # Same badge rule as the main list: only claim the materials fee when
         # it was actually charged.
         enrollment_data.registration_fee = enrollment_registration_fee(enrollment, db)
-        result.append(enrollment_data)
 
     return result
 
@@ -1843,14 +2048,7 @@ async def get_enrollment_detail(
     if not enrollment:
         raise HTTPException(status_code=404, detail=f"Enrollment with ID {enrollment_id} not found")
 
-    enrollment_data = EnrollmentResponse.model_validate(enrollment)
-    enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-    enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-    enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-    enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-    enrollment_data.school = enrollment.student.school if enrollment.student else None
-    enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-    enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    enrollment_data = _build_enrollment_response(enrollment)
     enrollment_data.effective_end_date = calculate_effective_end_date(enrollment, db)
     enrollment_data.summer_unavailability_notes = bulk_load_summer_unavailability_notes(
         db, [enrollment]
@@ -2407,21 +2605,13 @@ async def update_enrollment(
     enrollment.last_modified_time = hk_now()
     enrollment.last_modified_by = admin.user_email
 
-    db.commit()
-    # Re-query with joins to ensure relationships are loaded
-    enrollment = db.query(Enrollment).options(
-        *enrollment_with_relations()
-    ).filter(Enrollment.id == enrollment_id).first()
-
-    # Manually set relationship fields (same as GET endpoint)
-    enrollment_data = EnrollmentResponse.model_validate(enrollment)
-    enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-    enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-    enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-    enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-    enrollment_data.school = enrollment.student.school if enrollment.student else None
-    enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-    enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    # Build the response before committing: the instance and its relationships
+    # are all loaded now, while commit would expire them and force a re-query.
+    # A reassigned tutor is the one relationship still pointing at stale data.
+    db.flush()
+    if 'tutor_id' in update_data:
+        db.expire(enrollment, ['tutor'])
+    enrollment_data = _build_enrollment_response(enrollment)
     enrollment_data.effective_end_date = calculate_effective_end_date(enrollment, db)
     enrollment_data.summer_unavailability_notes = bulk_load_summer_unavailability_notes(
         db, [enrollment]
@@ -2429,6 +2619,8 @@ async def update_enrollment(
     enrollment_data.total_fee = resolve_enrollment_total_fee(enrollment, db)
     enrollment_data.registration_fee = enrollment_registration_fee(enrollment, db)
 
+    db.commit()
+
     return enrollment_data
 
 
@@ -2483,14 +2675,7 @@ async def update_enrollment_extension(
     ).filter(Enrollment.id == enrollment_id).first()
 
     # Build response
-    enrollment_data = EnrollmentResponse.model_validate(enrollment)
-    enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-    enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-    enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-    enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-    enrollment_data.school = enrollment.student.school if enrollment.student else None
-    enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-    enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    enrollment_data = _build_enrollment_response(enrollment)
     enrollment_data.effective_end_date = calculate_effective_end_date(enrollment, db)
     enrollment_data.summer_unavailability_notes = bulk_load_summer_unavailability_notes(
         db, [enrollment]
@@ -2557,14 +2742,7 @@ async def set_discount_override(
         *enrollment_with_relations()
     ).filter(Enrollment.id == enrollment_id).first()
 
-    enrollment_data = EnrollmentResponse.model_validate(enrollment)
-    enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-    enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-    enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-    enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-    enrollment_data.school = enrollment.student.school if enrollment.student else None
-    enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-    enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    enrollment_data = _build_enrollment_response(enrollment)
     enrollment_data.effective_end_date = calculate_effective_end_date(enrollment, db)
     enrollment_data.summer_unavailability_notes = bulk_load_summer_unavailability_notes(
         db, [enrollment]
@@ -2613,14 +2791,7 @@ async def clear_discount_override(
         *enrollment_with_relations()
     ).filter(Enrollment.id == enrollment_id).first()
 
-    enrollment_data = EnrollmentResponse.model_validate(enrollment)
-    enrollment_data.student_name = enrollment.student.student_name if enrollment.student else None
-    enrollment_data.tutor_name = enrollment.tutor.tutor_name if enrollment.tutor else None
-    enrollment_data.discount_name = enrollment.discount.discount_name if enrollment.discount else None
-    enrollment_data.grade = enrollment.student.grade if enrollment.student else None
-    enrollment_data.school = enrollment.student.school if enrollment.student else None
-    enrollment_data.school_student_id = enrollment.student.school_student_id if enrollment.student else None
-    enrollment_data.lang_stream = enrollment.student.lang_stream if enrollment.student else None
+    enrollment_data = _build_enrollment_response(enrollment)
     enrollment_data.effective_end_date = calculate_effective_end_date(enrollment, db)
     enrollment_data.summer_unavailability_notes = bulk_load_summer_unavailability_notes(
         db, [enrollment]
@@ -4,13 +4,17 @@ Allows tutors to create dedicated revision slots linked to upcoming exams,
 schedule eligible students into these slots (consuming pending make-ups),
 and track enrollment.
 """
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from utils.query_helpers import session_with_relations
-from sqlalchemy import func, and_, or_
+import re
+import time
+from collections import defaultdict
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session, aliased, joinedload, load_only, raiseload, selectinload
+from sqlalchemy import Date, bindparam, case, exists, func, and_, or_, select, tuple_, union_all
 from sqlalchemy.exc import IntegrityError
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import date, datetime
 from database import get_db
 from models import (
@@ -35,123 +39,445 @@ from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from utils.response_builders import build_session_response as _build_session_response, batch_find_root_original_session_dates
 from utils.makeup_validators import validate_makeup_constraints, assert_not_holiday
-from constants import ENROLLED_SESSION_STATUSES, PENDING_MAKEUP_STATUSES, SCHEDULABLE_STATUSES, hk_now
+from constants import COMPLETED_STATUSES, ENROLLED_SESSION_STATUSES, PENDING_MAKEUP_STATUSES, SCHEDULABLE_STATUSES, SessionStatus, hk_now
 from services.google_calendar_service import sync_calendar_events
+from utils.cache_invalidation import invalidate_on_commit
 from auth.dependencies import get_current_user
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Largest page a client may ask for from the eligible-students lists. Paging
+# is opt-in: without a limit the whole list is returned.
+ELIGIBLE_STUDENTS_MAX_LIMIT = 500
+
+# Hashable copies of the shared status lists for per-row membership checks;
+# the list constants stay in use for SQL IN clauses.
+_COMPLETED_STATUS_SET = frozenset(COMPLETED_STATUSES)
+_PENDING_MAKEUP_STATUS_SET = frozenset(PENDING_MAKEUP_STATUSES)
+_SCHEDULABLE_STATUS_SET = frozenset(SCHEDULABLE_STATUSES)
+
+# Enrollment payment statuses that count as an active enrollment
+_ACTIVE_PAYMENT_STATUSES = ['Paid', 'Pending Payment']
+
+# Grades whose exams are matched on academic stream as well
+_STREAM_GRADES = frozenset({'F4', 'F5', 'F6'})
+
+# "X - Make-up Booked" -> "X - Pending Make-up", for reverting a consumed
+# session when its revision enrollment is removed
+_REVERT_STATUS = {
+    SessionStatus.RESCHEDULED_BOOKED.value: SessionStatus.RESCHEDULED_PENDING.value,
+    SessionStatus.SICK_LEAVE_BOOKED.value: SessionStatus.SICK_LEAVE_PENDING.value,
+    SessionStatus.WEATHER_BOOKED.value: SessionStatus.WEATHER_PENDING.value,
+}
+
+# Short-lived per-process cache for the slot list, eligible-student and exam
+# calendar views and the per-exam eligible counts behind them, which
+# dashboards reload often. Any committed ORM write to a table these views read
+# clears it, from whichever router (see utils.cache_invalidation). Raw SQL
+# edits and writes served by a different worker process show up once the
+# entry expires, i.e. within _EXAM_REVISION_CACHE_TTL seconds.
+_exam_revision_cache: dict[tuple, tuple[Any, float]] = {}
+_EXAM_REVISION_CACHE_TTL = 30  # seconds
+
+
+def _get_cached_exam_revision(cache_key: tuple) -> Optional[Any]:
+    """Cached value for cache_key, or None if absent or expired."""
+    entry = _exam_revision_cache.get(cache_key)
+    if entry is not None and time.time() < entry[1]:
+        return entry[0]
+    return None
+
+
+def _set_cached_exam_revision(cache_key: tuple, value: Any) -> None:
+    """Store value for cache_key and prune expired entries."""
+    now = time.time()
+    _exam_revision_cache[cache_key] = (value, now + _EXAM_REVISION_CACHE_TTL)
+    # Handlers run on the threadpool, so snapshot before pruning
+    for k, (_, exp) in list(_exam_revision_cache.items()):
+        if now >= exp:
+            _exam_revision_cache.pop(k, None)
+
+
+def clear_exam_revision_cache() -> None:
+    """Drop this process's cached slot, eligibility and calendar views."""
+    _exam_revision_cache.clear()
+
+
+invalidate_on_commit(
+    (ExamRevisionSlot, CalendarEvent, SessionLog, Student, Tutor, Enrollment),
+    clear_exam_revision_cache,
+)
 
-def _build_student_filters_from_event(calendar_event: CalendarEvent) -> list:
-    """Build SQLAlchemy filter conditions for students matching calendar event criteria."""
+
+@lru_cache(maxsize=512)
+def _build_student_filters_cached(
+    school: Optional[str],
+    grade: Optional[str],
+    academic_stream: Optional[str],
+) -> Tuple[Any, ...]:
+    """
+    Student filter conditions for one (school, grade, stream) combination.
+
+    Cached because the same handful of exam criteria are rebuilt on every
+    eligibility request. The expressions only compare against literal values,
+    so a cached tuple is safe to splat into any number of queries.
+    """
     filters = []
-    if calendar_event.school:
-        filters.append(Student.school == calendar_event.school)
-    if calendar_event.grade:
-        filters.append(Student.grade == calendar_event.grade)
+    if school:
+        filters.append(Student.school == school)
+    if grade:
+        filters.append(Student.grade == grade)
     # Academic stream matching for F4-F6
-    if calendar_event.academic_stream and calendar_event.grade in ['F4', 'F5', 'F6']:
-        filters.append(Student.academic_stream == calendar_event.academic_stream)
-    return filters
+    if academic_stream and grade in _STREAM_GRADES:
+        filters.append(Student.academic_stream == academic_stream)
+    return tuple(filters)
+
+
+def _build_student_filters_from_event(calendar_event: CalendarEvent) -> Tuple[Any, ...]:
+    """Build SQLAlchemy filter conditions for students matching calendar event criteria."""
+    return _build_student_filters_cached(
+        calendar_event.school, calendar_event.grade, calendar_event.academic_stream
+    )
 
 
 def _adopt_matching_sessions(
     db: Session,
     slot: ExamRevisionSlot,
-    calendar_event: CalendarEvent
+    calendar_event: CalendarEvent,
+    statuses: List[str] = ENROLLED_SESSION_STATUSES
 ) -> int:
     """
     Adopt unlinked sessions that match the slot's date/time/location and student criteria.
 
     This handles sessions created outside the webapp (e.g., via AppSheet) that weren't
-    auto-linked at creation time. Uses ENROLLED_SESSION_STATUSES to include attended sessions.
+    auto-linked at creation time. Uses ENROLLED_SESSION_STATUSES by default to include
+    attended sessions.
 
+    Issued as one bulk UPDATE without synchronizing the session; callers commit
+    straight after, which expires any stale in-memory SessionLog rows.
+    Events without any student criteria adopt nothing.
     Returns the count of adopted sessions.
     """
     student_filters = _build_student_filters_from_event(calendar_event)
+    if not student_filters:
+        # An event with no school/grade/stream would match every student in the cell
+        logger.warning(
+            "Skipping auto-adopt for revision slot %s: calendar event %s has no student criteria",
+            slot.id, calendar_event.id
+        )
+        return 0
 
-    unlinked_sessions = db.query(SessionLog).join(
-        Student, SessionLog.student_id == Student.id
-    ).filter(
+    return db.query(SessionLog).filter(
         SessionLog.session_date == slot.session_date,
         SessionLog.time_slot == slot.time_slot,
         SessionLog.location == slot.location,
-        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES),
+        SessionLog.session_status.in_(statuses),
         SessionLog.exam_revision_slot_id.is_(None),
-        *student_filters
-    ).all()
+        SessionLog.student_id.in_(db.query(Student.id).filter(*student_filters))
+    ).update(
+        {SessionLog.exam_revision_slot_id: slot.id}, synchronize_session=False
+    )
+
 
-    for session in unlinked_sessions:
-        session.exam_revision_slot_id = slot.id
+# Slot responses only show the tutor's name, so the joined tutor row is
+# trimmed to the columns needed to build it
+_SLOT_TUTOR_NAME = joinedload(ExamRevisionSlot.tutor).load_only(Tutor.id, Tutor.tutor_name)
+
+# Everything _build_session_response reads, for the sessions enroll_student
+# returns. Exercises are one-to-many, so they come from one WHERE IN query
+# rather than repeating each session row per exercise; the extension request
+# and enrollment would otherwise be lazy-loaded per session
+_ENROLL_RESPONSE_RELATIONS = (
+    joinedload(SessionLog.student),
+    joinedload(SessionLog.tutor),
+    selectinload(SessionLog.exercises),
+    joinedload(SessionLog.extension_request),
+    joinedload(SessionLog.enrollment),
+)
+
+# Student columns shown in eligible-student lists; candidates are selected as
+# plain rows of these rather than hydrating every column of the wide students table
+_ELIGIBLE_STUDENT_COLUMNS = (
+    Student.id,
+    Student.student_name,
+    Student.school_student_id,
+    Student.grade,
+    Student.school,
+    Student.lang_stream,
+    Student.academic_stream,
+    Student.home_location,
+)
+
+
+# SessionLog columns read from consumable sessions: the PendingSessionInfo
+# fields, the grouping and tutor keys, and make_up_for_id for root dates
+_PENDING_SESSION_COLUMNS = (
+    SessionLog.id,
+    SessionLog.student_id,
+    SessionLog.tutor_id,
+    SessionLog.session_date,
+    SessionLog.time_slot,
+    SessionLog.location,
+    SessionLog.session_status,
+    SessionLog.make_up_for_id,
+)
 
-    return len(unlinked_sessions)
+
+def _hk_today() -> date:
+    return hk_now().date()
+
+
+# Sessions that can be consumed for revision enrollment: pending make-ups (any
+# date, not already booked) or future scheduled/make-up sessions. Built once so
+# every query reuses the same expression (and compiled-statement cache entry).
+# Today's date is a required bind parameter: each query supplies the request's
+# date with .params(consumable_today=today), and one that forgets fails to run.
+_PENDING_MAKEUP_BRANCH = and_(
+    SessionLog.session_status.in_(PENDING_MAKEUP_STATUSES),
+    SessionLog.rescheduled_to_id.is_(None)
+)
+_FUTURE_SESSION_BRANCH = and_(
+    SessionLog.session_status.in_(SCHEDULABLE_STATUSES),
+    SessionLog.session_date > bindparam("consumable_today", type_=Date)
+)
+_CONSUMABLE_SESSION_FILTER = or_(_PENDING_MAKEUP_BRANCH, _FUTURE_SESSION_BRANCH)
 
 
-def _get_consumable_sessions_query(
+def _get_consumable_sessions_by_student(
     db: Session,
-    student_id: int,
+    student_ids: List[int],
     location: Optional[str] = None,
-    locations: Optional[List[str]] = None
-):
+    locations: Optional[List[str]] = None,
+    *,
+    today: date
+) -> Dict[int, List[SessionLog]]:
     """
-    Build query for sessions that can be consumed for revision enrollment.
-
-    Returns sessions that are either:
-    - Pending make-up sessions (any date, not already booked)
-    - Future scheduled/make-up sessions
+    Fetch sessions that can be consumed for revision enrollment for many students
+    in one query, grouped by student ID and ordered by session date.
 
     If both location and locations are None, returns sessions from all locations.
+    today: the request's date for the future-session check.
     """
-    query = db.query(SessionLog).options(
-        joinedload(SessionLog.tutor)
-    ).filter(
-        SessionLog.student_id == student_id,
-        or_(
-            and_(
-                SessionLog.session_status.in_(PENDING_MAKEUP_STATUSES),
-                SessionLog.rescheduled_to_id.is_(None)
-            ),
-            and_(
-                SessionLog.session_status.in_(SCHEDULABLE_STATUSES),
-                SessionLog.session_date > hk_now().date()
-            )
-        )
+    if not student_ids:
+        return {}
+
+    # One branch per kind of consumable session, combined with UNION ALL: each
+    # branch is a plain range on idx_session_log_consumable, where the OR of
+    # the two would leave the planner to merge or scan. The branches are
+    # disjoint (pending make-up vs scheduled statuses), so nothing repeats.
+    # Each branch selects only _PENDING_SESSION_COLUMNS, not the whole wide row.
+    def branch(condition):
+        stmt = select(*_PENDING_SESSION_COLUMNS).where(SessionLog.student_id.in_(student_ids), condition)
+        if locations:
+            stmt = stmt.where(SessionLog.location.in_(locations))
+        elif location:
+            stmt = stmt.where(SessionLog.location == location)
+        return stmt
+
+    consumable = union_all(
+        branch(_PENDING_MAKEUP_BRANCH), branch(_FUTURE_SESSION_BRANCH)
+    ).order_by("student_id", "session_date", "id")
+
+    # Only the tutor's name is read when building the lists. The handful of
+    # distinct tutors is fetched once by ID rather than repeated on every
+    # session row; any other column or relationship access would be a lazy
+    # load per session, so it raises instead
+    query = db.query(SessionLog).from_statement(consumable).options(
+        load_only(*_PENDING_SESSION_COLUMNS, raiseload=True),
+        selectinload(SessionLog.tutor).load_only(Tutor.id, Tutor.tutor_name),
+        raiseload('*')
+    ).params(consumable_today=today)
+
+    sessions_by_student: Dict[int, List[SessionLog]] = defaultdict(list)
+    for session in query:
+        sessions_by_student[session.student_id].append(session)
+    return sessions_by_student
+
+
+def _has_consumable_session(
+    db: Session,
+    location: Optional[str] = None,
+    locations: Optional[List[str]] = None
+):
+    """Correlated EXISTS: the outer Student has a consumable session (at the given location(s))."""
+    query = db.query(SessionLog.id).filter(
+        SessionLog.student_id == Student.id,
+        _CONSUMABLE_SESSION_FILTER
     )
     if locations:
         query = query.filter(SessionLog.location.in_(locations))
     elif location:
         query = query.filter(SessionLog.location == location)
-    return query
+    return query.exists()
+
+
+def _has_active_enrollment(
+    db: Session,
+    location: Optional[str] = None,
+    locations: Optional[List[str]] = None
+):
+    """
+    Correlated EXISTS: the outer Student has an active enrollment (at the given
+    location(s)). Unlike a join, it yields each student once, so candidate
+    queries need no DISTINCT before ordering and paging.
+    """
+    query = db.query(Enrollment.id).filter(
+        Enrollment.student_id == Student.id,
+        Enrollment.payment_status.in_(_ACTIVE_PAYMENT_STATUSES)
+    )
+    if locations:
+        query = query.filter(Enrollment.location.in_(locations))
+    elif location:
+        query = query.filter(Enrollment.location == location)
+    return query.exists()
+
 
+def _eligible_student_conditions(
+    db: Session,
+    location: Optional[str] = None,
+    locations: Optional[List[str]] = None
+) -> list:
+    """
+    The location-scoped half of revision eligibility, shared by both
+    eligible-student lists and the per-exam eligible counts: an active
+    enrollment and a consumable session (at the given location(s)).
 
-def _is_session_consumable(session: SessionLog) -> bool:
-    """Check if a session can be consumed for revision enrollment."""
-    is_pending = (
-        session.session_status in PENDING_MAKEUP_STATUSES and
-        session.rescheduled_to_id is None
+    Callers add the event's student criteria and their own enrolled-student
+    exclusion, and bind consumable_today once for the statement.
+    """
+    return [
+        _has_active_enrollment(db, location=location, locations=locations),
+        _has_consumable_session(db, location=location, locations=locations),
+    ]
+
+
+def _enrollment_tutor_name_column(
+    db: Session,
+    location: Optional[str] = None,
+    locations: Optional[List[str]] = None
+):
+    """
+    Correlated scalar column: tutor name of the outer Student's latest active
+    enrollment (at the given location(s)), so it rides along in the student query.
+    """
+    query = db.query(Tutor.tutor_name).join(
+        Enrollment, Enrollment.tutor_id == Tutor.id
+    ).filter(
+        Enrollment.student_id == Student.id,
+        Enrollment.payment_status.in_(_ACTIVE_PAYMENT_STATUSES)
     )
-    is_future = (
-        session.session_status in SCHEDULABLE_STATUSES and
-        session.session_date > hk_now().date()
+    if locations:
+        query = query.filter(Enrollment.location.in_(locations))
+    elif location:
+        query = query.filter(Enrollment.location == location)
+    return query.order_by(Enrollment.id.desc()).limit(1).correlate(Student).scalar_subquery().label(
+        "enrollment_tutor_name"
     )
-    return is_pending or is_future
 
 
+def _enrolled_count_column(db: Session):
+    """
+    Correlated scalar column: number of the outer ExamRevisionSlot's sessions in
+    an enrolled status, so slot listings need not load the sessions collection.
+    """
+    return db.query(func.count(SessionLog.id)).filter(
+        SessionLog.exam_revision_slot_id == ExamRevisionSlot.id,
+        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+    ).correlate(ExamRevisionSlot).scalar_subquery().label("enrolled_count")
+
+
+def _slot_list_etag(db: Session, filters: list) -> str:
+    """
+    Weak ETag for a slot list, from one aggregate query over the listed slots
+    rather than the built list.
+
+    Added or deleted slots move the count or MAX(id), edits move the slot's or
+    its calendar event's modification time, and enrolling or unenrolling moves
+    the enrolled count or newest enrolled session ID. A tutor rename is not
+    seen.
+    """
+    probe = db.query(
+        func.count(func.distinct(ExamRevisionSlot.id)),
+        func.max(ExamRevisionSlot.id),
+        func.max(ExamRevisionSlot.updated_at),
+        func.max(CalendarEvent.updated_at),
+        func.max(CalendarEvent.last_synced_at),
+        func.count(SessionLog.id),
+        func.max(SessionLog.id)
+    ).select_from(ExamRevisionSlot).join(
+        ExamRevisionSlot.calendar_event
+    ).outerjoin(SessionLog, and_(
+        SessionLog.exam_revision_slot_id == ExamRevisionSlot.id,
+        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+    )).filter(*filters).one()
+    digest = hashlib.blake2b(repr(tuple(probe)).encode(), digest_size=8)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag: "*", or any entry of its
+    comma-separated list under weak comparison (W/ prefixes ignored).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _page_eligible_students(query, limit: Optional[int], offset: int) -> tuple[list, int]:
+    """
+    Apply school-student-ID ordering and limit/offset to a candidate student query.
+
+    Returns (rows, total). With no limit, every row from offset on is
+    returned. The separate count query is skipped whenever the rows fetched
+    already reach the end of the list.
+    """
+    ordered = query.order_by(Student.school_student_id, Student.id).offset(offset)
+    if limit is None:
+        rows = ordered.all()
+        if offset == 0 or rows:
+            return rows, offset + len(rows)
+        return rows, query.count()
+    rows = ordered.limit(limit).all()
+    if offset == 0 and len(rows) < limit:
+        return rows, len(rows)
+    return rows, query.count()
+
+
+def _is_session_consumable(session: SessionLog, today: Optional[date] = None) -> bool:
+    """
+    Check if a session can be consumed for revision enrollment.
+
+    Python twin of _CONSUMABLE_SESSION_FILTER. Pass today when checking many
+    sessions so the clock is read once; it defaults to the current HK date.
+    """
+    if session.session_status in _PENDING_MAKEUP_STATUS_SET:
+        return session.rescheduled_to_id is None
+    if session.session_status in _SCHEDULABLE_STATUS_SET:
+        return session.session_date > (today or _hk_today())
+    return False
+
+
+_TIME_SLOT_RE = re.compile(r"\s*(\d+):(\d+)\s* - \s*(\d+):(\d+)\s*")
+
+
+@lru_cache(maxsize=1024)
 def _parse_time_slot(time_slot: str) -> tuple[int, int]:
     """
     Parse a time slot string like "16:45 - 18:15" into start and end minutes from midnight.
-    Returns (start_minutes, end_minutes).
+    Returns (start_minutes, end_minutes), or (0, 0) if the string is malformed.
+
+    Cached because overlap checks compare the same few slot strings over and over.
     """
-    try:
-        parts = time_slot.split(' - ')
-        if len(parts) != 2:
-            return (0, 0)
-        start_h, start_m = map(int, parts[0].strip().split(':'))
-        end_h, end_m = map(int, parts[1].strip().split(':'))
-        return (start_h * 60 + start_m, end_h * 60 + end_m)
-    except (ValueError, IndexError):
+    match = _TIME_SLOT_RE.fullmatch(time_slot)
+    if not match:
         return (0, 0)
+    start_h, start_m, end_h, end_m = map(int, match.groups())
+    return (start_h * 60 + start_m, end_h * 60 + end_m)
 
 
 def _times_overlap(slot1: str, slot2: str) -> bool:
@@ -165,13 +491,29 @@ def _times_overlap(slot1: str, slot2: str) -> bool:
     return start1 < end2 and start2 < end1
 
 
-def _build_slot_response(
-    slot: ExamRevisionSlot,
-    enrolled_count: int = 0,
-    warning: Optional[str] = None
-) -> ExamRevisionSlotResponse:
-    """Build an ExamRevisionSlotResponse from an ExamRevisionSlot."""
-    return ExamRevisionSlotResponse(
+def _overlapping(time_slot: str, items: list) -> list:
+    """
+    Items (anything with a time_slot) whose time overlaps time_slot, in input order.
+
+    Shared by the slot-overlap and tutor-conflict checks. The target is parsed
+    once and the candidates are a single day's slots or sessions, so one
+    linear pass beats sorting them into an interval index.
+    """
+    start, end = _parse_time_slot(time_slot)
+    # If parsing failed, assume no overlap
+    if (start, end) == (0, 0):
+        return []
+    overlapping = []
+    for item in items:
+        other_start, other_end = _parse_time_slot(item.time_slot)
+        if (other_start, other_end) != (0, 0) and start < other_end and other_start < end:
+            overlapping.append(item)
+    return overlapping
+
+
+def _slot_response_fields(slot: ExamRevisionSlot) -> Dict[str, Any]:
+    """Response fields read from an ExamRevisionSlot, shared by the list and detail views."""
+    return dict(
         id=slot.id,
         calendar_event_id=slot.calendar_event_id,
         session_date=slot.session_date,
@@ -182,59 +524,116 @@ def _build_slot_response(
         notes=slot.notes,
         created_at=slot.created_at,
         created_by=slot.created_by,
-        enrolled_count=enrolled_count,
         calendar_event=CalendarEventResponse.model_validate(slot.calendar_event) if slot.calendar_event else None,
+    )
+
+
+def _build_slot_response(
+    slot: ExamRevisionSlot,
+    enrolled_count: int = 0,
+    warning: Optional[str] = None
+) -> ExamRevisionSlotResponse:
+    """Build an ExamRevisionSlotResponse from an ExamRevisionSlot."""
+    return ExamRevisionSlotResponse(
+        **_slot_response_fields(slot),
+        enrolled_count=enrolled_count,
         warning=warning
     )
 
 
-def _check_past_deadline(
+def _build_eligible_student(
+    student: Any,
+    pending_sessions: List[SessionLog],
+    root_dates: Dict[int, date],
+    is_past_deadline: bool = False
+) -> EligibleStudentResponse:
+    """
+    Build an EligibleStudentResponse from a candidate row (the
+    _ELIGIBLE_STUDENT_COLUMNS plus enrollment_tutor_name) and its sessions.
+
+    Uses model_construct: every value comes straight from validated database
+    columns, and these lists can run to hundreds of students.
+    """
+    return EligibleStudentResponse.model_construct(
+        student_id=student.id,
+        student_name=student.student_name,
+        school_student_id=student.school_student_id,
+        grade=student.grade,
+        school=student.school,
+        lang_stream=student.lang_stream,
+        academic_stream=student.academic_stream,
+        home_location=student.home_location,
+        enrollment_tutor_name=student.enrollment_tutor_name,
+        is_past_deadline=is_past_deadline,
+        pending_sessions=[
+            PendingSessionInfo.model_construct(
+                id=s.id,
+                session_date=s.session_date,
+                time_slot=s.time_slot,
+                session_status=s.session_status,
+                tutor_name=s.tutor.tutor_name if s.tutor else None,
+                location=s.location,
+                root_original_session_date=root_dates.get(s.id),
+            )
+            for s in pending_sessions
+        ]
+    )
+
+
+def _check_past_deadlines(
     db: Session,
-    student_id: int,
+    student_ids: List[int],
     target_date: date,
     target_time_slot: str,
-) -> bool:
+) -> set:
     """
-    Check if the target date/time falls on the student's regular slot
-    past their enrollment end date.
+    Return the IDs of students for whom the target date/time falls on their
+    regular slot past their enrollment end date.
+
+    Every student's current regular enrollment is fetched in one query; the
+    end date is only computed for those whose regular slot matches.
     """
-    current_enrollment = db.query(Enrollment).filter(
-        Enrollment.student_id == student_id,
+    if not student_ids:
+        return set()
+
+    current_enrollments: Dict[int, Enrollment] = {}
+    for enrollment in db.query(Enrollment).filter(
+        Enrollment.student_id.in_(student_ids),
         Enrollment.enrollment_type == 'Regular',
         Enrollment.payment_status != "Cancelled"
-    ).order_by(Enrollment.first_lesson_date.desc()).first()
-
-    if not current_enrollment or not current_enrollment.assigned_day or not current_enrollment.assigned_time:
-        return False
+    ).order_by(Enrollment.student_id, Enrollment.first_lesson_date.desc()):
+        current_enrollments.setdefault(enrollment.student_id, enrollment)
 
     proposed_day = target_date.strftime('%a')
-    is_regular_slot = (
-        proposed_day == current_enrollment.assigned_day and
-        target_time_slot == current_enrollment.assigned_time
-    )
+    past_deadline = set()
+    for student_id, current_enrollment in current_enrollments.items():
+        is_regular_slot = (
+            proposed_day == current_enrollment.assigned_day and
+            target_time_slot == current_enrollment.assigned_time
+        )
+        if not is_regular_slot or not current_enrollment.first_lesson_date or not current_enrollment.lessons_paid:
+            continue
 
-    if not is_regular_slot or not current_enrollment.first_lesson_date or not current_enrollment.lessons_paid:
-        return False
+        try:
+            effective_end_result = db.execute(text("""
+                SELECT calculate_effective_end_date(
+                    :first_lesson_date,
+                    :lessons_paid,
+                    COALESCE(:extension_weeks, 0)
+                ) as effective_end_date
+            """), {
+                "first_lesson_date": current_enrollment.first_lesson_date,
+                "lessons_paid": current_enrollment.lessons_paid,
+                "extension_weeks": current_enrollment.deadline_extension_weeks or 0
+            }).fetchone()
 
-    try:
-        effective_end_result = db.execute(text("""
-            SELECT calculate_effective_end_date(
-                :first_lesson_date,
-                :lessons_paid,
-                COALESCE(:extension_weeks, 0)
-            ) as effective_end_date
-        """), {
-            "first_lesson_date": current_enrollment.first_lesson_date,
-            "lessons_paid": current_enrollment.lessons_paid,
-            "extension_weeks": current_enrollment.deadline_extension_weeks or 0
-        }).fetchone()
-
-        if effective_end_result and effective_end_result.effective_end_date:
-            return target_date > effective_end_result.effective_end_date
-    except SQLAlchemyError as e:
-        logger.warning(f"Could not check enrollment deadline: {e}")
+            if effective_end_result and effective_end_result.effective_end_date:
+                if target_date > effective_end_result.effective_end_date:
+                    past_deadline.add(student_id)
+        except SQLAlchemyError as e:
+            logger.warning("Could not check enrollment deadline: %s", e)
 
-    return False
+    return past_deadline
 
 
 def _check_tutor_conflicts(
@@ -247,35 +646,83 @@ def _check_tutor_conflicts(
     Check if the tutor has regular sessions that conflict with the given date/time.
     Returns a list of conflicting session details.
     """
-    # Query regular sessions (not revision slots) for this tutor on this date
-    conflicting_sessions = db.query(SessionLog).options(
-        joinedload(SessionLog.student)
+    # Query regular sessions (not revision slots) for this tutor on this date.
+    # Only the columns the conflict summary needs are fetched; the overlap test
+    # stays in Python because time_slot is free text ("9:00 - 10:30" and
+    # "09:00 - 10:30" both occur), which SQL cannot compare reliably.
+    conflicting_sessions = db.query(
+        SessionLog.id,
+        SessionLog.time_slot,
+        SessionLog.session_status,
+        Student.student_name,
+    ).outerjoin(
+        Student, SessionLog.student_id == Student.id
     ).filter(
         SessionLog.tutor_id == tutor_id,
         SessionLog.session_date == session_date,
         SessionLog.exam_revision_slot_id.is_(None),  # Regular sessions only
-        SessionLog.session_status.in_(['Scheduled', 'Make-up Class', 'Rescheduled'])
+        SessionLog.session_status.in_(['Scheduled', 'Make-up Class', 'Rescheduled']),
+        SessionLog.time_slot.isnot(None)
     ).all()
 
-    conflicts = []
-    for session in conflicting_sessions:
-        if session.time_slot and _times_overlap(time_slot, session.time_slot):
-            conflicts.append({
-                "session_id": session.id,
-                "student_name": session.student.student_name if session.student else "Unknown",
-                "time_slot": session.time_slot,
-                "status": session.session_status,
-            })
-
-    return conflicts
+    return [
+        {
+            "session_id": session.id,
+            "student_name": session.student_name or "Unknown",
+            "time_slot": session.time_slot,
+            "status": session.session_status,
+        }
+        for session in _overlapping(time_slot, conflicting_sessions)
+    ]
 
 
 # ============================================
 # Revision Slot CRUD Endpoints
 # ============================================
 
+def _slot_list_filters(
+    calendar_event_id: Optional[int],
+    tutor_id: Optional[int],
+    location: Optional[str],
+    from_date: Optional[date],
+    to_date: Optional[date]
+) -> list:
+    """Filter conditions for get_revision_slots, shared by the list and its ETag."""
+    filters = []
+    if calendar_event_id:
+        filters.append(ExamRevisionSlot.calendar_event_id == calendar_event_id)
+    if tutor_id:
+        filters.append(ExamRevisionSlot.tutor_id == tutor_id)
+    if location:
+        filters.append(ExamRevisionSlot.location == location)
+    if from_date:
+        filters.append(ExamRevisionSlot.session_date >= from_date)
+    if to_date:
+        filters.append(ExamRevisionSlot.session_date <= to_date)
+    return filters
+
+
+def _query_revision_slots(db: Session, filters: list) -> List[ExamRevisionSlotResponse]:
+    """Slot responses for get_revision_slots, ordered by date and time."""
+    # Enrolled counts come back as a column alongside each slot; any other
+    # relationship read while building responses would be a lazy load per
+    # slot, so it raises instead
+    query = db.query(ExamRevisionSlot, _enrolled_count_column(db)).options(
+        joinedload(ExamRevisionSlot.calendar_event),
+        _SLOT_TUTOR_NAME,
+        raiseload('*')
+    ).filter(*filters).order_by(ExamRevisionSlot.session_date, ExamRevisionSlot.time_slot)
+
+    return [
+        _build_slot_response(slot, enrolled_count)
+        for slot, enrolled_count in query.all()
+    ]
+
+
 @router.get("/exam-revision/slots", response_model=List[ExamRevisionSlotResponse])
-async def get_revision_slots(
+def get_revision_slots(
+    request: Request,
+    response: Response,
     calendar_event_id: Optional[int] = Query(None, description="Filter by calendar event (exam) ID"),
     tutor_id: Optional[int] = Query(None, description="Filter by tutor ID"),
     location: Optional[str] = Query(None, description="Filter by location"),
@@ -285,41 +732,33 @@ async def get_revision_slots(
 ):
     """
     Get list of revision slots with optional filters.
-    """
-    query = db.query(ExamRevisionSlot).options(
-        joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.tutor),
-        joinedload(ExamRevisionSlot.sessions)
-    )
-
-    if calendar_event_id:
-        query = query.filter(ExamRevisionSlot.calendar_event_id == calendar_event_id)
-    if tutor_id:
-        query = query.filter(ExamRevisionSlot.tutor_id == tutor_id)
-    if location:
-        query = query.filter(ExamRevisionSlot.location == location)
-    if from_date:
-        query = query.filter(ExamRevisionSlot.session_date >= from_date)
-    if to_date:
-        query = query.filter(ExamRevisionSlot.session_date <= to_date)
-
-    query = query.order_by(ExamRevisionSlot.session_date, ExamRevisionSlot.time_slot)
-    slots = query.all()
-
-    result = []
-    for slot in slots:
-        # Count enrolled sessions (those with active statuses)
-        enrolled_count = len([
-            s for s in slot.sessions
-            if s.session_status in ENROLLED_SESSION_STATUSES
-        ])
-        result.append(_build_slot_response(slot, enrolled_count))
 
+    The list is cached (see _exam_revision_cache) with an ETag; a
+    request whose If-None-Match matches gets 304 Not Modified, checked
+    against the ETag probe before the list itself is built.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    cache_key = ("slots", calendar_event_id, tutor_id, location, from_date, to_date)
+    cached = _get_cached_exam_revision(cache_key)
+    if cached is None:
+        filters = _slot_list_filters(calendar_event_id, tutor_id, location, from_date, to_date)
+        # Probe first: a write landing between the two queries then leaves
+        # the newer list under the older ETag, never the reverse
+        etag = _slot_list_etag(db, filters)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        cached = (_query_revision_slots(db, filters), etag)
+        _set_cached_exam_revision(cache_key, cached)
+
+    result, etag = cached
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return result
 
 
 @router.post("/exam-revision/slots", response_model=ExamRevisionSlotResponse)
-async def create_revision_slot(
+def create_revision_slot(
     request: ExamRevisionSlotCreate,
     current_user: Tutor = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -327,31 +766,37 @@ async def create_revision_slot(
     """
     Create a new revision slot for an exam.
     """
-    # Verify calendar event exists
-    calendar_event = db.query(CalendarEvent).filter(
-        CalendarEvent.id == request.calendar_event_id
-    ).first()
-    if not calendar_event:
-        raise HTTPException(status_code=404, detail=f"Calendar event with ID {request.calendar_event_id} not found")
-
-    # Verify tutor exists
-    tutor = db.query(Tutor).filter(Tutor.id == request.tutor_id).first()
-    if not tutor:
+    # Verify the calendar event and tutor exist, fetching both in one query;
+    # only a miss needs a second look to report which one is absent
+    row = db.query(CalendarEvent, Tutor).join(
+        Tutor, Tutor.id == request.tutor_id
+    ).filter(CalendarEvent.id == request.calendar_event_id).first()
+    if not row:
+        if not db.query(exists().where(CalendarEvent.id == request.calendar_event_id)).scalar():
+            raise HTTPException(status_code=404, detail=f"Calendar event with ID {request.calendar_event_id} not found")
         raise HTTPException(status_code=404, detail=f"Tutor with ID {request.tutor_id} not found")
+    calendar_event, tutor = row
 
     # Holiday check — only Admin / Super Admin can create a revision slot on a holiday
     is_admin = current_user.role in ("Super Admin", "Admin")
     assert_not_holiday(db, request.session_date, is_admin=is_admin)
 
-    # Check for duplicate slot
-    existing = db.query(ExamRevisionSlot).filter(
+    # The exam's other slots on this date (a handful at most) serve both the
+    # duplicate and the overlap check
+    same_day_slots = db.query(ExamRevisionSlot).options(
+        _SLOT_TUTOR_NAME
+    ).filter(
         ExamRevisionSlot.calendar_event_id == request.calendar_event_id,
-        ExamRevisionSlot.session_date == request.session_date,
-        ExamRevisionSlot.time_slot == request.time_slot,
-        ExamRevisionSlot.tutor_id == request.tutor_id,
-        ExamRevisionSlot.location == request.location
-    ).first()
-    if existing:
+        ExamRevisionSlot.session_date == request.session_date
+    ).all()
+
+    # Check for duplicate slot
+    if any(
+        s.time_slot == request.time_slot
+        and s.tutor_id == request.tutor_id
+        and s.location == request.location
+        for s in same_day_slots
+    ):
         raise HTTPException(
             status_code=400,
             detail="A revision slot with these details already exists"
@@ -359,12 +804,9 @@ async def create_revision_slot(
 
     # Check for overlapping slots (same date/location, overlapping time)
     overlap_warning = None
-    other_slots = db.query(ExamRevisionSlot).filter(
-        ExamRevisionSlot.calendar_event_id == request.calendar_event_id,
-        ExamRevisionSlot.session_date == request.session_date,
-        ExamRevisionSlot.location == request.location
-    ).all()
-    overlapping = [s for s in other_slots if _times_overlap(request.time_slot, s.time_slot)]
+    overlapping = _overlapping(
+        request.time_slot, [s for s in same_day_slots if s.location == request.location]
+    )
     if overlapping:
         overlap_info = ", ".join([f"{s.time_slot} ({s.tutor.tutor_name if s.tutor else 'Unknown'})" for s in overlapping])
         overlap_warning = f"Overlapping slot(s) at same location: {overlap_info}"
@@ -379,37 +821,46 @@ async def create_revision_slot(
         else:
             overlap_warning = conflict_warning
 
-    # Create the slot
+    # Create the slot. The event and tutor fetched above are attached directly
+    # and created_at is set here, so after the flush every field the response
+    # reads is already in memory.
     slot = ExamRevisionSlot(
-        calendar_event_id=request.calendar_event_id,
+        calendar_event=calendar_event,
         session_date=request.session_date,
         time_slot=request.time_slot,
-        tutor_id=request.tutor_id,
+        tutor=tutor,
         location=request.location,
         notes=request.notes,
+        created_at=hk_now(),
         created_by=request.created_by or current_user.user_email
     )
     db.add(slot)
-    db.commit()
-    db.refresh(slot)
+    try:
+        db.flush()
+    except IntegrityError:
+        # unique_revision_slot compares with the column collation, which can
+        # catch a duplicate the exact-match check above let through
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="A revision slot with these details already exists"
+        )
 
-    # Auto-adopt existing matching sessions (uses ENROLLED_SESSION_STATUSES to include attended)
+    # Auto-adopt existing matching sessions (uses ENROLLED_SESSION_STATUSES to include attended).
+    # Done before committing so the slot and calendar event are still loaded
+    # and both writes land in one transaction.
     adopted_count = _adopt_matching_sessions(db, slot, calendar_event)
+    # Built before the commit expires the slot, so it needs no reload
+    result = _build_slot_response(slot, adopted_count, overlap_warning)
+    db.commit()
     if adopted_count > 0:
-        db.commit()
-        logger.info(f"Auto-adopted {adopted_count} existing sessions into revision slot {slot.id}")
-
-    # Load relationships
-    slot = db.query(ExamRevisionSlot).options(
-        joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.tutor)
-    ).filter(ExamRevisionSlot.id == slot.id).first()
+        logger.info("Auto-adopted %s existing sessions into revision slot %s", adopted_count, result.id)
 
-    return _build_slot_response(slot, adopted_count, overlap_warning)
+    return result
 
 
 @router.get("/exam-revision/slots/{slot_id}", response_model=ExamRevisionSlotDetailResponse)
-async def get_revision_slot_detail(
+def get_revision_slot_detail(
     slot_id: int,
     db: Session = Depends(get_db)
 ):
@@ -421,64 +872,59 @@ async def get_revision_slot_detail(
     """
     slot = db.query(ExamRevisionSlot).options(
         joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.tutor),
+        _SLOT_TUTOR_NAME,
+        raiseload('*'),
     ).filter(ExamRevisionSlot.id == slot_id).first()
 
     if not slot:
         raise HTTPException(status_code=404, detail=f"Revision slot with ID {slot_id} not found")
 
     # Auto-adopt any unlinked sessions that match this slot's criteria
-    # This handles sessions created outside the webapp (e.g., via AppSheet)
+    # This handles sessions created outside the webapp (e.g., via AppSheet).
+    # The commit waits until the response is built, so the slot loaded above
+    # is never expired and reloaded; the enrolled-student query below already
+    # sees the adopted rows within the same transaction.
+    adopted_count = 0
     if slot.calendar_event:
         adopted_count = _adopt_matching_sessions(db, slot, slot.calendar_event)
-        if adopted_count > 0:
-            db.commit()
-            logger.info(f"Auto-adopted {adopted_count} sessions into revision slot {slot_id} on view")
 
-    # Reload with sessions relationship for building the response
-    slot = db.query(ExamRevisionSlot).options(
-        joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.tutor),
-        joinedload(ExamRevisionSlot.sessions).joinedload(SessionLog.student)
-    ).filter(ExamRevisionSlot.id == slot_id).first()
+    # Enrolled students as flat labelled rows named after the EnrolledStudentInfo
+    # fields, so each row maps straight onto the model without re-validation
+    enrolled_rows = db.query(
+        SessionLog.id.label("session_id"),
+        SessionLog.student_id,
+        func.coalesce(Student.student_name, "Unknown").label("student_name"),
+        Student.school_student_id,
+        Student.grade,
+        Student.school,
+        Student.lang_stream,
+        Student.academic_stream,
+        Student.home_location,
+        SessionLog.session_status,
+        SessionLog.make_up_for_id.label("consumed_session_id"),
+    ).outerjoin(
+        Student, SessionLog.student_id == Student.id
+    ).filter(
+        SessionLog.exam_revision_slot_id == slot_id,
+        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+    ).order_by(SessionLog.id).all()
+    enrolled_students = [EnrolledStudentInfo.model_construct(**row._mapping) for row in enrolled_rows]
 
-    # Build enrolled students list
-    enrolled_students = []
-    for session in slot.sessions:
-        if session.session_status in ENROLLED_SESSION_STATUSES:
-            enrolled_students.append(EnrolledStudentInfo(
-                session_id=session.id,
-                student_id=session.student_id,
-                student_name=session.student.student_name if session.student else "Unknown",
-                school_student_id=session.student.school_student_id if session.student else None,
-                grade=session.student.grade if session.student else None,
-                school=session.student.school if session.student else None,
-                lang_stream=session.student.lang_stream if session.student else None,
-                academic_stream=session.student.academic_stream if session.student else None,
-                home_location=session.student.home_location if session.student else None,
-                session_status=session.session_status,
-                consumed_session_id=session.make_up_for_id
-            ))
-
-    return ExamRevisionSlotDetailResponse(
-        id=slot.id,
-        calendar_event_id=slot.calendar_event_id,
-        session_date=slot.session_date,
-        time_slot=slot.time_slot,
-        tutor_id=slot.tutor_id,
-        tutor_name=slot.tutor.tutor_name if slot.tutor else None,
-        location=slot.location,
-        notes=slot.notes,
-        created_at=slot.created_at,
-        created_by=slot.created_by,
+    result = ExamRevisionSlotDetailResponse(
+        **_slot_response_fields(slot),
         enrolled_count=len(enrolled_students),
-        calendar_event=CalendarEventResponse.model_validate(slot.calendar_event) if slot.calendar_event else None,
         enrolled_students=enrolled_students
     )
 
+    if adopted_count > 0:
+        db.commit()
+        logger.info("Auto-adopted %s sessions into revision slot %s on view", adopted_count, slot_id)
+
+    return result
+
 
 @router.post("/exam-revision/slots/{slot_id}/sync")
-async def sync_revision_slot(
+def sync_revision_slot(
     slot_id: int,
     db: Session = Depends(get_db)
 ):
@@ -504,7 +950,7 @@ async def sync_revision_slot(
 
     if adopted_count > 0:
         db.commit()
-        logger.info(f"Sync adopted {adopted_count} sessions into revision slot {slot_id}")
+        logger.info("Sync adopted %s sessions into revision slot %s", adopted_count, slot_id)
 
     return {
         "adopted_count": adopted_count,
@@ -513,7 +959,7 @@ async def sync_revision_slot(
 
 
 @router.patch("/exam-revision/slots/{slot_id}", response_model=ExamRevisionSlotResponse)
-async def update_revision_slot(
+def update_revision_slot(
     slot_id: int,
     update: ExamRevisionSlotUpdate,
     db: Session = Depends(get_db),
@@ -526,53 +972,54 @@ async def update_revision_slot(
     Tutor and notes can always be updated.
     """
     slot = db.query(ExamRevisionSlot).options(
-        joinedload(ExamRevisionSlot.sessions),
-        joinedload(ExamRevisionSlot.tutor),
+        _SLOT_TUTOR_NAME,
         joinedload(ExamRevisionSlot.calendar_event)
     ).filter(ExamRevisionSlot.id == slot_id).first()
 
     if not slot:
         raise HTTPException(status_code=404, detail=f"Revision slot with ID {slot_id} not found")
 
-    # Check for enrolled students
-    enrolled_count = len([
-        s for s in slot.sessions
-        if s.session_status in ENROLLED_SESSION_STATUSES
-    ])
+    # Only fields that are set and differ from the stored values drive the
+    # checks below; a notes-only edit skips every re-query
+    changes = {
+        field: value
+        for field, value in update.model_dump(exclude_unset=True, exclude={"notes", "modified_by"}).items()
+        if value is not None and getattr(slot, field) != value
+    }
 
     # Restrict date/time/location changes if students are enrolled
-    restricted_fields_changed = any([
-        update.session_date is not None and update.session_date != slot.session_date,
-        update.time_slot is not None and update.time_slot != slot.time_slot,
-        update.location is not None and update.location != slot.location
-    ])
-
-    if enrolled_count > 0 and restricted_fields_changed:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot change date, time, or location when {enrolled_count} student(s) are enrolled. Remove enrollments first."
-        )
+    if changes.keys() & {"session_date", "time_slot", "location"}:
+        enrolled_count = db.query(func.count(SessionLog.id)).filter(
+            SessionLog.exam_revision_slot_id == slot_id,
+            SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+        ).scalar()
+        if enrolled_count > 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot change date, time, or location when {enrolled_count} student(s) are enrolled. Remove enrollments first."
+            )
 
     # Validate tutor if changing
-    if update.tutor_id is not None:
+    if "tutor_id" in changes:
         tutor = db.query(Tutor).filter(Tutor.id == update.tutor_id).first()
         if not tutor:
             raise HTTPException(status_code=404, detail=f"Tutor with ID {update.tutor_id} not found")
 
-    # Check for duplicates if changing key fields
-    if any([update.session_date, update.time_slot, update.tutor_id, update.location]):
-        check_date = update.session_date if update.session_date else slot.session_date
-        check_time = update.time_slot if update.time_slot else slot.time_slot
-        check_tutor = update.tutor_id if update.tutor_id else slot.tutor_id
-        check_location = update.location if update.location else slot.location
+    # Final values for the duplicate and conflict checks
+    final_date = changes.get("session_date", slot.session_date)
+    final_time = changes.get("time_slot", slot.time_slot)
+    final_tutor = changes.get("tutor_id", slot.tutor_id)
+    final_location = changes.get("location", slot.location)
 
+    # Check for duplicates if changing key fields
+    if changes:
         existing = db.query(ExamRevisionSlot).filter(
             ExamRevisionSlot.id != slot_id,
             ExamRevisionSlot.calendar_event_id == slot.calendar_event_id,
-            ExamRevisionSlot.session_date == check_date,
-            ExamRevisionSlot.time_slot == check_time,
-            ExamRevisionSlot.tutor_id == check_tutor,
-            ExamRevisionSlot.location == check_location
+            ExamRevisionSlot.session_date == final_date,
+            ExamRevisionSlot.time_slot == final_time,
+            ExamRevisionSlot.tutor_id == final_tutor,
+            ExamRevisionSlot.location == final_location
         ).first()
         if existing:
             raise HTTPException(
@@ -580,17 +1027,13 @@ async def update_revision_slot(
                 detail="A revision slot with these details already exists"
             )
 
-    # Compute final values for conflict checking
-    final_date = update.session_date if update.session_date else slot.session_date
-    final_time = update.time_slot if update.time_slot else slot.time_slot
-    final_tutor = update.tutor_id if update.tutor_id else slot.tutor_id
-
     # Check for tutor conflicts with regular sessions
     warning = None
-    tutor_conflicts = _check_tutor_conflicts(db, final_tutor, final_date, final_time)
-    if tutor_conflicts:
-        conflict_info = ", ".join([f"{c['student_name']} ({c['time_slot']})" for c in tutor_conflicts])
-        warning = f"Tutor has {len(tutor_conflicts)} conflicting session(s): {conflict_info}"
+    if changes.keys() & {"session_date", "time_slot", "tutor_id"}:
+        tutor_conflicts = _check_tutor_conflicts(db, final_tutor, final_date, final_time)
+        if tutor_conflicts:
+            conflict_info = ", ".join([f"{c['student_name']} ({c['time_slot']})" for c in tutor_conflicts])
+            warning = f"Tutor has {len(tutor_conflicts)} conflicting session(s): {conflict_info}"
 
     # Apply updates
     if update.session_date is not None:
@@ -604,46 +1047,31 @@ async def update_revision_slot(
     if update.notes is not None:
         slot.notes = update.notes if update.notes.strip() else None
 
-    db.commit()
-    db.refresh(slot)
+    db.flush()
 
-    # Auto-adopt existing sessions if date/time/location changed
+    # Auto-adopt existing sessions if date/time/location changed. Runs in the
+    # same transaction as the update, before the commit expires the slot.
     adopted_count = 0
-    if any([update.session_date, update.time_slot, update.location]):
-        calendar_event = slot.calendar_event
-        student_filters = _build_student_filters_from_event(calendar_event)
+    if changes.keys() & {"session_date", "time_slot", "location"}:
+        adopted_count = _adopt_matching_sessions(
+            db, slot, slot.calendar_event, statuses=SCHEDULABLE_STATUSES
+        )
 
-        existing_sessions = db.query(SessionLog).join(
-            Student, SessionLog.student_id == Student.id
-        ).filter(
-            SessionLog.session_date == slot.session_date,
-            SessionLog.time_slot == slot.time_slot,
-            SessionLog.location == slot.location,
-            SessionLog.session_status.in_(SCHEDULABLE_STATUSES),
-            SessionLog.exam_revision_slot_id.is_(None),
-            *student_filters
-        ).all()
-
-        for session in existing_sessions:
-            session.exam_revision_slot_id = slot.id
-            adopted_count += 1
-
-        if adopted_count > 0:
-            db.commit()
-            logger.info(f"Auto-adopted {adopted_count} existing sessions into revision slot {slot.id} after update")
-
-    # Reload with relationships
+    db.commit()
+    if adopted_count > 0:
+        logger.info("Auto-adopted %s existing sessions into revision slot %s after update", adopted_count, slot_id)
+
+    # Reload with relationships (the response only needs the to-one relations)
     slot = db.query(ExamRevisionSlot).options(
         joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.tutor),
-        joinedload(ExamRevisionSlot.sessions)
+        _SLOT_TUTOR_NAME
     ).filter(ExamRevisionSlot.id == slot_id).first()
 
     return _build_slot_response(slot, adopted_count, warning)
 
 
 @router.delete("/exam-revision/slots/{slot_id}")
-async def delete_revision_slot(
+def delete_revision_slot(
     slot_id: int,
     force: bool = Query(False, description="Force delete: unenroll all students first"),
     db: Session = Depends(get_db),
@@ -655,50 +1083,73 @@ async def delete_revision_slot(
     By default, can only delete empty slots (no enrolled students).
     With force=true, will unenroll all students (reverting their sessions) then delete.
     """
-    slot = db.query(ExamRevisionSlot).options(
-        joinedload(ExamRevisionSlot.sessions)
-    ).filter(ExamRevisionSlot.id == slot_id).first()
+    slot_exists = db.query(
+        exists().where(ExamRevisionSlot.id == slot_id)
+    ).scalar()
 
-    if not slot:
+    if not slot_exists:
         raise HTTPException(status_code=404, detail=f"Revision slot with ID {slot_id} not found")
 
-    # Check for enrolled students
-    enrolled = [
-        s for s in slot.sessions
-        if s.session_status in ENROLLED_SESSION_STATUSES
-    ]
+    # Enrolled students (other linked sessions, e.g. cancelled, are only
+    # unlinked below and never need loading)
+    enrolled_filters = (
+        SessionLog.exam_revision_slot_id == slot_id,
+        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES),
+    )
 
-    if enrolled and not force:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot delete slot with {len(enrolled)} enrolled student(s). Use force=true to unenroll and delete."
-        )
+    if not force:
+        # Refusing only needs the number, not the session rows
+        enrolled_count = db.query(func.count(SessionLog.id)).filter(*enrolled_filters).scalar()
+        if enrolled_count:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot delete slot with {enrolled_count} enrolled student(s). Use force=true to unenroll and delete."
+            )
+        enrolled = []
+    else:
+        enrolled = db.query(SessionLog).filter(*enrolled_filters).all()
 
     # Force delete: unenroll all students first
     unenrolled_count = 0
-    if enrolled and force:
-        for session in enrolled:
-            # Skip already attended sessions
-            if session.session_status in ['Attended', 'Attended (Make-up)']:
+    if enrolled:
+        # One pass picks the sessions to unenroll (skipping already attended
+        # ones) and the sessions they consumed
+        to_unenroll = []
+        consumed_ids = []
+        for s in enrolled:
+            if s.session_status in _COMPLETED_STATUS_SET:
                 continue
-
-            # Revert the consumed session if it exists
-            if session.make_up_for_id:
-                consumed_session = db.query(SessionLog).filter(
-                    SessionLog.id == session.make_up_for_id
-                ).first()
-                if consumed_session:
-                    # Revert status from "Make-up Booked" to "Pending Make-up"
-                    consumed_session.session_status = consumed_session.session_status.replace(
-                        "Make-up Booked", "Pending Make-up"
-                    )
-                    consumed_session.rescheduled_to_id = None
-
-            # Delete the revision session
+            to_unenroll.append(s)
+            if s.make_up_for_id:
+                consumed_ids.append(s.make_up_for_id)
+
+        # Revert every consumed session in one statement, from
+        # "X - Make-up Booked" to "X - Pending Make-up"
+        if consumed_ids:
+            db.query(SessionLog).filter(SessionLog.id.in_(consumed_ids)).update({
+                SessionLog.session_status: case(
+                    _REVERT_STATUS, value=SessionLog.session_status,
+                    else_=SessionLog.session_status
+                ),
+                SessionLog.rescheduled_to_id: None,
+            }, synchronize_session=False)
+
+        # Delete the revision sessions through the ORM so their exercises and
+        # other dependent rows are cascaded as in remove_enrollment
+        for session in to_unenroll:
             db.delete(session)
-            unenrolled_count += 1
+        unenrolled_count = len(to_unenroll)
+        db.flush()
 
-    db.delete(slot)
+    # Unlink whatever still points at the slot (attended or cancelled rows)
+    # and delete it in bulk, so the ORM never loads the sessions collection
+    # to null out the foreign keys itself
+    db.query(SessionLog).filter(
+        SessionLog.exam_revision_slot_id == slot_id
+    ).update({SessionLog.exam_revision_slot_id: None}, synchronize_session=False)
+    db.query(ExamRevisionSlot).filter(
+        ExamRevisionSlot.id == slot_id
+    ).delete(synchronize_session=False)
     db.commit()
 
     if unenrolled_count > 0:
@@ -711,8 +1162,11 @@ async def delete_revision_slot(
 # ============================================
 
 @router.get("/exam-revision/slots/{slot_id}/eligible-students", response_model=List[EligibleStudentResponse])
-async def get_eligible_students(
+def get_eligible_students(
     slot_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=ELIGIBLE_STUDENTS_MAX_LIMIT, description="Maximum number of students (omit for the full list)"),
+    offset: int = Query(0, ge=0, description="Number of students to skip"),
     db: Session = Depends(get_db)
 ):
     """
@@ -723,11 +1177,20 @@ async def get_eligible_students(
     2. Student has an active enrollment at the slot's location
     3. Student has at least one pending make-up session OR unused scheduled/make-up session (future dated)
     4. Student is not already enrolled in this revision slot
+
+    Ordered by school student ID; the full count is returned in X-Total-Count.
     """
+    cache_key = ("slot-eligible", slot_id, limit, offset)
+    cached = _get_cached_exam_revision(cache_key)
+    if cached is not None:
+        eligible_students, total = cached
+        response.headers["X-Total-Count"] = str(total)
+        return eligible_students
+
     # Get the slot with calendar event
     slot = db.query(ExamRevisionSlot).options(
         joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.sessions)
+        raiseload('*')
     ).filter(ExamRevisionSlot.id == slot_id).first()
 
     if not slot:
@@ -737,95 +1200,73 @@ async def get_eligible_students(
     if not calendar_event:
         raise HTTPException(status_code=400, detail="Revision slot has no associated calendar event")
 
-    # Get IDs of already enrolled students
-    already_enrolled_student_ids = {
-        s.student_id for s in slot.sessions
-        if s.session_status in ENROLLED_SESSION_STATUSES
-    }
-
     # Build student filter based on calendar event criteria
     student_filters = _build_student_filters_from_event(calendar_event)
+    # One date for every query below, so the candidate list, its count and the
+    # sessions fetched for it agree even if the request straddles midnight
+    today = _hk_today()
+
+    # Students already enrolled in this slot
+    already_enrolled = db.query(SessionLog.id).filter(
+        SessionLog.student_id == Student.id,
+        SessionLog.exam_revision_slot_id == slot_id,
+        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+    )
 
-    # Find students with active enrollments at this location
-    enrolled_students_query = db.query(Student).join(
-        Enrollment, Student.id == Enrollment.student_id
+    # Find students with active enrollments at this location and a consumable
+    # session there, not yet enrolled, with their enrollment tutor's name
+    enrolled_students_query = db.query(
+        *_ELIGIBLE_STUDENT_COLUMNS, _enrollment_tutor_name_column(db, location=slot.location)
     ).filter(
-        Enrollment.location == slot.location,
-        Enrollment.payment_status.in_(['Paid', 'Pending Payment']),  # Active enrollments
+        *_eligible_student_conditions(db, location=slot.location),
+        ~already_enrolled.exists(),
         *student_filters
-    ).distinct()
+    ).params(consumable_today=today)
 
-    students = enrolled_students_query.all()
-
-    # Batch query enrollments with tutors (O(1) instead of N+1)
-    student_ids = [s.id for s in students]
-    enrollments = db.query(Enrollment).filter(
-        Enrollment.student_id.in_(student_ids),
-        Enrollment.location == slot.location,
-        Enrollment.payment_status.in_(['Paid', 'Pending Payment'])
-    ).options(joinedload(Enrollment.tutor)).all()
-    enrollment_map = {e.student_id: e for e in enrollments}
+    rows, total = _page_eligible_students(enrolled_students_query, limit, offset)
+    if not rows:
+        # Everyone matching is already enrolled (or the page is past the end):
+        # no sessions, root dates or deadlines to look up
+        _set_cached_exam_revision(cache_key, ([], total))
+        response.headers["X-Total-Count"] = str(total)
+        return []
+    student_ids = [row.id for row in rows]
 
     # For each student, find their pending sessions
     eligible_students = []
 
-    # First pass: collect pending sessions per student
-    student_sessions = {}
-    for student in students:
-        if student.id in already_enrolled_student_ids:
-            continue
-        pending = _get_consumable_sessions_query(
-            db, student.id, slot.location
-        ).order_by(SessionLog.session_date).all()
-        if pending:
-            student_sessions[student.id] = pending
+    # First pass: collect pending sessions for all candidate students in one query
+    student_sessions = _get_consumable_sessions_by_student(db, student_ids, slot.location, today=today)
 
     # Batch resolve root original session dates for all sessions at once
     all_sessions = [s for sessions in student_sessions.values() for s in sessions]
     root_dates = batch_find_root_original_session_dates(all_sessions, db)
 
+    # Deadline flags for every candidate from one enrollment query
+    past_deadline_ids = _check_past_deadlines(db, student_ids, slot.session_date, slot.time_slot)
+
     # Second pass: build responses
-    for student in students:
-        if student.id not in student_sessions:
+    for row in rows:
+        if row.id not in student_sessions:
             continue
-        pending_sessions = student_sessions[student.id]
-        enrollment = enrollment_map.get(student.id)
-        past_deadline = _check_past_deadline(db, student.id, slot.session_date, slot.time_slot)
-        eligible_students.append(EligibleStudentResponse(
-            student_id=student.id,
-            student_name=student.student_name,
-            school_student_id=student.school_student_id,
-            grade=student.grade,
-            school=student.school,
-            lang_stream=student.lang_stream,
-            academic_stream=student.academic_stream,
-            home_location=student.home_location,
-            enrollment_tutor_name=enrollment.tutor.tutor_name if enrollment and enrollment.tutor else None,
-            is_past_deadline=past_deadline,
-            pending_sessions=[
-                PendingSessionInfo(
-                    id=s.id,
-                    session_date=s.session_date,
-                    time_slot=s.time_slot,
-                    session_status=s.session_status,
-                    tutor_name=s.tutor.tutor_name if s.tutor else None,
-                    location=s.location,
-                    root_original_session_date=root_dates.get(s.id),
-                )
-                for s in pending_sessions
-            ]
+        pending_sessions = student_sessions[row.id]
+        eligible_students.append(_build_eligible_student(
+            row, pending_sessions, root_dates,
+            is_past_deadline=row.id in past_deadline_ids
         ))
 
-    # Sort by student ID
-    eligible_students.sort(key=lambda s: s.school_student_id or "")
-
+    _set_cached_exam_revision(cache_key, (eligible_students, total))
+    response.headers["X-Total-Count"] = str(total)
     return eligible_students
 
 
 @router.get("/exam-revision/calendar/{event_id}/eligible-students", response_model=List[EligibleStudentResponse])
-async def get_eligible_students_by_exam(
+def get_eligible_students_by_exam(
     event_id: int,
+    response: Response,
     locations: Optional[str] = Query(None, description="Comma-separated locations to filter by (optional - omit for all locations)"),
+    limit: Optional[int] = Query(None, ge=1, le=ELIGIBLE_STUDENTS_MAX_LIMIT, description="Maximum number of students (omit for the full list)"),
+    offset: int = Query(0, ge=0, description="Number of students to skip"),
     db: Session = Depends(get_db)
 ):
     """
@@ -838,7 +1279,16 @@ async def get_eligible_students_by_exam(
     2. Student has an active enrollment (at the specified location(s) if provided)
     3. Student has at least one pending make-up session OR unused scheduled/make-up session (future dated)
     4. Student is not already enrolled in a revision slot for this event
+
+    Ordered by school student ID; the full count is returned in X-Total-Count.
     """
+    cache_key = ("exam-eligible", event_id, locations, limit, offset)
+    cached = _get_cached_exam_revision(cache_key)
+    if cached is not None:
+        eligible_students, total = cached
+        response.headers["X-Total-Count"] = str(total)
+        return eligible_students
+
     # Get the calendar event
     calendar_event = db.query(CalendarEvent).filter(
         CalendarEvent.id == event_id
@@ -849,98 +1299,73 @@ async def get_eligible_students_by_exam(
 
     # Parse locations
     locations_list = [loc.strip() for loc in locations.split(",")] if locations else None
-
-    # Exclude students already enrolled in revision slots for this event
-    already_enrolled_ids = {row[0] for row in db.query(SessionLog.student_id).join(
-        ExamRevisionSlot, SessionLog.exam_revision_slot_id == ExamRevisionSlot.id
-    ).filter(
-        ExamRevisionSlot.calendar_event_id == calendar_event.id,
-        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
-    ).distinct().all()}
+    # One date for every query below (see get_eligible_students)
+    today = _hk_today()
+
+    # Students already enrolled in revision slots for this event. The event's
+    # few slot IDs are resolved up front so the exclusion is a plain IN on the
+    # slot/status index, and is dropped entirely before any slot exists.
+    event_slot_ids = [
+        slot_id for slot_id, in db.query(ExamRevisionSlot.id).filter(
+            ExamRevisionSlot.calendar_event_id == calendar_event.id
+        )
+    ]
+    not_enrolled_filters = []
+    if event_slot_ids:
+        not_enrolled_filters.append(~db.query(SessionLog.id).filter(
+            SessionLog.student_id == Student.id,
+            SessionLog.exam_revision_slot_id.in_(event_slot_ids),
+            SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+        ).exists())
 
     # Build student filter based on calendar event criteria
     student_filters = _build_student_filters_from_event(calendar_event)
 
-    # Find students with active enrollments (optionally filtered by locations)
-    enrolled_students_query = db.query(Student).join(
-        Enrollment, Student.id == Enrollment.student_id
+    # Find students with active enrollments and a consumable session (optionally
+    # filtered by locations), not yet enrolled, with their enrollment tutor's name
+    enrolled_students_query = db.query(
+        *_ELIGIBLE_STUDENT_COLUMNS, _enrollment_tutor_name_column(db, locations=locations_list)
     ).filter(
-        Enrollment.payment_status.in_(['Paid', 'Pending Payment']),  # Active enrollments
+        *_eligible_student_conditions(db, locations=locations_list),
+        *not_enrolled_filters,
         *student_filters
-    )
-    if locations_list:
-        enrolled_students_query = enrolled_students_query.filter(Enrollment.location.in_(locations_list))
-    enrolled_students_query = enrolled_students_query.distinct()
+    ).params(consumable_today=today)
 
-    students = enrolled_students_query.all()
-
-    # Batch query enrollments with tutors (O(1) instead of N+1)
-    student_ids = [s.id for s in students]
-    enrollment_query = db.query(Enrollment).filter(
-        Enrollment.student_id.in_(student_ids),
-        Enrollment.payment_status.in_(['Paid', 'Pending Payment'])
-    )
-    if locations_list:
-        enrollment_query = enrollment_query.filter(Enrollment.location.in_(locations_list))
-    enrollments = enrollment_query.options(joinedload(Enrollment.tutor)).all()
-    enrollment_map = {e.student_id: e for e in enrollments}
+    rows, total = _page_eligible_students(enrolled_students_query, limit, offset)
+    if not rows:
+        # Everyone matching is already enrolled (or the page is past the end):
+        # no sessions, root dates or deadlines to look up
+        _set_cached_exam_revision(cache_key, ([], total))
+        response.headers["X-Total-Count"] = str(total)
+        return []
+    student_ids = [row.id for row in rows]
 
     # For each student, find their pending sessions
     eligible_students = []
 
-    # First pass: collect pending sessions per student
-    student_sessions = {}
-    for student in students:
-        if student.id in already_enrolled_ids:
-            continue
-        pending = _get_consumable_sessions_query(
-            db, student.id, locations=locations_list
-        ).order_by(SessionLog.session_date).all()
-        if pending:
-            student_sessions[student.id] = pending
+    # First pass: collect pending sessions for all candidate students in one query
+    student_sessions = _get_consumable_sessions_by_student(
+        db, student_ids, locations=locations_list, today=today
+    )
 
     # Batch resolve root original session dates for all sessions at once
     all_sessions = [s for sessions in student_sessions.values() for s in sessions]
     root_dates = batch_find_root_original_session_dates(all_sessions, db)
 
     # Second pass: build responses
-    for student in students:
-        if student.id not in student_sessions:
+    for row in rows:
+        if row.id not in student_sessions:
             continue
-        pending_sessions = student_sessions[student.id]
-        enrollment = enrollment_map.get(student.id)
-        eligible_students.append(EligibleStudentResponse(
-            student_id=student.id,
-            student_name=student.student_name,
-            school_student_id=student.school_student_id,
-            grade=student.grade,
-            school=student.school,
-            lang_stream=student.lang_stream,
-            academic_stream=student.academic_stream,
-            home_location=student.home_location,
-            enrollment_tutor_name=enrollment.tutor.tutor_name if enrollment and enrollment.tutor else None,
-            pending_sessions=[
-                PendingSessionInfo(
-                    id=s.id,
-                    session_date=s.session_date,
-                    time_slot=s.time_slot,
-                    session_status=s.session_status,
-                    tutor_name=s.tutor.tutor_name if s.tutor else None,
-                    location=s.location,
-                    root_original_session_date=root_dates.get(s.id),
-                )
-                for s in pending_sessions
-            ]
-        ))
-
-    # Sort by student ID
-    eligible_students.sort(key=lambda s: s.school_student_id or "")
+        pending_sessions = student_sessions[row.id]
+        eligible_students.append(_build_eligible_student(row, pending_sessions, root_dates))
 
+    _set_cached_exam_revision(cache_key, (eligible_students, total))
+    response.headers["X-Total-Count"] = str(total)
     return eligible_students
 
 
 @router.post("/exam-revision/slots/{slot_id}/enroll", response_model=EnrollStudentResponse)
-async def enroll_student(
+def enroll_student(
     slot_id: int,
     request: EnrollStudentRequest,
     current_user: Tutor = Depends(get_current_user),
@@ -952,32 +1377,37 @@ async def enroll_student(
     Creates a new session linked to both the revision slot and the consumed session.
     Updates the consumed session status from "Pending Make-up" to "Make-up Booked".
     """
-    # Get the revision slot
-    slot = db.query(ExamRevisionSlot).options(
-        joinedload(ExamRevisionSlot.calendar_event),
-        joinedload(ExamRevisionSlot.tutor),
-        joinedload(ExamRevisionSlot.sessions)
+    # Get the revision slot together with whether the student is already
+    # enrolled in it. Only its scalar fields are needed here, so the sessions
+    # collection is not loaded just to check for a duplicate.
+    row = db.query(
+        ExamRevisionSlot,
+        exists().where(
+            SessionLog.exam_revision_slot_id == ExamRevisionSlot.id,
+            SessionLog.student_id == request.student_id,
+            SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES),
+        ).label("already_enrolled")
     ).filter(ExamRevisionSlot.id == slot_id).first()
 
-    if not slot:
+    if not row:
         raise HTTPException(status_code=404, detail=f"Revision slot with ID {slot_id} not found")
 
-    # Check if student is already enrolled
-    already_enrolled = any(
-        s.student_id == request.student_id and
-        s.session_status in ENROLLED_SESSION_STATUSES
-        for s in slot.sessions
-    )
+    # uq_revision_slot_student (slot, student) is what actually prevents a
+    # duplicate, including under concurrent requests (see the IntegrityError
+    # handler below). The EXISTS only answers the common case early: without it
+    # an enrolled student would trip the generic slot-conflict check first.
+    slot, already_enrolled = row
     if already_enrolled:
         raise HTTPException(
             status_code=400,
             detail="Student is already enrolled in this revision slot"
         )
 
-    # Get the session to consume
+    # Get the session to consume. Validation only needs its enrollment (summer
+    # detection in validate_makeup_constraints); student/tutor/exercises are
+    # loaded by the post-commit reload that builds the response.
     consume_session = db.query(SessionLog).options(
-        *session_with_relations(),
-        joinedload(SessionLog.enrollment),  # summer detection in validate_makeup_constraints
+        joinedload(SessionLog.enrollment),
     ).filter(SessionLog.id == request.consume_session_id).first()
 
     if not consume_session:
@@ -986,25 +1416,25 @@ async def enroll_student(
             detail=f"Session with ID {request.consume_session_id} not found"
         )
 
-    # Validate the session belongs to the student
+    # Validate the session belongs to the student (which, through the
+    # session_log.student_id foreign key, also proves the student exists)
     if consume_session.student_id != request.student_id:
         raise HTTPException(
             status_code=400,
             detail="The session to consume does not belong to this student"
         )
 
+    # One timestamp for the whole enrollment: the consumable check and both
+    # session writes below see the same instant
+    now = hk_now()
+
     # Validate the session can be consumed
-    if not _is_session_consumable(consume_session):
+    if not _is_session_consumable(consume_session, now.date()):
         raise HTTPException(
             status_code=400,
             detail=f"Session cannot be consumed. Status: {consume_session.session_status}"
         )
 
-    # Get the student for enrollment lookup
-    student = db.query(Student).filter(Student.id == request.student_id).first()
-    if not student:
-        raise HTTPException(status_code=404, detail=f"Student with ID {request.student_id} not found")
-
     # Shared validation: 60-day window, holiday, enrollment deadline, student conflict
     # Note: holiday is intentionally NOT re-checked here. Whether a slot may fall
     # on a holiday is decided (admin-gated) when the slot is created, so once the
@@ -1034,16 +1464,17 @@ async def enroll_student(
         exam_revision_slot_id=slot.id,
         notes=request.notes,
         last_modified_by=modified_by,
-        last_modified_time=hk_now()
+        last_modified_time=now
     )
     db.add(revision_session)
 
     try:
         db.flush()  # Get the ID and check unique constraint
+        revision_session_id = revision_session.id
 
         # Update the consumed session (inside same transaction)
         is_pending_makeup = (
-            consume_session.session_status in PENDING_MAKEUP_STATUSES and
+            consume_session.session_status in _PENDING_MAKEUP_STATUS_SET and
             consume_session.rescheduled_to_id is None
         )
         if is_pending_makeup:
@@ -1059,7 +1490,7 @@ async def enroll_student(
             consume_session.rescheduled_to_id = revision_session.id
 
         consume_session.last_modified_by = modified_by
-        consume_session.last_modified_time = hk_now()
+        consume_session.last_modified_time = now
 
         db.commit()
 
@@ -1070,6 +1501,8 @@ async def enroll_student(
             raise HTTPException(status_code=409, detail="Student already has an active session at this slot")
         if 'unique_active_makeup_source' in err:
             raise HTTPException(status_code=409, detail="A make-up session already exists for this original session")
+        # uq_revision_slot_student: a concurrent enroll won, or the student has
+        # a non-enrolled (e.g. cancelled) session left in this slot
         raise HTTPException(
             status_code=400,
             detail="Student is already enrolled in this revision slot"
@@ -1081,24 +1514,24 @@ async def enroll_student(
             detail="Failed to complete enrollment"
         )
 
-    # Refresh and load relationships for response
-    revision_session = db.query(SessionLog).options(
-        *session_with_relations()
-    ).filter(SessionLog.id == revision_session.id).first()
-
-    consume_session = db.query(SessionLog).options(
-        *session_with_relations()
-    ).filter(SessionLog.id == consume_session.id).first()
+    # The commit expired both sessions, so reload them together with every
+    # relation _build_session_response reads
+    loaded = {
+        s.id: s for s in db.query(SessionLog).options(
+            *_ENROLL_RESPONSE_RELATIONS,
+            raiseload('*')
+        ).filter(SessionLog.id.in_([revision_session_id, request.consume_session_id]))
+    }
 
     return EnrollStudentResponse(
-        revision_session=_build_session_response(revision_session),
-        consumed_session=_build_session_response(consume_session),
+        revision_session=_build_session_response(loaded[revision_session_id]),
+        consumed_session=_build_session_response(loaded[request.consume_session_id]),
         warning=None
     )
 
 
 @router.delete("/exam-revision/slots/{slot_id}/enrollments/{session_id}")
-async def remove_enrollment(
+def remove_enrollment(
     slot_id: int,
     session_id: int,
     current_user: Tutor = Depends(get_current_user),
@@ -1110,38 +1543,38 @@ async def remove_enrollment(
     Deletes the revision session and reverts the consumed session's status
     back to "Pending Make-up".
     """
-    # Get the revision session
-    revision_session = db.query(SessionLog).filter(
+    # Get the revision session and the session it consumed in one query
+    consumed = aliased(SessionLog)
+    row = db.query(SessionLog, consumed).outerjoin(
+        consumed, consumed.id == SessionLog.make_up_for_id
+    ).filter(
         SessionLog.id == session_id,
         SessionLog.exam_revision_slot_id == slot_id
     ).first()
 
-    if not revision_session:
+    if not row:
         raise HTTPException(
             status_code=404,
             detail=f"Enrollment session {session_id} not found in slot {slot_id}"
         )
+    revision_session, consumed_session = row
 
     # Can only remove if not yet attended
-    if revision_session.session_status in ['Attended', 'Attended (Make-up)']:
+    if revision_session.session_status in _COMPLETED_STATUS_SET:
         raise HTTPException(
             status_code=400,
             detail="Cannot remove enrollment for attended session"
         )
 
     # Revert the consumed session if it exists
-    if revision_session.make_up_for_id:
-        consumed_session = db.query(SessionLog).filter(
-            SessionLog.id == revision_session.make_up_for_id
-        ).first()
-        if consumed_session:
-            # Revert status from "X - Make-up Booked" to "X - Pending Make-up"
-            consumed_session.session_status = consumed_session.session_status.replace(
-                "Make-up Booked", "Pending Make-up"
-            )
-            consumed_session.rescheduled_to_id = None
-            consumed_session.last_modified_by = current_user.user_email
-            consumed_session.last_modified_time = hk_now()
+    if consumed_session:
+        # Revert status from "X - Make-up Booked" to "X - Pending Make-up"
+        consumed_session.session_status = _REVERT_STATUS.get(
+            consumed_session.session_status, consumed_session.session_status
+        )
+        consumed_session.rescheduled_to_id = None
+        consumed_session.last_modified_by = current_user.user_email
+        consumed_session.last_modified_time = hk_now()
 
     # Delete the revision session
     db.delete(revision_session)
@@ -1155,16 +1588,16 @@ async def remove_enrollment(
 # ============================================
 
 @router.get("/exam-revision/calendar/{event_id}/date")
-async def get_exam_date(event_id: int, db: Session = Depends(get_db)):
+def get_exam_date(event_id: int, db: Session = Depends(get_db)):
     """Get the start date of a calendar event by ID."""
-    event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
-    if not event:
+    start_date = db.query(CalendarEvent.start_date).filter(CalendarEvent.id == event_id).scalar()
+    if start_date is None:
         raise HTTPException(status_code=404, detail="Event not found")
-    return {"start_date": event.start_date.isoformat()}
+    return {"start_date": start_date.isoformat()}
 
 
 @router.get("/exam-revision/calendar", response_model=List[ExamWithRevisionSlotsResponse])
-async def get_exams_with_revision_slots(
+def get_exams_with_revision_slots(
     school: Optional[str] = Query(None, description="Filter by school"),
     grade: Optional[str] = Query(None, description="Filter by grade"),
     location: Optional[str] = Query(None, description="Filter slots by location"),
@@ -1179,18 +1612,32 @@ async def get_exams_with_revision_slots(
     revision slots, enrollment counts, and eligible student counts.
     """
     # Default date range: from today to 60 days ahead
+    today = _hk_today()
     if not from_date:
-        from_date = hk_now().date()
+        from_date = today
     if not to_date:
-        to_date = hk_now().date()
         # Extend to 60 days for a reasonable range
         from datetime import timedelta
         to_date = from_date + timedelta(days=60)
 
-    # Query calendar events (exams)
-    query = db.query(CalendarEvent).options(
-        joinedload(CalendarEvent.revision_slots).joinedload(ExamRevisionSlot.tutor),
-        joinedload(CalendarEvent.revision_slots).joinedload(ExamRevisionSlot.sessions)
+    cache_key = ("calendar", school, grade, location, from_date, to_date)
+    cached = _get_cached_exam_revision(cache_key)
+    if cached is not None:
+        return cached
+
+    # Query calendar events (exams) as plain column rows — the summary needs
+    # no ORM instances, relationship proxies or identity-map bookkeeping
+    query = db.query(
+        CalendarEvent.id,
+        CalendarEvent.event_id,
+        CalendarEvent.title,
+        CalendarEvent.description,
+        CalendarEvent.start_date,
+        CalendarEvent.end_date,
+        CalendarEvent.school,
+        CalendarEvent.grade,
+        CalendarEvent.academic_stream,
+        CalendarEvent.event_type,
     ).filter(
         CalendarEvent.start_date >= from_date,
         CalendarEvent.start_date <= to_date,
@@ -1205,123 +1652,207 @@ async def get_exams_with_revision_slots(
     query = query.order_by(CalendarEvent.start_date)
     events = query.all()
 
+    # Slots for those events (filtered by location if specified), with tutor
+    # name and enrolled count computed in SQL
+    slots_by_event = defaultdict(list)
+    enrolled_by_event = defaultdict(int)
+    if events:
+        slot_query = db.query(
+            ExamRevisionSlot.id,
+            ExamRevisionSlot.calendar_event_id,
+            ExamRevisionSlot.session_date,
+            ExamRevisionSlot.time_slot,
+            ExamRevisionSlot.tutor_id,
+            Tutor.tutor_name,
+            ExamRevisionSlot.location,
+            ExamRevisionSlot.notes,
+            ExamRevisionSlot.created_at,
+            ExamRevisionSlot.created_by,
+            _enrolled_count_column(db),
+        ).outerjoin(
+            Tutor, ExamRevisionSlot.tutor_id == Tutor.id
+        ).filter(
+            ExamRevisionSlot.calendar_event_id.in_([e.id for e in events])
+        )
+        if location:
+            slot_query = slot_query.filter(ExamRevisionSlot.location == location)
+
+        for slot in slot_query.order_by(ExamRevisionSlot.id):
+            slots_by_event[slot.calendar_event_id].append(slot)
+            enrolled_by_event[slot.calendar_event_id] += slot.enrolled_count
+
+    # Count eligible students — based on slot locations (not app filter)
+    # because cross-location revision is not allowed. Events sharing the same
+    # location scope are counted together, and all scopes in one round trip.
+    event_ids_by_locations = defaultdict(list)
+    for event in events:
+        slot_locations = tuple(sorted({s.location for s in slots_by_event[event.id]}))
+        if not slot_locations and location:
+            slot_locations = (location,)
+        event_ids_by_locations[slot_locations].append(event.id)
+
+    eligible_counts = _get_eligible_counts(
+        db, event_ids_by_locations, today,
+        school_grade_by_event={event.id: (event.school, event.grade) for event in events}
+    )
+
     result = []
     for event in events:
-        # Filter slots by location if specified
-        slots = event.revision_slots
-        if location:
-            slots = [s for s in slots if s.location == location]
-
-        # Build slot responses
-        slot_responses = []
-        total_enrolled = 0
-        for slot in slots:
-            enrolled_count = len([
-                s for s in slot.sessions
-                if s.session_status in ENROLLED_SESSION_STATUSES
-            ])
-            total_enrolled += enrolled_count
-            slot_responses.append(ExamRevisionSlotResponse(
-                id=slot.id,
-                calendar_event_id=slot.calendar_event_id,
-                session_date=slot.session_date,
-                time_slot=slot.time_slot,
-                tutor_id=slot.tutor_id,
-                tutor_name=slot.tutor.tutor_name if slot.tutor else None,
-                location=slot.location,
-                notes=slot.notes,
-                created_at=slot.created_at,
-                created_by=slot.created_by,
-                enrolled_count=enrolled_count
-            ))
-
-        # Count eligible students — based on slot locations (not app filter)
-        # because cross-location revision is not allowed
-        slot_locations = list(set(s.location for s in slots))
-        if slot_locations:
-            eligible_count = _count_eligible_students(db, event, locations=slot_locations)
-        elif location:
-            eligible_count = _count_eligible_students(db, event, locations=[location])
-        else:
-            eligible_count = _count_eligible_students(db, event)
-
-        result.append(ExamWithRevisionSlotsResponse(
-            id=event.id,
-            event_id=event.event_id,
-            title=event.title,
-            description=event.description,
-            start_date=event.start_date,
-            end_date=event.end_date,
-            school=event.school,
-            grade=event.grade,
-            academic_stream=event.academic_stream,
-            event_type=event.event_type,
-            revision_slots=slot_responses,
-            total_enrolled=total_enrolled,
-            eligible_count=eligible_count
+        # model_construct: every value is a database column or a SQL count,
+        # and a two-month calendar can carry hundreds of slots
+        result.append(ExamWithRevisionSlotsResponse.model_construct(
+            **event._mapping,
+            revision_slots=[
+                ExamRevisionSlotResponse.model_construct(**slot._mapping)
+                for slot in slots_by_event[event.id]
+            ],
+            total_enrolled=enrolled_by_event[event.id],
+            eligible_count=eligible_counts.get(event.id, 0)
         ))
 
+    _set_cached_exam_revision(cache_key, result)
     return result
 
 
-def _count_eligible_students(
+@lru_cache(maxsize=1)
+def _event_student_match_conditions() -> Tuple[Any, ...]:
+    """
+    Join conditions pairing each CalendarEvent with the students it targets.
+
+    Column-wise equivalent of _build_student_filters_from_event: an empty
+    event field places no restriction, and academic stream only applies to F4-F6.
+    Built once, like the per-event filters, as it depends on no request input.
+    """
+    event_school = func.coalesce(CalendarEvent.school, '')
+    event_grade = func.coalesce(CalendarEvent.grade, '')
+    event_stream = func.coalesce(CalendarEvent.academic_stream, '')
+    return (
+        or_(event_school == '', Student.school == CalendarEvent.school),
+        or_(event_grade == '', Student.grade == CalendarEvent.grade),
+        or_(
+            event_stream == '',
+            ~event_grade.in_(sorted(_STREAM_GRADES)),
+            Student.academic_stream == CalendarEvent.academic_stream
+        ),
+    )
+
+
+def _eligible_count_query(
     db: Session,
-    calendar_event: CalendarEvent,
-    locations: Optional[List[str]] = None
-) -> int:
+    event_ids: List[int],
+    locations: Optional[List[str]] = None,
+    school_grades: Optional[set] = None
+):
     """
-    Count students eligible for revision slots for this calendar event.
-    Excludes students already enrolled in revision slots for this event.
+    Grouped (event ID, eligible student count) query for the given calendar
+    events. Excludes students already enrolled in revision slots for the
+    respective event; events with no eligible students yield no row.
 
     locations: list of locations to filter by (e.g. slot locations).
                If None, counts across all locations.
+    school_grades: (school, grade) pairs covering every event, used to narrow
+               the student scan before the per-event match.
     """
-    # Get students already enrolled in revision slots for this calendar event
-    enrolled_statuses = ENROLLED_SESSION_STATUSES
-    already_enrolled_subquery = db.query(SessionLog.student_id).join(
+    # Students already enrolled in a revision slot for the same event
+    already_enrolled = db.query(SessionLog.id).join(
         ExamRevisionSlot, SessionLog.exam_revision_slot_id == ExamRevisionSlot.id
     ).filter(
-        ExamRevisionSlot.calendar_event_id == calendar_event.id,
-        SessionLog.session_status.in_(enrolled_statuses)
-    ).distinct()
+        SessionLog.student_id == Student.id,
+        ExamRevisionSlot.calendar_event_id == CalendarEvent.id,
+        SessionLog.session_status.in_(ENROLLED_SESSION_STATUSES)
+    )
 
-    # Build student filter based on calendar event criteria
-    student_filters = _build_student_filters_from_event(calendar_event)
+    query = db.query(
+        CalendarEvent.id, func.count(Student.id)
+    ).select_from(Student).join(
+        CalendarEvent, and_(*_event_student_match_conditions())
+    ).filter(
+        CalendarEvent.id.in_(event_ids),
+        *_eligible_student_conditions(db, locations=locations),
+        ~already_enrolled.exists()
+    )
+    if school_grades:
+        query = query.filter(tuple_(Student.school, Student.grade).in_(sorted(school_grades)))
 
-    # Get students who have pending sessions
+    return query.group_by(CalendarEvent.id)
 
-    # Subquery for students with pending sessions
-    student_ids_with_pending = db.query(SessionLog.student_id).filter(
-        or_(
-            and_(
-                SessionLog.session_status.in_(PENDING_MAKEUP_STATUSES),
-                SessionLog.rescheduled_to_id.is_(None)
-            ),
-            and_(
-                SessionLog.session_status.in_(SCHEDULABLE_STATUSES),
-                SessionLog.session_date > hk_now().date()
-            )
-        )
-    )
-    if locations:
-        student_ids_with_pending = student_ids_with_pending.filter(SessionLog.location.in_(locations))
 
-    student_ids_with_pending = student_ids_with_pending.distinct()
+def _student_school_grades(
+    event_ids: List[int],
+    school_grade_by_event: Dict[int, tuple]
+) -> Optional[set]:
+    """
+    The (school, grade) pairs targeted by the given events, or None when any
+    event leaves school or grade open (and so could match any student).
+    """
+    pairs = {school_grade_by_event.get(event_id, (None, None)) for event_id in event_ids}
+    if all(school and grade for school, grade in pairs):
+        return pairs
+    return None
 
-    # Count students matching criteria who have pending sessions, excluding already enrolled
-    count = db.query(func.count(func.distinct(Student.id))).join(
-        Enrollment, Student.id == Enrollment.student_id
-    ).filter(
-        Enrollment.payment_status.in_(['Paid', 'Pending Payment']),
-        Student.id.in_(student_ids_with_pending),
-        ~Student.id.in_(already_enrolled_subquery),  # Exclude already enrolled students
-        *student_filters
-    )
 
-    if locations:
-        count = count.filter(Enrollment.location.in_(locations))
+def _count_eligible_students_by_event(
+    db: Session,
+    event_ids_by_scope: Dict[tuple, List[int]],
+    today: date,
+    school_grade_by_event: Optional[Dict[int, tuple]] = None
+) -> Dict[int, int]:
+    """
+    Count students eligible for revision slots for each calendar event, where
+    events are grouped by the location scope they are counted under (an empty
+    scope counts across all locations).
+
+    Each scope is its own grouped query, but they are combined with UNION ALL
+    so the whole calendar costs a single database round trip. today is bound
+    once for every part of the statement. When school_grade_by_event is given,
+    each part only scans students of the events' schools and grades.
+    Returns a dict of event ID -> count; events with no eligible students are omitted.
+    """
+    queries = [
+        _eligible_count_query(
+            db, event_ids, locations=list(scope) or None,
+            school_grades=_student_school_grades(event_ids, school_grade_by_event or {})
+        )
+        for scope, event_ids in event_ids_by_scope.items()
+        if event_ids
+    ]
+    if not queries:
+        return {}
+    query = queries[0].union_all(*queries[1:]) if len(queries) > 1 else queries[0]
+    return dict(query.params(consumable_today=today).all())
+
+
+def _get_eligible_counts(
+    db: Session,
+    event_ids_by_scope: Dict[tuple, List[int]],
+    today: date,
+    school_grade_by_event: Optional[Dict[int, tuple]] = None
+) -> Dict[int, int]:
+    """
+    Eligible-student counts per event, keyed by location scope, served from the
+    per-event summary cache where possible and counting only the misses.
 
-    return count.scalar() or 0
+    The calendar view is requested under many filter combinations that share
+    the same exams, so counts are cached per (event, scope) rather than per request.
+    """
+    counts: Dict[int, int] = {}
+    missing: Dict[tuple, List[int]] = defaultdict(list)
+    for scope, event_ids in event_ids_by_scope.items():
+        for event_id in event_ids:
+            cached = _get_cached_exam_revision(("eligible-count", event_id, scope))
+            if cached is None:
+                missing[scope].append(event_id)
+            else:
+                counts[event_id] = cached
+
+    if missing:
+        fresh = _count_eligible_students_by_event(db, missing, today, school_grade_by_event)
+        for scope, event_ids in missing.items():
+            for event_id in event_ids:
+                counts[event_id] = fresh.get(event_id, 0)
+                _set_cached_exam_revision(("eligible-count", event_id, scope), counts[event_id])
+
+    return counts
 
 
 # ============================================
@@ -1329,7 +1860,7 @@ def _count_eligible_students(
 # ============================================
 
 @router.get("/exam-revision/calendar/sync-status")
-async def get_calendar_sync_status(
+def get_calendar_sync_status(
     db: Session = Depends(get_db)
 ):
     """
@@ -1337,21 +1868,19 @@ async def get_calendar_sync_status(
 
     Returns the last successful sync time and event counts.
     """
-    # Get the most recently synced event's timestamp
-    last_synced = db.query(
-        func.max(CalendarEvent.last_synced_at)
-    ).scalar()
-
-    # Count total events in database
-    total_events = db.query(func.count(CalendarEvent.id)).scalar() or 0
-
-    # Count events in the upcoming window (next 90 days)
+    # Last sync time, total events and events in the upcoming window (next
+    # 90 days), aggregated in a single pass over the table
     from datetime import timedelta
     now = hk_now().date()
-    upcoming_events = db.query(func.count(CalendarEvent.id)).filter(
+    in_window = and_(
         CalendarEvent.start_date >= now,
         CalendarEvent.start_date <= now + timedelta(days=90)
-    ).scalar() or 0
+    )
+    last_synced, total_events, upcoming_events = db.query(
+        func.max(CalendarEvent.last_synced_at),
+        func.count(CalendarEvent.id),
+        func.count(case((in_window, CalendarEvent.id))),
+    ).one()
 
     return {
         "last_synced_at": last_synced.isoformat() if last_synced else None,
@@ -1362,7 +1891,7 @@ async def get_calendar_sync_status(
 
 
 @router.post("/exam-revision/calendar/sync")
-async def trigger_calendar_sync(
+def trigger_calendar_sync(
     force: bool = Query(False, description="Force sync regardless of TTL"),
     days_behind: int = Query(0, ge=0, le=30, description="Days in the past to sync"),
     db: Session = Depends(get_db)
@@ -1373,5 +1902,4 @@ async def trigger_calendar_sync(
     By default, respects the 15-minute TTL between syncs.
     Use force=true to bypass the TTL check.
     """
-    result = sync_calendar_events(db, force_sync=force, days_behind=days_behind)
-    return result
+    return sync_calendar_events(db, force_sync=force, days_behind=days_behind)
@@ -2262,9 +2262,15 @@ async def get_calendar_events(
         CalendarEvent.start_date <= end_date
     ).order_by(CalendarEvent.start_date).all()
 
-    # Add revision slot counts
+    # Add revision slot counts, grouped in SQL for every event at once (the
+    # response only needs the count, not the slot rows)
+    slot_counts = dict(
+        db.query(ExamRevisionSlot.calendar_event_id, func.count(ExamRevisionSlot.id)).filter(
+            ExamRevisionSlot.calendar_event_id.in_([event.id for event in events])
+        ).group_by(ExamRevisionSlot.calendar_event_id).all()
+    ) if events else {}
     for event in events:
-        event.revision_slot_count = len(event.revision_slots) if event.revision_slots else 0
+        event.revision_slot_count = slot_counts.get(event.id, 0)
 
     return events
 
@@ -2385,7 +2391,9 @@ async def update_calendar_event(
     db.commit()
     db.refresh(event)
 
-    event.revision_slot_count = len(event.revision_slots) if event.revision_slots else 0
+    event.revision_slot_count = db.query(func.count(ExamRevisionSlot.id)).filter(
+        ExamRevisionSlot.calendar_event_id == event.id
+    ).scalar()
     logger.info(f"Updated calendar event {event.id} by {current_user.user_email}")
     return event
 
@@ -2408,18 +2416,19 @@ async def delete_calendar_event(
     """
     from services.google_calendar_service import GoogleCalendarService
 
-    event = db.query(CalendarEvent).options(
-        joinedload(CalendarEvent.revision_slots)
-    ).filter(CalendarEvent.id == event_id).first()
+    event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
 
     if not event:
         raise HTTPException(status_code=404, detail="Calendar event not found")
 
     # Block deletion if event has revision slots
-    if event.revision_slots and len(event.revision_slots) > 0:
+    slot_count = db.query(func.count(ExamRevisionSlot.id)).filter(
+        ExamRevisionSlot.calendar_event_id == event_id
+    ).scalar()
+    if slot_count > 0:
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot delete: event has {len(event.revision_slots)} revision slot(s). Remove them first."
+            detail=f"Cannot delete: event has {slot_count} revision slot(s). Remove them first."
         )
 
     try:
@@ -285,7 +285,7 @@ async def get_students(
         query = query.filter(Student.lang_stream == lang_stream)
 
     if tutor_id is not None:
-        active, _, _ = get_active_enrollment_objects(db, location=location)
+        active, _, _ = get_active_enrollment_objects(db, location=location, with_relations=False)
         matching_ids = {e.student_id for e in active if e.tutor_id == tutor_id}
         if not matching_ids:
             return []
@@ -18,6 +18,7 @@ from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from utils.cache_invalidation import mark_written
 
 logger = logging.getLogger(__name__)
 
@@ -656,6 +657,8 @@ def sync_calendar_events(db: Session, force_sync: bool = False, days_behind: int
                         last_synced_at = VALUES(last_synced_at)
                 """)
                 db.execute(sql, params)
+                # Raw SQL bypasses the ORM commit hook that clears cached views
+                mark_written(db, CalendarEvent)
 
             logger.debug(f"Calendar sync bulk upsert: {time.time() - commit_start:.2f}s")
             synced_count = len(valid_events)
@@ -21,6 +21,8 @@ os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-testing-only")
 
 from database import Base, get_db
 from main import app
+from routers.enrollments import clear_enrollment_list_cache
+from routers.exam_revision import clear_exam_revision_cache
 
 
 # In-memory SQLite for fast tests (no external DB dependency)
@@ -42,6 +44,9 @@ def db_session() -> Generator[Session, None, None]:
     """
     # Create all tables
     Base.metadata.create_all(bind=test_engine)
+    # Per-process list caches would otherwise leak rows between test databases
+    clear_enrollment_list_cache()
+    clear_exam_revision_cache()
 
     session = TestingSessionLocal()
     try:
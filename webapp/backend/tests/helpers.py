@@ -1,7 +1,34 @@
 """Shared test helpers."""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
 from auth.jwt_handler import create_access_token
 
 
 def make_auth_token(tutor_id: int) -> str:
     """Create a JWT token for a test tutor."""
     return create_access_token({"sub": str(tutor_id)})
+
+
+@contextmanager
+def capture_queries(engine: Engine) -> Iterator[List[str]]:
+    """Record every SQL statement the engine executes inside the block.
+
+    Usage:
+        with capture_queries(db_session.get_bind()) as queries:
+            ...
+        assert len(queries) <= 3
+    """
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
@@ -35,6 +35,7 @@ from routers.enrollments import (
 from constants import PER_TWO_LESSONS_DISCOUNT_TYPE
 from models import Holiday, Enrollment, Tutor, Student, SessionLog
 from schemas import SessionPreview
+from sqlalchemy import text
 
 
 # ============================================================================
@@ -1148,3 +1149,375 @@ class TestComputeDiscountValue:
     def test_none_discount(self):
         assert compute_discount_value(None, 10) == 0
         assert discount_requires_min_lessons(None) is False
+
+
+# ============================================================================
+# Test keyset pagination on GET /enrollments
+# ============================================================================
+
+class TestEnrollmentListCursor:
+    """Cursor pages follow the (first_lesson_date DESC, id DESC) ordering."""
+
+    @pytest.fixture(autouse=True)
+    def _override_auth(self):
+        admin = Tutor(id=99, user_email="admin@test.com", tutor_name="Mr Admin", role="Admin")
+        app.dependency_overrides[get_current_user] = lambda: admin
+        yield
+        app.dependency_overrides.pop(get_current_user, None)
+
+    def _seed(self, db_session):
+        tutor = Tutor(user_email="t@test.com", tutor_name="Tutor A", role="Tutor")
+        student = Student(student_name="Student A", home_location="MSA", school_student_id="1001")
+        db_session.add_all([tutor, student])
+        db_session.flush()
+        # Two rows share a date so the id tiebreak is exercised; one is undated.
+        for first_lesson in [date(2026, 3, 2), date(2026, 3, 9), date(2026, 3, 9), date(2026, 3, 16), None]:
+            db_session.add(Enrollment(
+                student_id=student.id, tutor_id=tutor.id, first_lesson_date=first_lesson,
+                assigned_day="Monday", assigned_time="15:00 - 16:30", location="MSA",
+                lessons_paid=6, enrollment_type="Regular",
+            ))
+        db_session.commit()
+
+    def test_cursor_pages_match_single_page(self, client, db_session):
+        self._seed(db_session)
+        full = client.get("/api/enrollments", params={"limit": 10}, cookies=AUTH_COOKIE)
+        assert full.status_code == 200
+        expected = [e["id"] for e in full.json()]
+        assert "X-Next-Cursor" not in full.headers
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            resp = client.get("/api/enrollments", params=params, cookies=AUTH_COOKIE)
+            assert resp.status_code == 200
+            seen.extend(e["id"] for e in resp.json())
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert seen == expected
+        assert len(seen) == 5
+
+    def test_invalid_cursor_rejected(self, client, db_session):
+        resp = client.get("/api/enrollments", params={"cursor": "not-a-cursor"}, cookies=AUTH_COOKIE)
+        assert resp.status_code == 400
+
+
+# ============================================================================
+# Test get_active_enrollment_objects() eager-load switch
+# ============================================================================
+
+from routers.enrollments import get_active_enrollment_objects, clear_enrollment_list_cache
+from tests.helpers import capture_queries
+
+
+class TestActiveEnrollmentObjectsRelations:
+    """with_relations=False must not join student/tutor/discount."""
+
+    def _seed(self, db_session):
+        tutor = Tutor(user_email="t@test.com", tutor_name="Tutor A", role="Tutor")
+        student = Student(student_name="Student A", home_location="MSA", school_student_id="1001")
+        db_session.add_all([tutor, student])
+        db_session.flush()
+        db_session.add(Enrollment(
+            student_id=student.id, tutor_id=tutor.id, first_lesson_date=None,
+            assigned_day="Monday", assigned_time="15:00 - 16:30", location="MSA",
+            lessons_paid=6, enrollment_type="Regular", payment_status="Paid",
+        ))
+        db_session.commit()
+        ids = (student.id, tutor.id)
+        db_session.expunge_all()
+        return ids
+
+    def _enrollment_select(self, queries):
+        return next(q for q in queries if "FROM enrollments" in q)
+
+    def test_ids_only_skips_joins(self, db_session):
+        ids = self._seed(db_session)
+        with capture_queries(db_session.get_bind()) as queries:
+            active, _, _ = get_active_enrollment_objects(db_session, with_relations=False)
+        assert [(e.student_id, e.tutor_id) for e in active] == [ids]
+        select = self._enrollment_select(queries)
+        assert "JOIN students" not in select
+        assert "JOIN discounts" not in select
+
+    def test_default_loads_relations(self, db_session):
+        self._seed(db_session)
+        with capture_queries(db_session.get_bind()) as queries:
+            get_active_enrollment_objects(db_session)
+        assert "JOIN students" in self._enrollment_select(queries)
+
+    def test_both_paths_keep_enrollment_without_student_row(self, db_session):
+        student_id, tutor_id = self._seed(db_session)
+        db_session.add(Enrollment(
+            student_id=student_id + 1000, tutor_id=tutor_id, first_lesson_date=None,
+            assigned_day="Monday", assigned_time="15:00 - 16:30", location="MSA",
+            lessons_paid=6, enrollment_type="Regular", payment_status="Paid",
+        ))
+        db_session.commit()
+        db_session.expunge_all()
+
+        ids_only, _, _ = get_active_enrollment_objects(db_session, with_relations=False)
+        with_relations, _, _ = get_active_enrollment_objects(db_session)
+        assert len(ids_only) == 2
+        assert sorted(e.id for e in with_relations) == sorted(e.id for e in ids_only)
+
+
+# ============================================================================
+# Test list endpoint response shaping
+# ============================================================================
+
+class TestEnrollmentListResponses:
+    """Batch-built list rows carry the same display fields as the detail view."""
+
+    @pytest.fixture(autouse=True)
+    def _override_auth(self):
+        admin = Tutor(id=99, user_email="admin@test.com", tutor_name="Mr Admin", role="Admin")
+        app.dependency_overrides[get_current_user] = lambda: admin
+        yield
+        app.dependency_overrides.pop(get_current_user, None)
+
+    def _seed(self, db_session):
+        tutor = Tutor(user_email="t@test.com", tutor_name="Tutor A", role="Tutor")
+        discount = Discount(discount_name="Coupon $300", discount_value=300, is_active=True)
+        db_session.add_all([tutor, discount])
+        db_session.flush()
+        for name in ["Zoe", "Amy"]:
+            student = Student(student_name=name, grade="F2", school="SCH", home_location="MSA")
+            db_session.add(student)
+            db_session.flush()
+            db_session.add(Enrollment(
+                student_id=student.id, tutor_id=tutor.id, first_lesson_date=None,
+                assigned_day="Monday", assigned_time="15:00 - 16:30", location="MSA",
+                lessons_paid=6, enrollment_type="Regular", payment_status="Paid",
+                discount_id=discount.id,
+            ))
+        db_session.commit()
+        return tutor
+
+    def test_my_students_rows(self, client, db_session):
+        tutor = self._seed(db_session)
+        resp = client.get("/api/enrollments/my-students", params={"tutor_id": tutor.id}, cookies=AUTH_COOKIE)
+        assert resp.status_code == 200
+        rows = resp.json()
+        assert [r["student_name"] for r in rows] == ["Amy", "Zoe"]
+        assert all(r["tutor_name"] == "Tutor A" for r in rows)
+        assert all(r["discount_name"] == "Coupon $300" for r in rows)
+        assert all(r["grade"] == "F2" and r["school"] == "SCH" for r in rows)
+
+    def test_active_rows(self, client, db_session):
+        self._seed(db_session)
+        resp = client.get("/api/enrollments/active", cookies=AUTH_COOKIE)
+        assert resp.status_code == 200
+        assert [r["student_name"] for r in resp.json()] == ["Amy", "Zoe"]
+
+    def test_rolled_back_write_keeps_cached_list(self, client, db_session):
+        self._seed(db_session)
+        first = client.get("/api/enrollments/active", cookies=AUTH_COOKIE).json()
+
+        db_session.query(Enrollment).update({"lessons_paid": 12})
+        db_session.rollback()
+        with capture_queries(db_session.get_bind()) as queries:
+            assert client.get("/api/enrollments/active", cookies=AUTH_COOKIE).json() == first
+        assert not [q for q in queries if "FROM enrollments" in q]
+
+    def test_student_rename_clears_cached_list(self, client, db_session):
+        self._seed(db_session)
+        resp = client.get("/api/enrollments/active", cookies=AUTH_COOKIE)
+        amy_id = next(r["student_id"] for r in resp.json() if r["student_name"] == "Amy")
+
+        resp = client.patch(f"/api/students/{amy_id}", json={"student_name": "Ann"}, cookies=AUTH_COOKIE)
+        assert resp.status_code == 200, resp.text
+        resp = client.get("/api/enrollments/active", cookies=AUTH_COOKIE)
+        assert sorted(r["student_name"] for r in resp.json()) == ["Ann", "Zoe"]
+
+    def test_overdue_most_overdue_first(self, client, db_session):
+        tutor = Tutor(user_email="t@test.com", tutor_name="Tutor A", role="Tutor")
+        student = Student(student_name="Amy", home_location="MSA")
+        db_session.add_all([tutor, student])
+        db_session.flush()
+        today = date.today()
+        for days_ago in [3, 10, 0]:
+            db_session.add(Enrollment(
+                student_id=student.id, tutor_id=tutor.id,
+                first_lesson_date=today - timedelta(days=days_ago),
+                assigned_day="Monday", assigned_time="15:00 - 16:30", location="MSA",
+                lessons_paid=6, enrollment_type="Regular", payment_status="Pending Payment",
+            ))
+        db_session.commit()
+        resp = client.get("/api/enrollments/overdue", cookies=AUTH_COOKIE)
+        assert resp.status_code == 200
+        days = [r["days_overdue"] for r in resp.json()]
+        assert days == sorted(days, reverse=True)
+        assert len(days) == 3
+        assert {(r["student_name"], r["tutor_name"]) for r in resp.json()} == {("Amy", "Tutor A")}
+
+    def test_list_select_trims_student_and_tutor_columns(self, client, db_session):
+        self._seed(db_session)
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/enrollments", cookies=AUTH_COOKIE)
+        assert resp.status_code == 200
+        assert resp.json()[0]["student_name"] in {"Amy", "Zoe"}
+        select = next(q for q in queries if "FROM enrollments" in q)
+        assert "students_1.student_name" in select
+        assert "students_1.phone" not in select
+        assert "tutors_1.user_email" not in select
+
+    def test_my_students_paging(self, client, db_session):
+        tutor = self._seed(db_session)
+        resp = client.get(
+            "/api/enrollments/my-students",
+            params={"tutor_id": tutor.id, "limit": 1, "offset": 1},
+            cookies=AUTH_COOKIE,
+        )
+        assert resp.status_code == 200
+        assert [r["student_name"] for r in resp.json()] == ["Zoe"]
+        assert resp.headers["X-Total-Count"] == "2"
+
+    def test_computed_lists_unpaged_by_default(self, client, db_session):
+        tutor = self._seed(db_session)
+        for path, params in [
+            ("/api/enrollments/active", {}),
+            ("/api/enrollments/my-students", {"tutor_id": tutor.id}),
+        ]:
+            resp = client.get(path, params=params, cookies=AUTH_COOKIE)
+            assert resp.status_code == 200
+            assert len(resp.json()) == 2
+            assert resp.headers["X-Total-Count"] == "2"
+
+        # No default page size: omitting limit must never truncate the list
+        for path in ["/enrollments/active", "/enrollments/my-students", "/enrollments/overdue"]:
+            params = app.openapi()["paths"][f"/api{path}"]["get"]["parameters"]
+            limit = next(p for p in params if p["name"] == "limit")
+            assert not limit["required"]
+            assert limit["schema"].get("default") is None
+
+    def test_computed_list_limit_capped(self, client, db_session):
+        resp = client.get("/api/enrollments/active", params={"limit": 5000}, cookies=AUTH_COOKIE)
+        assert resp.status_code == 422
+
+    def test_active_list_cached_until_write(self, client, db_session):
+        self._seed(db_session)
+        first = client.get("/api/enrollments/active", cookies=AUTH_COOKIE).json()
+        amy = next(r for r in first if r["student_name"] == "Amy")
+
+        # Raw SQL bypasses the ORM commit hook, so it is served from cache...
+        db_session.execute(text("UPDATE enrollments SET lessons_paid = 12 WHERE id = :id"), {"id": amy["id"]})
+        db_session.commit()
+        cached = client.get("/api/enrollments/active", cookies=AUTH_COOKIE).json()
+        assert next(r for r in cached if r["id"] == amy["id"])["lessons_paid"] == 6
+
+        # ...while a committed ORM write from anywhere clears it...
+        db_session.query(Enrollment).filter(Enrollment.id == amy["id"]).update({"lessons_paid": 10})
+        db_session.commit()
+        fresh = client.get("/api/enrollments/active", cookies=AUTH_COOKIE).json()
+        assert next(r for r in fresh if r["id"] == amy["id"])["lessons_paid"] == 10
+
+        # ...and so does a write through the router.
+        app.dependency_overrides[require_admin_write] = lambda: Tutor(
+            id=99, user_email="admin@test.com", tutor_name="Mr Admin", role="Admin"
+        )
+        try:
+            resp = client.patch(f"/api/enrollments/{amy['id']}", json={"lessons_paid": 8}, cookies=AUTH_COOKIE)
+        finally:
+            app.dependency_overrides.pop(require_admin_write, None)
+        assert resp.status_code == 200
+        fresh = client.get("/api/enrollments/active", cookies=AUTH_COOKIE).json()
+        assert next(r for r in fresh if r["id"] == amy["id"])["lessons_paid"] == 8
+
+    def test_update_reassigns_tutor_in_response(self, client, db_session):
+        self._seed(db_session)
+        other = Tutor(user_email="b@test.com", tutor_name="Tutor B", role="Tutor")
+        db_session.add(other)
+        db_session.commit()
+        enrollment = db_session.query(Enrollment).first()
+        app.dependency_overrides[require_admin_write] = lambda: Tutor(
+            id=99, user_email="admin@test.com", tutor_name="Mr Admin", role="Admin"
+        )
+        try:
+            with capture_queries(db_session.get_bind()) as queries:
+                resp = client.patch(
+                    f"/api/enrollments/{enrollment.id}",
+                    json={"tutor_id": other.id, "lessons_paid": 10},
+                    cookies=AUTH_COOKIE,
+                )
+        finally:
+            app.dependency_overrides.pop(require_admin_write, None)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["tutor_name"] == "Tutor B"
+        assert body["lessons_paid"] == 10
+        assert body["student_name"] in {"Amy", "Zoe"}
+        # No post-commit reload of the enrollment
+        enrollment_selects = [q for q in queries if q.lstrip().startswith("SELECT") and "FROM enrollments" in q]
+        assert len(enrollment_selects) == 1
+
+
+# ============================================================================
+# Statement budgets per endpoint (guards against N+1 regressions)
+# ============================================================================
+
+class TestEnrollmentQueryCounts:
+    """Statement counts must not grow with the number of rows returned."""
+
+    @pytest.fixture(autouse=True)
+    def _override_auth(self):
+        admin = Tutor(id=99, user_email="admin@test.com", tutor_name="Mr Admin", role="Admin")
+        app.dependency_overrides[get_current_user] = lambda: admin
+        app.dependency_overrides[require_admin_write] = lambda: admin
+        yield
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(require_admin_write, None)
+
+    def _seed(self, db_session, count, start=0):
+        discount = Discount(discount_name="Coupon $300", discount_value=300, is_active=True)
+        db_session.add(discount)
+        db_session.flush()
+        today = date.today()
+        for i in range(start, start + count):
+            tutor = Tutor(user_email=f"t{i}@test.com", tutor_name=f"Tutor {i}", role="Tutor")
+            student = Student(student_name=f"Student {i}", home_location="MSA")
+            db_session.add_all([tutor, student])
+            db_session.flush()
+            db_session.add(Enrollment(
+                student_id=student.id, tutor_id=tutor.id, first_lesson_date=today - timedelta(days=i),
+                assigned_day="Monday", assigned_time="15:00 - 16:30", location="MSA",
+                lessons_paid=6, enrollment_type="Regular", payment_status="Pending Payment",
+                discount_id=discount.id,
+            ))
+        db_session.commit()
+        db_session.expunge_all()
+
+    def _count(self, client, db_session, method, url, **kwargs):
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.request(method, url, cookies=AUTH_COOKIE, **kwargs)
+        assert resp.status_code == 200, resp.text
+        return len(queries)
+
+    @pytest.mark.parametrize("url", [
+        "/api/enrollments",
+        "/api/enrollments/active",
+        "/api/enrollments/overdue",
+    ])
+    def test_list_endpoints_constant(self, client, db_session, url):
+        self._seed(db_session, 2)
+        small = self._count(client, db_session, "GET", url)
+        self._seed(db_session, 6, start=2)
+        clear_enrollment_list_cache()
+        large = self._count(client, db_session, "GET", url)
+        assert large == small
+
+    def test_detail_and_update_budgets(self, client, db_session):
+        self._seed(db_session, 1)
+        enrollment_id = db_session.query(Enrollment.id).scalar()
+        db_session.expunge_all()
+        # Enrollment with joins + holidays for the effective end date
+        assert self._count(client, db_session, "GET", f"/api/enrollments/{enrollment_id}") <= 2
+        db_session.expunge_all()
+        # Fetch + holidays + UPDATE; no post-commit reload
+        assert self._count(
+            client, db_session, "PATCH", f"/api/enrollments/{enrollment_id}", json={"lessons_paid": 8}
+        ) <= 3
@@ -5,7 +5,9 @@ Covers:
 - _parse_time_slot() — time string to minutes conversion
 - _times_overlap() — overlap detection between two time slots
 - _is_session_consumable() — whether a session can be consumed for revision enrollment
+- eligible-students endpoints — batched session lookup and response contents
 """
+import inspect
 import pytest
 from datetime import date, timedelta
 from constants import hk_now
@@ -15,14 +17,22 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
-from routers.exam_revision import _parse_time_slot, _times_overlap, _is_session_consumable
-from constants import PENDING_MAKEUP_STATUSES, SCHEDULABLE_STATUSES, SessionStatus
+from routers.exam_revision import (
+    _parse_time_slot, _times_overlap, _is_session_consumable, clear_exam_revision_cache,
+    _build_student_filters_from_event, _overlapping, _REVERT_STATUS, router,
+    _get_consumable_sessions_by_student, _event_student_match_conditions,
+    _CONSUMABLE_SESSION_FILTER, _etag_matches,
+)
+from constants import MAKEUP_BOOKED_STATUSES, PENDING_MAKEUP_STATUSES, SCHEDULABLE_STATUSES, SessionStatus
+from schemas import EnrolledStudentInfo, ExamRevisionSlotResponse
 from models import (
     ExamRevisionSlot, CalendarEvent, SessionLog, Student, Tutor, Enrollment,
 )
-from tests.helpers import make_auth_token
+from tests.helpers import make_auth_token, capture_queries
+from main import app
 
 
 class TestParseTimeSlot:
@@ -56,6 +66,16 @@ class TestParseTimeSlot:
         """Midnight: '00:00 - 01:00'."""
         assert _parse_time_slot("00:00 - 01:00") == (0, 60)
 
+    def test_padding_around_times(self):
+        """Extra whitespace around either time is tolerated."""
+        assert _parse_time_slot(" 16:45  -  18:15 ") == (1005, 1095)
+
+    def test_malformed_parts_return_zero(self):
+        """Non-numeric parts, extra ranges or a bare hyphen return (0, 0)."""
+        assert _parse_time_slot("1a:00 - 10:00") == (0, 0)
+        assert _parse_time_slot("09:00 - 10:00 - 11:00") == (0, 0)
+        assert _parse_time_slot("09:00-10:00") == (0, 0)
+
 
 class TestTimesOverlap:
     """Test suite for _times_overlap function."""
@@ -93,6 +113,27 @@ class TestTimesOverlap:
         assert _times_overlap("invalid", "bad") is False
 
 
+class TestOverlapping:
+    """Test suite for _overlapping function."""
+
+    def _items(self, *slots):
+        return [MagicMock(time_slot=slot) for slot in slots]
+
+    def test_keeps_input_order(self):
+        """Overlapping items are returned in the order given."""
+        items = self._items("17:00 - 18:00", "09:00 - 10:00", "16:00 - 17:30")
+        assert _overlapping("16:30 - 17:30", items) == [items[0], items[2]]
+
+    def test_adjacent_and_invalid_excluded(self):
+        """Touching slots and unparseable candidates never overlap."""
+        items = self._items("15:00 - 16:00", "bad", "18:00 - 19:00")
+        assert _overlapping("16:00 - 18:00", items) == []
+
+    def test_invalid_target(self):
+        """An unparseable target overlaps nothing."""
+        assert _overlapping("invalid", self._items("09:00 - 10:00")) == []
+
+
 class TestIsSessionConsumable:
     """Test suite for _is_session_consumable function."""
 
@@ -138,6 +179,43 @@ class TestIsSessionConsumable:
         session = self._mock_session("Cancelled")
         assert _is_session_consumable(session) is False
 
+    def test_explicit_today(self):
+        """A caller-supplied today replaces the clock for the future-date check."""
+        session_date = hk_now().date() + timedelta(days=3)
+        for status in SCHEDULABLE_STATUSES:
+            session = self._mock_session(status, session_date=session_date)
+            assert _is_session_consumable(session, today=session_date - timedelta(days=1)) is True
+            assert _is_session_consumable(session, today=session_date) is False
+
+
+class TestBuildStudentFilters:
+    """Test suite for _build_student_filters_from_event."""
+
+    def _event(self, school="SCH", grade="F5", academic_stream=None):
+        e = MagicMock()
+        e.school, e.grade, e.academic_stream = school, grade, academic_stream
+        return e
+
+    def test_stream_only_applied_to_senior_forms(self):
+        """Academic stream filters F4-F6 events but is ignored for F3."""
+        assert len(_build_student_filters_from_event(self._event(academic_stream="Science"))) == 3
+        assert len(_build_student_filters_from_event(self._event(grade="F3", academic_stream="Science"))) == 2
+
+    def test_empty_criteria_no_filters(self):
+        """An event without school/grade matches every student."""
+        assert _build_student_filters_from_event(self._event(school=None, grade=None)) == ()
+
+    def test_same_criteria_reuse_expressions(self):
+        """Distinct events with identical criteria share the cached filters."""
+        first = _build_student_filters_from_event(self._event())
+        second = _build_student_filters_from_event(self._event())
+        assert first is second
+
+    def test_event_match_conditions_built_once(self):
+        """The column-wise event/student join conditions are shared across count queries."""
+        assert _event_student_match_conditions() is _event_student_match_conditions()
+        assert len(_event_student_match_conditions()) == 3
+
 
 class TestEnrollStudentInheritsFromConsumedSession:
     """
@@ -287,3 +365,1388 @@ class TestEnrollStudentInheritsFromConsumedSession:
         ).one()
         assert revision.financial_status == "Unpaid"
         assert revision.enrollment_id == ctx["target_enrollment"].id
+
+
+    def test_response_reloads_both_sessions_together(self, client, db_session):
+        """Both response sessions come back fully built from one post-commit reload."""
+        ctx = self._seed(db_session)
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(
+                f"/api/exam-revision/slots/{ctx['slot'].id}/enroll",
+                json={
+                    "student_id": ctx["student"].id,
+                    "consume_session_id": ctx["consumed"].id,
+                },
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["revision_session"]["make_up_for_id"] == ctx["consumed"].id
+        assert body["revision_session"]["student_name"] == "Test Student"
+        assert body["revision_session"]["tutor_name"] == "Mr Test Tutor"
+        assert body["consumed_session"]["id"] == ctx["consumed"].id
+        assert body["consumed_session"]["session_status"] == SessionStatus.RESCHEDULED_BOOKED.value
+
+        # One reload statement fetches both sessions by ID after the commit
+        tutor_name_reads = [
+            q for q in queries
+            if q.startswith("SELECT session_log") and "tutors_1.tutor_name" in q
+        ]
+        assert len(tutor_name_reads) == 1
+        assert "session_log.id IN (" in tutor_name_reads[0]
+
+        # Exercises are only joined by the post-commit reload, not the validation lookup
+        exercise_loads = [q for q in queries if q.startswith("SELECT") and "session_exercises" in q]
+        assert len(exercise_loads) == 1
+        assert "IN (" in exercise_loads[0]
+        # The response builder's extension request and enrollment come with
+        # the reload instead of being lazy-loaded per session afterwards
+        assert not [q for q in queries if q.startswith("SELECT extension_requests")]
+        assert "extension_requests_1" in tutor_name_reads[0]
+
+    def test_duplicate_enrollment_rejected_without_loading_slot_sessions(self, client, db_session):
+        """A second enroll for the same student is refused by an EXISTS probe."""
+        ctx = self._seed(db_session)
+        url = f"/api/exam-revision/slots/{ctx['slot'].id}/enroll"
+        payload = {"student_id": ctx["student"].id, "consume_session_id": ctx["consumed"].id}
+        cookies = {"access_token": ctx["token"]}
+        assert client.post(url, json=payload, cookies=cookies).status_code == 200
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(url, json=payload, cookies=cookies)
+        assert resp.status_code == 400
+        assert "already enrolled" in resp.json()["detail"]
+
+        # The slot read carries the duplicate check as an EXISTS column; the
+        # slot's sessions are never loaded, and nothing else runs before the 400
+        slot_loads = [q for q in queries if "FROM exam_revision_slots" in q]
+        assert len(slot_loads) == 1
+        assert "EXISTS" in slot_loads[0]
+        assert "JOIN session_log" not in slot_loads[0]
+        assert len([q for q in queries if q.startswith("SELECT")]) == 2  # auth user + slot
+
+    def test_slot_student_constraint_backs_up_enrolled_check(self, client, db_session):
+        """A cancelled session left in the slot passes the EXISTS but not the unique constraint."""
+        ctx = self._seed(db_session)
+        slot = ctx["slot"]
+        db_session.add(SessionLog(
+            enrollment_id=ctx["target_enrollment"].id, student_id=ctx["student"].id,
+            tutor_id=slot.tutor_id, session_date=slot.session_date,
+            time_slot=slot.time_slot, location=slot.location,
+            session_status=SessionStatus.CANCELLED.value, exam_revision_slot_id=slot.id,
+        ))
+        db_session.commit()
+
+        resp = client.post(
+            f"/api/exam-revision/slots/{ctx['slot'].id}/enroll",
+            json={"student_id": ctx["student"].id, "consume_session_id": ctx["consumed"].id},
+            cookies={"access_token": ctx["token"]},
+        )
+        assert resp.status_code == 400
+        assert "already enrolled" in resp.json()["detail"]
+        db_session.expire_all()
+        assert db_session.get(SessionLog, ctx["consumed"].id).session_status == (
+            SessionStatus.RESCHEDULED_PENDING.value
+        )
+
+    def test_remove_enrollment_reads_both_sessions_together(self, client, db_session):
+        """Removing an enrollment fetches the revision and consumed sessions in one query."""
+        ctx = self._seed(db_session)
+        cookies = {"access_token": ctx["token"]}
+        slot_id, consumed_id = ctx["slot"].id, ctx["consumed"].id
+        resp = client.post(
+            f"/api/exam-revision/slots/{slot_id}/enroll",
+            json={"student_id": ctx["student"].id, "consume_session_id": consumed_id},
+            cookies=cookies,
+        )
+        assert resp.status_code == 200, resp.text
+        revision_id = resp.json()["revision_session"]["id"]
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.delete(
+                f"/api/exam-revision/slots/{slot_id}/enrollments/{revision_id}", cookies=cookies
+            )
+        assert resp.status_code == 200, resp.text
+        session_reads = [q for q in queries if q.startswith("SELECT session_log")]
+        assert len(session_reads) == 1
+        assert "LEFT OUTER JOIN session_log AS session_log_1" in session_reads[0]
+
+        db_session.expire_all()
+        assert db_session.get(SessionLog, revision_id) is None
+        consumed = db_session.get(SessionLog, consumed_id)
+        assert consumed.session_status == SessionStatus.RESCHEDULED_PENDING.value
+        assert consumed.rescheduled_to_id is None
+
+    def test_enroll_skips_separate_student_fetch(self, client, db_session):
+        """The consumed session's owner check stands in for a student lookup."""
+        ctx = self._seed(db_session)
+        url = f"/api/exam-revision/slots/{ctx['slot'].id}/enroll"
+        payload = {"student_id": ctx["student"].id, "consume_session_id": ctx["consumed"].id}
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(url, json=payload, cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        assert not [q for q in queries if q.startswith("SELECT students")]
+
+    def test_enroll_stamps_both_sessions_with_one_timestamp(self, client, db_session):
+        """The revision session and the consumed session share a modification time."""
+        ctx = self._seed(db_session)
+        consumed_id = ctx["consumed"].id
+        resp = client.post(
+            f"/api/exam-revision/slots/{ctx['slot'].id}/enroll",
+            json={"student_id": ctx["student"].id, "consume_session_id": consumed_id},
+            cookies={"access_token": ctx["token"]},
+        )
+        assert resp.status_code == 200, resp.text
+        revision_id = resp.json()["revision_session"]["id"]
+
+        db_session.expire_all()
+        revision = db_session.get(SessionLog, revision_id)
+        consumed = db_session.get(SessionLog, consumed_id)
+        assert revision.last_modified_time is not None
+        assert revision.last_modified_time == consumed.last_modified_time
+
+
+class TestEligibleStudents:
+    """Integration tests for the eligible-students endpoints."""
+
+    def _seed(self, db_session: Session, n_students: int = 3, tag: str = "EL"):
+        """
+        Seed a tutor, an exam event with one revision slot, and ``n_students``
+        matching students each with an active enrollment, one pending make-up
+        and one future scheduled session at the slot's location. A further
+        session at another location must never be offered.
+        """
+        tutor = Tutor(
+            user_email=f"{tag.lower()}@test.com", tutor_name="Ms Eligible",
+            role="Tutor", default_location="Main Center",
+        )
+        db_session.add(tutor)
+        db_session.commit()
+
+        event = CalendarEvent(
+            event_id=f"evt-{tag.lower()}", title="F2 Maths Exam",
+            start_date=date.today() + timedelta(days=14),
+            school=f"{tag} School", grade="F2", event_type="Exam",
+        )
+        db_session.add(event)
+        db_session.commit()
+
+        slot = ExamRevisionSlot(
+            calendar_event_id=event.id,
+            session_date=date.today() + timedelta(days=7),
+            time_slot="17:00 - 18:30", tutor_id=tutor.id,
+            location="Main Center",
+        )
+        db_session.add(slot)
+        db_session.commit()
+
+        students = []
+        for i in range(n_students):
+            student = Student(
+                school_student_id=f"{tag}{i:03d}", student_name=f"Eligible {tag} {i}",
+                grade="F2", school=f"{tag} School",
+            )
+            db_session.add(student)
+            db_session.commit()
+            enrollment = Enrollment(
+                student_id=student.id, tutor_id=tutor.id,
+                assigned_day="Monday", assigned_time="15:00 - 16:30",
+                location="Main Center", lessons_paid=10,
+                first_lesson_date=date.today() - timedelta(days=30),
+                payment_status="Paid", enrollment_type="Regular",
+            )
+            db_session.add(enrollment)
+            db_session.commit()
+            db_session.add_all([
+                SessionLog(
+                    enrollment_id=enrollment.id, student_id=student.id,
+                    tutor_id=tutor.id, session_date=date.today() + timedelta(days=3),
+                    time_slot="15:00 - 16:30", location="Main Center",
+                    session_status=SessionStatus.SCHEDULED.value,
+                ),
+                SessionLog(
+                    enrollment_id=enrollment.id, student_id=student.id,
+                    tutor_id=tutor.id, session_date=date.today() - timedelta(days=4),
+                    time_slot="15:00 - 16:30", location="Main Center",
+                    session_status=SessionStatus.RESCHEDULED_PENDING.value,
+                ),
+                SessionLog(
+                    enrollment_id=enrollment.id, student_id=student.id,
+                    tutor_id=tutor.id, session_date=date.today() - timedelta(days=2),
+                    time_slot="15:00 - 16:30", location="Other Center",
+                    session_status=SessionStatus.RESCHEDULED_PENDING.value,
+                ),
+            ])
+            db_session.commit()
+            students.append(student)
+
+        return {
+            "token": make_auth_token(tutor.id), "tutor": tutor,
+            "event": event, "slot": slot, "students": students,
+        }
+
+    def test_slot_lists_each_students_own_sessions(self, client, db_session):
+        """Batched session lookup still returns every student's own sessions, date-ordered."""
+        ctx = self._seed(db_session)
+
+        resp = client.get(
+            f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students",
+            cookies={"access_token": ctx["token"]},
+        )
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert [s["school_student_id"] for s in data] == ["EL000", "EL001", "EL002"]
+        for row in data:
+            sessions = row["pending_sessions"]
+            assert len(sessions) == 2
+            assert all(s["location"] == "Main Center" for s in sessions)
+            assert sessions[0]["session_date"] < sessions[1]["session_date"]
+            assert row["enrollment_tutor_name"] == "Ms Eligible"
+            assert row["is_past_deadline"] is False
+            assert set(sessions[0]) == {
+                "id", "session_date", "time_slot", "session_status",
+                "tutor_name", "location", "root_original_session_date",
+            }
+
+        owned = {
+            s.id: s.student_id
+            for s in db_session.query(SessionLog).all()
+        }
+        for row in data:
+            assert {owned[s["id"]] for s in row["pending_sessions"]} == {row["student_id"]}
+
+    def test_all_enrolled_stops_after_candidate_query(self, client, db_session):
+        """Once every matching student is enrolled, no per-candidate lookups run."""
+        ctx = self._seed(db_session, n_students=2, tag="FU")
+        slot = ctx["slot"]
+        for student in ctx["students"]:
+            db_session.add(SessionLog(
+                student_id=student.id, tutor_id=ctx["tutor"].id,
+                session_date=slot.session_date, time_slot=slot.time_slot,
+                location=slot.location, session_status="Make-up Class",
+                exam_revision_slot_id=slot.id,
+            ))
+        db_session.commit()
+        url = f"/api/exam-revision/slots/{slot.id}/eligible-students"
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(url, cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        assert resp.json() == []
+        assert resp.headers["X-Total-Count"] == "0"
+        assert not any("UNION ALL" in q for q in queries)  # consumable fetch
+        assert not any(q.startswith("SELECT enrollments") for q in queries)  # deadlines
+
+    def test_candidates_selected_as_display_columns(self, client, db_session):
+        """The candidate query reads only the displayed student columns."""
+        ctx = self._seed(db_session, n_students=2, tag="CO")
+        cookies = {"access_token": ctx["token"]}
+
+        for url in (
+            f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students",
+            f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students",
+        ):
+            with capture_queries(db_session.get_bind()) as queries:
+                resp = client.get(url, cookies=cookies)
+            assert resp.status_code == 200, resp.text
+            assert [row["student_name"] for row in resp.json()] == ["Eligible CO 0", "Eligible CO 1"]
+            candidate_query = next(q for q in queries if q.startswith("SELECT") and "FROM students" in q)
+            assert "students.school_student_id" in candidate_query
+            assert "students.phone" not in candidate_query
+
+    def test_renewed_student_listed_once_without_distinct(self, client, db_session):
+        """A second active enrollment doesn't duplicate the student or force DISTINCT."""
+        ctx = self._seed(db_session, n_students=2, tag="RW")
+        db_session.add(Enrollment(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            assigned_day="Monday", assigned_time="15:00 - 16:30",
+            location="Main Center", lessons_paid=10,
+            first_lesson_date=date.today() + timedelta(days=40),
+            payment_status="Pending Payment", enrollment_type="Regular",
+        ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(
+                f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students",
+                cookies={"access_token": ctx["token"]},
+            )
+        assert [row["school_student_id"] for row in resp.json()] == ["RW000", "RW001"]
+        assert resp.headers["X-Total-Count"] == "2"
+        candidate_query = next(q for q in queries if q.startswith("SELECT") and "FROM students" in q)
+        assert "DISTINCT" not in candidate_query
+        assert "ORDER BY students.school_student_id" in candidate_query
+
+    def test_consumable_sessions_raise_on_unloaded_relationships(self, db_session):
+        """Batched consumable sessions carry their tutor; other relationships raise instead of lazy-loading."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        ctx = self._seed(db_session, n_students=1, tag="RL")
+        student_id = ctx["students"][0].id
+        db_session.expunge_all()
+
+        sessions = _get_consumable_sessions_by_student(
+            db_session, [student_id], "Main Center", today=hk_now().date()
+        )[student_id]
+        assert sessions and all(s.tutor.tutor_name == "Ms Eligible" for s in sessions)
+        with pytest.raises(InvalidRequestError):
+            sessions[0].student
+
+    def test_deadline_check_is_one_query(self, client, db_session):
+        """Past-deadline flags for every candidate come from a single enrollment query."""
+        ctx = self._seed(db_session, n_students=3, tag="DL")
+        slot_id = ctx["slot"].id
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(
+                f"/api/exam-revision/slots/{slot_id}/eligible-students",
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert len(resp.json()) == 3
+        assert len([q for q in queries if "enrollment_type" in q]) == 1
+
+    def test_limit_offset_pages_in_student_id_order(self, client, db_session):
+        """limit/offset page the list in school-student-ID order with X-Total-Count."""
+        ctx = self._seed(db_session, n_students=5, tag="PG")
+        url = f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students"
+        cookies = {"access_token": ctx["token"]}
+
+        first = client.get(url, params={"limit": 2}, cookies=cookies)
+        second = client.get(url, params={"limit": 2, "offset": 2}, cookies=cookies)
+        last = client.get(url, params={"limit": 2, "offset": 4}, cookies=cookies)
+        assert [r["school_student_id"] for r in first.json()] == ["PG000", "PG001"]
+        assert [r["school_student_id"] for r in second.json()] == ["PG002", "PG003"]
+        assert [r["school_student_id"] for r in last.json()] == ["PG004"]
+        assert {r.headers["X-Total-Count"] for r in (first, second, last)} == {"5"}
+        assert all(len(r["pending_sessions"]) == 2 for r in first.json())
+
+        assert client.get(url, params={"limit": 501}, cookies=cookies).status_code == 422
+
+    def test_unpaged_lists_return_every_student(self, client, db_session):
+        """Without a limit the whole list comes back; offset alone skips rows."""
+        ctx = self._seed(db_session, n_students=5, tag="UP")
+        cookies = {"access_token": ctx["token"]}
+        for url in (
+            f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students",
+            f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students",
+        ):
+            resp = client.get(url, cookies=cookies)
+            assert len(resp.json()) == 5
+            assert resp.headers["X-Total-Count"] == "5"
+            resp = client.get(url, params={"offset": 3}, cookies=cookies)
+            assert [r["school_student_id"] for r in resp.json()] == ["UP003", "UP004"]
+            assert resp.headers["X-Total-Count"] == "5"
+
+        # No default page size: omitting limit must never truncate the list
+        paths = app.openapi()["paths"]
+        for path in (
+            "/api/exam-revision/slots/{slot_id}/eligible-students",
+            "/api/exam-revision/calendar/{event_id}/eligible-students",
+        ):
+            limit = next(p for p in paths[path]["get"]["parameters"] if p["name"] == "limit")
+            assert not limit["required"]
+            assert limit["schema"].get("default") is None
+
+    def test_students_without_consumable_sessions_not_counted(self, client, db_session):
+        """Students with nothing to consume are excluded before paging."""
+        ctx = self._seed(db_session, n_students=3, tag="NC")
+        db_session.query(SessionLog).filter(
+            SessionLog.student_id == ctx["students"][0].id
+        ).delete()
+        db_session.commit()
+
+        resp = client.get(
+            f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students",
+            params={"limit": 1}, cookies={"access_token": ctx["token"]},
+        )
+        assert [r["school_student_id"] for r in resp.json()] == ["NC001"]
+        assert resp.headers["X-Total-Count"] == "2"
+
+    def test_consumable_filter_requires_today(self, db_session):
+        """A query using the shared predicate without binding today fails rather than guessing."""
+        from sqlalchemy.exc import StatementError
+
+        query = db_session.query(SessionLog.id).filter(_CONSUMABLE_SESSION_FILTER)
+        with pytest.raises(StatementError, match="consumable_today"):
+            query.all()
+        assert query.params(consumable_today=hk_now().date()).all() == []
+
+    def test_consumable_filter_reads_today_per_request(self, client, db_session, monkeypatch):
+        """Each request binds its own date, not one fixed at import time."""
+        ctx = self._seed(db_session, n_students=1, tag="TD")
+        url = f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students"
+        cookies = {"access_token": ctx["token"]}
+        assert len(client.get(url, cookies=cookies).json()[0]["pending_sessions"]) == 3
+
+        # A week on, the scheduled session (3 days out) is no longer in the future
+        later = hk_now() + timedelta(days=7)
+        monkeypatch.setattr("routers.exam_revision.hk_now", lambda: later)
+        clear_exam_revision_cache()
+        sessions = client.get(url, cookies=cookies).json()[0]["pending_sessions"]
+        assert {s["session_status"] for s in sessions} == {SessionStatus.RESCHEDULED_PENDING.value}
+
+    def test_one_today_per_request(self, client, db_session, monkeypatch):
+        """Every query in a request sees the same date, even if the clock moves on."""
+        ctx = self._seed(db_session, n_students=1, tag="OT")
+        now = hk_now()
+        calls = []
+
+        def advancing_now():
+            calls.append(None)
+            return now if len(calls) == 1 else now + timedelta(days=7)
+
+        monkeypatch.setattr("routers.exam_revision.hk_now", advancing_now)
+        resp = client.get(
+            f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students",
+            cookies={"access_token": ctx["token"]},
+        )
+        assert len(calls) == 1
+        assert len(resp.json()[0]["pending_sessions"]) == 3
+
+    def test_exam_lists_sessions_across_locations(self, client, db_session):
+        """Without a location filter, the exam-level endpoint offers every location."""
+        ctx = self._seed(db_session, n_students=2)
+
+        resp = client.get(
+            f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students",
+            cookies={"access_token": ctx["token"]},
+        )
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert len(data) == 2
+        assert all(len(row["pending_sessions"]) == 3 for row in data)
+
+    def test_exam_list_excludes_students_enrolled_in_any_event_slot(self, client, db_session):
+        """Enrolled students drop out of the exam-level list via the pre-resolved slot IDs."""
+        ctx = self._seed(db_session, n_students=2, tag="EX")
+        cookies = {"access_token": ctx["token"]}
+        url = f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students"
+        first = client.get(url, cookies=cookies).json()
+        resp = client.post(
+            f"/api/exam-revision/slots/{ctx['slot'].id}/enroll",
+            json={"student_id": first[0]["student_id"], "consume_session_id": first[0]["pending_sessions"][0]["id"]},
+            cookies=cookies,
+        )
+        assert resp.status_code == 200, resp.text
+
+        with capture_queries(db_session.get_bind()) as queries:
+            data = client.get(url, cookies=cookies).json()
+        assert [row["student_id"] for row in data] == [first[1]["student_id"]]
+        student_query = next(q for q in queries if q.startswith("SELECT") and "FROM students" in q)
+        assert "JOIN exam_revision_slots" not in student_query
+
+    def test_pending_sessions_fetched_in_one_query(self, client, db_session):
+        """Pending sessions are fetched in one query, not one per student."""
+        ctx = self._seed(db_session, n_students=4)
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(
+                f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students",
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert len(resp.json()) == 4
+        # Pending make-ups and future sessions are the two UNION ALL branches
+        # of that one statement
+        pending_lookups = [
+            q for q in queries
+            if q.startswith("SELECT") and "UNION ALL" in q and "rescheduled_to_id IS NULL" in q
+        ]
+        assert len(pending_lookups) == 1
+        assert pending_lookups[0].count("session_log.student_id IN (") == 2
+        # Each branch reads only the columns the lists show, not the wide row
+        assert "session_log.notes" not in pending_lookups[0]
+        # Tutors follow in one IN round-trip, trimmed to the name shown,
+        # instead of being joined onto every session row
+        assert "tutors" not in pending_lookups[0]
+        tutor_loads = [q for q in queries if q.startswith("SELECT tutors")]
+        assert len(tutor_loads) == 1
+        assert "tutors.id IN (" in tutor_loads[0]
+        assert "tutors.user_email" not in tutor_loads[0]
+        # Enrollment tutor names ride along in the student query; the only
+        # batched enrollment lookup is the regular-slot deadline check
+        tutor_lookups = [
+            q for q in queries
+            if "enrollments.student_id IN (" in q and "enrollment_type" not in q
+        ]
+        assert not tutor_lookups
+
+    def test_query_count_independent_of_candidates(self, client, db_session):
+        """Both eligible lists issue the same statements for 2 or 5 candidates."""
+        def statement_count(n_students, tag):
+            ctx = self._seed(db_session, n_students=n_students, tag=tag)
+            cookies = {"access_token": ctx["token"]}
+            counts = []
+            for url in (
+                f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students",
+                f"/api/exam-revision/calendar/{ctx['event'].id}/eligible-students",
+            ):
+                with capture_queries(db_session.get_bind()) as queries:
+                    resp = client.get(url, cookies=cookies)
+                assert resp.status_code == 200, resp.text
+                assert len(resp.json()) == n_students
+                counts.append(len(queries))
+            return counts
+
+        assert statement_count(2, "QA") == statement_count(5, "QB")
+
+
+class TestExamCalendarEligibleCounts:
+    """Eligible counts on GET /exam-revision/calendar, batched across events."""
+
+    def test_counts_match_per_exam_eligible_lists(self, client, db_session):
+        """Each exam's eligible_count agrees with its eligible-students list."""
+        seeder = TestEligibleStudents()
+        first = seeder._seed(db_session, n_students=3, tag="CA")
+        second = seeder._seed(db_session, n_students=2, tag="CB")
+        # Third exam targets CB's school and has no slot; one CB student is
+        # already enrolled in CB's slot and must not count for that exam only.
+        third = CalendarEvent(
+            event_id="evt-cb-2", title="F2 Science Exam",
+            start_date=date.today() + timedelta(days=20),
+            school="CB School", grade="F2", event_type="Exam",
+        )
+        db_session.add(third)
+        enrolled_student = second["students"][0]
+        db_session.add(SessionLog(
+            student_id=enrolled_student.id, tutor_id=second["tutor"].id,
+            session_date=second["slot"].session_date, time_slot=second["slot"].time_slot,
+            location="Main Center", session_status=SessionStatus.MAKEUP_CLASS.value,
+            exam_revision_slot_id=second["slot"].id,
+        ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(
+                "/api/exam-revision/calendar",
+                cookies={"access_token": first["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        counts = {e["id"]: e["eligible_count"] for e in resp.json()}
+        assert counts == {first["event"].id: 3, second["event"].id: 1, third.id: 2}
+        # One grouped count per distinct location scope ("Main Center" slots, and all
+        # locations), sent together as a single UNION ALL statement.
+        count_queries = [q for q in queries if "GROUP BY calendar_events.id" in q]
+        assert len(count_queries) == 1
+        assert count_queries[0].count("GROUP BY calendar_events.id") == 2
+        assert "UNION ALL" in count_queries[0]
+
+        for event_id, locations in (
+            (first["event"].id, "Main Center"),
+            (second["event"].id, "Main Center"),
+            (third.id, None),
+        ):
+            params = {"locations": locations} if locations else {}
+            listed = client.get(
+                f"/api/exam-revision/calendar/{event_id}/eligible-students",
+                params=params, cookies={"access_token": first["token"]},
+            ).json()
+            assert len(listed) == counts[event_id]
+
+    def test_academic_stream_only_applies_to_senior_forms(self, client, db_session):
+        """Stream restricts F4-F6 exams but is ignored for junior forms."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="AS")
+        ctx["students"][0].academic_stream = "S"
+        ctx["students"][1].academic_stream = "A"
+        ctx["event"].academic_stream = "S"
+        db_session.commit()
+
+        resp = client.get("/api/exam-revision/calendar", cookies={"access_token": ctx["token"]})
+        assert resp.json()[0]["eligible_count"] == 2
+
+        for student in ctx["students"]:
+            student.grade = "F5"
+        ctx["event"].grade = "F5"
+        db_session.commit()
+        clear_exam_revision_cache()  # direct DB edits bypass the router's invalidation
+
+        resp = client.get("/api/exam-revision/calendar", cookies={"access_token": ctx["token"]})
+        assert resp.json()[0]["eligible_count"] == 1
+
+    def test_student_scan_narrowed_to_event_school_grades(self, client, db_session):
+        """Scopes whose exams all name a school and grade only scan those students;
+        an exam open on grade still counts every grade at its school."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="SG")
+        ctx["students"][1].grade = "F3"
+        open_grade = CalendarEvent(
+            event_id="evt-sg-open", title="Whole School Exam",
+            start_date=date.today() + timedelta(days=21),
+            school="SG School", event_type="Exam",
+        )
+        db_session.add(open_grade)
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/calendar", cookies={"access_token": ctx["token"]})
+        counts = {e["id"]: e["eligible_count"] for e in resp.json()}
+        assert counts == {ctx["event"].id: 1, open_grade.id: 2}
+        count_query = next(q for q in queries if "GROUP BY calendar_events.id" in q)
+        # Only the slot-scoped part (the F2 exam) carries the pair filter
+        assert count_query.count("(students.school, students.grade) IN") == 1
+
+    def test_constructed_slots_keep_full_response_shape(self, client, db_session):
+        """Unvalidated slot summaries still serialize every response field."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="SH")
+
+        event = client.get("/api/exam-revision/calendar", cookies={"access_token": ctx["token"]}).json()[0]
+        assert set(event["revision_slots"][0]) == set(ExamRevisionSlotResponse.model_fields)
+        assert event["revision_slots"][0]["tutor_name"] == "Ms Eligible"
+        assert event["revision_slots"][0]["warning"] is None
+        assert event["total_enrolled"] == 0
+
+    def test_student_with_several_enrollments_counted_once(self, client, db_session):
+        """Active enrollments are an EXISTS, so renewals don't inflate the count or need DISTINCT."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="RN")
+        db_session.add(Enrollment(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            assigned_day="Monday", assigned_time="15:00 - 16:30",
+            location="Main Center", lessons_paid=10,
+            first_lesson_date=date.today() + timedelta(days=40),
+            payment_status="Pending Payment", enrollment_type="Regular",
+        ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/calendar", cookies={"access_token": ctx["token"]})
+        assert resp.json()[0]["eligible_count"] == 2
+        count_query = next(q for q in queries if "GROUP BY calendar_events.id" in q)
+        assert "DISTINCT" not in count_query
+
+    def test_enrolled_totals_with_multiple_slots(self, client, db_session):
+        """Slot collections load separately from events and still total correctly."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=3, tag="MS")
+        second_slot = ExamRevisionSlot(
+            calendar_event_id=ctx["event"].id,
+            session_date=ctx["slot"].session_date, time_slot="19:00 - 20:30",
+            tutor_id=ctx["tutor"].id, location="Main Center",
+        )
+        db_session.add(second_slot)
+        db_session.commit()
+        for student, slot in zip(ctx["students"], (ctx["slot"], ctx["slot"], second_slot)):
+            db_session.add(SessionLog(
+                student_id=student.id, tutor_id=ctx["tutor"].id,
+                session_date=slot.session_date, time_slot=slot.time_slot,
+                location="Main Center", session_status=SessionStatus.MAKEUP_CLASS.value,
+                exam_revision_slot_id=slot.id,
+            ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/calendar", cookies={"access_token": ctx["token"]})
+        exam = resp.json()[0]
+        assert exam["total_enrolled"] == 3
+        assert sorted(s["enrolled_count"] for s in exam["revision_slots"]) == [1, 2]
+        event_queries = [q for q in queries if "FROM calendar_events" in q and "GROUP BY" not in q]
+        assert event_queries and all("session_log" not in q for q in event_queries)
+
+    def test_eligible_counts_shared_across_filters(self, client, db_session):
+        """A filtered calendar view reuses per-exam counts from an earlier unfiltered one."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="SF")
+        cookies = {"access_token": ctx["token"]}
+        assert client.get("/api/exam-revision/calendar", cookies=cookies).json()[0]["eligible_count"] == 2
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/calendar", params={"school": "SF School"}, cookies=cookies)
+        assert resp.json()[0]["eligible_count"] == 2
+        assert not [q for q in queries if "GROUP BY calendar_events.id" in q]
+
+    def test_eligible_list_cached_until_enrollment(self, client, db_session):
+        """Repeat reads are served from cache; enrolling a student invalidates it."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="CC")
+        url = f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students"
+        cookies = {"access_token": ctx["token"]}
+
+        first = client.get(url, cookies=cookies).json()
+        assert len(first) == 2
+        with capture_queries(db_session.get_bind()) as queries:
+            assert client.get(url, cookies=cookies).json() == first
+        assert not [q for q in queries if "session_log" in q]
+
+        student = first[0]
+        resp = client.post(
+            f"/api/exam-revision/slots/{ctx['slot'].id}/enroll",
+            json={
+                "student_id": student["student_id"],
+                "consume_session_id": student["pending_sessions"][0]["id"],
+            },
+            cookies=cookies,
+        )
+        assert resp.status_code == 200, resp.text
+        assert [s["student_id"] for s in client.get(url, cookies=cookies).json()] == [
+            first[1]["student_id"]
+        ]
+
+    def test_eligible_list_refreshed_by_session_router_write(self, client, db_session):
+        """A status change made through the sessions router invalidates the cache."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="CS")
+        url = f"/api/exam-revision/slots/{ctx['slot'].id}/eligible-students"
+        cookies = {"access_token": ctx["token"]}
+
+        pending = client.get(url, cookies=cookies).json()[0]["pending_sessions"]
+        scheduled = next(s for s in pending if s["session_status"] == SessionStatus.SCHEDULED.value)
+        resp = client.patch(f"/api/sessions/{scheduled['id']}/reschedule", cookies=cookies)
+        assert resp.status_code == 200, resp.text
+
+        pending = client.get(url, cookies=cookies).json()[0]["pending_sessions"]
+        statuses = {s["id"]: s["session_status"] for s in pending}
+        assert statuses[scheduled["id"]] == SessionStatus.RESCHEDULED_PENDING.value
+
+
+class TestExamDate:
+    """GET /exam-revision/calendar/{event_id}/date."""
+
+    def test_returns_start_date_only(self, client, db_session):
+        event = CalendarEvent(
+            event_id="evt-date", title="Exam", description="x" * 2000,
+            start_date=date(2026, 11, 3), event_type="Exam",
+        )
+        db_session.add(event)
+        db_session.commit()
+        event_id = event.id
+        token = make_auth_token(99)
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(f"/api/exam-revision/calendar/{event_id}/date", cookies={"access_token": token})
+        assert resp.json() == {"start_date": "2026-11-03"}
+        assert all("description" not in q for q in queries if "calendar_events" in q)
+
+    def test_missing_event_404(self, client, db_session):
+        resp = client.get("/api/exam-revision/calendar/12345/date", cookies={"access_token": make_auth_token(99)})
+        assert resp.status_code == 404
+
+
+class TestCalendarSyncStatus:
+    """GET /exam-revision/calendar/sync-status."""
+
+    def test_counts_in_one_query(self, client, db_session):
+        today = hk_now().date()
+        db_session.add_all([
+            CalendarEvent(event_id="s1", title="Past", start_date=today - timedelta(days=5)),
+            CalendarEvent(event_id="s2", title="Soon", start_date=today + timedelta(days=10)),
+            CalendarEvent(event_id="s3", title="Far", start_date=today + timedelta(days=120)),
+        ])
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/calendar/sync-status", cookies={"access_token": make_auth_token(99)})
+        data = resp.json()
+        assert data["total_events"] == 3
+        assert data["upcoming_events"] == 1
+        assert data["last_synced_at"] is not None
+        assert len([q for q in queries if "calendar_events" in q]) == 1
+
+    def test_empty_table(self, client, db_session):
+        resp = client.get("/api/exam-revision/calendar/sync-status", cookies={"access_token": make_auth_token(99)})
+        assert resp.json() == {
+            "last_synced_at": None, "total_events": 0, "upcoming_events": 0, "sync_window_days": 90,
+        }
+
+
+class TestRevisionSlotList:
+    """Integration tests for GET /exam-revision/slots."""
+
+    def test_enrolled_counts_without_loading_sessions(self, client, db_session):
+        """Counts only enrolled statuses and never selects the session rows themselves."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=3, tag="SL")
+        for student, status in zip(ctx["students"], (
+            SessionStatus.MAKEUP_CLASS.value, "Attended (Make-up)", "Cancelled",
+        )):
+            db_session.add(SessionLog(
+                student_id=student.id, tutor_id=ctx["tutor"].id,
+                session_date=ctx["slot"].session_date, time_slot=ctx["slot"].time_slot,
+                location="Main Center", session_status=status,
+                exam_revision_slot_id=ctx["slot"].id,
+            ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/slots", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        [slot] = resp.json()
+        assert slot["enrolled_count"] == 2
+        assert slot["tutor_name"] == ctx["tutor"].tutor_name
+        # The other statement is the ETag probe
+        [slot_query] = [q for q in queries if "exam_revision_slots" in q and "ORDER BY" in q]
+        assert not [q for q in queries if "session_log.exam_revision_slot_id IN" in q]
+        # Only the tutor's name is joined in, not the whole tutor row
+        assert "tutor_name" in slot_query and "user_email" not in slot_query
+
+    def test_each_slot_counts_only_its_own_enrollments(self, client, db_session):
+        """Per-slot counts come from one statement; an empty slot reports 0."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="SC")
+        slot = ctx["slot"]
+        empty_slot = ExamRevisionSlot(
+            calendar_event_id=ctx["event"].id,
+            session_date=slot.session_date + timedelta(days=1),
+            time_slot=slot.time_slot, tutor_id=ctx["tutor"].id, location="Main Center",
+        )
+        db_session.add(empty_slot)
+        for student in ctx["students"]:
+            db_session.add(SessionLog(
+                student_id=student.id, tutor_id=ctx["tutor"].id,
+                session_date=slot.session_date, time_slot=slot.time_slot,
+                location="Main Center", session_status=SessionStatus.MAKEUP_CLASS.value,
+                exam_revision_slot_id=slot.id,
+            ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/slots", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        assert [s["enrolled_count"] for s in resp.json()] == [2, 0]
+        assert len([q for q in queries if "FROM exam_revision_slots" in q and "ORDER BY" in q]) == 1
+
+    def test_list_statement_count_independent_of_slots(self, client, db_session):
+        """Extra slots add rows to the one slot statement, never extra statements."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="SN")
+        cookies = {"access_token": ctx["token"]}
+
+        def list_statements():
+            clear_exam_revision_cache()
+            with capture_queries(db_session.get_bind()) as queries:
+                resp = client.get("/api/exam-revision/slots", cookies=cookies)
+            assert resp.status_code == 200, resp.text
+            return len(resp.json()), len(queries)
+
+        single = list_statements()
+        assert single[0] == 1
+        slot = ctx["slot"]
+        db_session.add_all([
+            ExamRevisionSlot(
+                calendar_event_id=ctx["event"].id,
+                session_date=slot.session_date + timedelta(days=offset),
+                time_slot=slot.time_slot, tutor_id=ctx["tutor"].id, location="Main Center",
+            )
+            for offset in (1, 2, 3)
+        ])
+        db_session.commit()
+        assert list_statements() == (4, single[1])
+
+    def test_detail_lists_enrolled_students_from_trimmed_rows(self, client, db_session):
+        """The detail view builds enrolled students from just the columns it shows."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="DT")
+        slot = ctx["slot"]
+        for student, status in zip(ctx["students"], (SessionStatus.MAKEUP_CLASS.value, "Cancelled")):
+            db_session.add(SessionLog(
+                student_id=student.id, tutor_id=ctx["tutor"].id,
+                session_date=slot.session_date, time_slot=slot.time_slot,
+                location="Main Center", session_status=status, exam_revision_slot_id=slot.id,
+            ))
+        db_session.commit()
+        slot_id = slot.id
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(f"/api/exam-revision/slots/{slot_id}", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["enrolled_count"] == 1
+        assert body["enrolled_students"][0]["school_student_id"] == "DT000"
+        assert body["enrolled_students"][0]["school"] == "DT School"
+        # Constructed without validation, so every field must come from the row
+        assert set(body["enrolled_students"][0]) == set(EnrolledStudentInfo.model_fields)
+        assert body["enrolled_students"][0]["consumed_session_id"] is None
+        student_query = next(q for q in queries if "FROM session_log" in q and "students" in q)
+        assert "student_name" in student_query and ".phone" not in student_query
+
+    def test_detail_without_adoption_reads_slot_once(self, client, db_session):
+        """With nothing to adopt, the slot loaded up front is validated as-is."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="DR")
+        slot_id = ctx["slot"].id
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(f"/api/exam-revision/slots/{slot_id}", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["tutor_name"] == ctx["tutor"].tutor_name
+        assert body["calendar_event"]["id"] == body["calendar_event_id"]
+        assert body["enrolled_students"] == []
+        assert len([q for q in queries if "FROM exam_revision_slots" in q]) == 1
+
+    def test_detail_adoption_reads_slot_once(self, client, db_session):
+        """Adopting on view lists the adopted student without reloading the slot."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="DA")
+        slot = ctx["slot"]
+        db_session.add(SessionLog(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            session_date=slot.session_date, time_slot=slot.time_slot,
+            location=slot.location, session_status=SessionStatus.MAKEUP_CLASS.value,
+        ))
+        db_session.commit()
+        slot_id = slot.id
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(f"/api/exam-revision/slots/{slot_id}", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["enrolled_count"] == 1
+        assert body["enrolled_students"][0]["school_student_id"] == "DA000"
+        assert body["tutor_name"] == ctx["tutor"].tutor_name
+        assert len([q for q in queries if "FROM exam_revision_slots" in q]) == 1
+        db_session.expire_all()
+        assert db_session.query(SessionLog).filter(
+            SessionLog.exam_revision_slot_id == slot_id
+        ).count() == 1
+
+    def test_etag_revalidation(self, client, db_session):
+        """A matching If-None-Match is answered 304 from cache; a write changes the ETag."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="ET")
+        cookies = {"access_token": ctx["token"]}
+        first = client.get("/api/exam-revision/slots", cookies=cookies)
+        etag = first.headers["ETag"]
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get("/api/exam-revision/slots", headers={"If-None-Match": etag}, cookies=cookies)
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert not [q for q in queries if "exam_revision_slots" in q]
+
+        resp = client.patch(
+            f"/api/exam-revision/slots/{first.json()[0]['id']}",
+            json={"notes": "Bring past papers"}, cookies=cookies,
+        )
+        assert resp.status_code == 200, resp.text
+        resp = client.get("/api/exam-revision/slots", headers={"If-None-Match": etag}, cookies=cookies)
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        assert resp.json()[0]["notes"] == "Bring past papers"
+
+    def test_etag_probe_skips_list_build(self, client, db_session):
+        """On a cache miss, a matching If-None-Match is answered from the probe alone."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="EP")
+        cookies = {"access_token": ctx["token"]}
+        etag = client.get("/api/exam-revision/slots", cookies=cookies).headers["ETag"]
+        assert etag.startswith('W/"')
+
+        clear_exam_revision_cache()
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.get(
+                "/api/exam-revision/slots",
+                headers={"If-None-Match": f'"other", {etag.removeprefix("W/")}'}, cookies=cookies,
+            )
+        assert resp.status_code == 304
+        assert len([q for q in queries if "exam_revision_slots" in q]) == 1
+
+    def test_etag_changes_on_enrollment(self, client, db_session):
+        """Enrolling a student changes the probe, so the old ETag no longer matches."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="EE")
+        cookies = {"access_token": ctx["token"]}
+        etag = client.get("/api/exam-revision/slots", cookies=cookies).headers["ETag"]
+
+        slot = ctx["slot"]
+        db_session.add(SessionLog(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            session_date=slot.session_date, time_slot=slot.time_slot, location=slot.location,
+            session_status=SessionStatus.SCHEDULED.value, exam_revision_slot_id=slot.id,
+        ))
+        db_session.commit()
+        clear_exam_revision_cache()
+        resp = client.get("/api/exam-revision/slots", headers={"If-None-Match": etag}, cookies=cookies)
+        assert resp.status_code == 200
+        assert resp.json()[0]["enrolled_count"] == 1
+
+    def test_if_none_match_parsing(self):
+        """If-None-Match matches "*" or any listed tag, weak or strong."""
+        etag = 'W/"abc"'
+        assert _etag_matches('"abc"', etag)
+        assert _etag_matches('W/"abc"', etag)
+        assert _etag_matches('"x", W/"abc" ,"y"', etag)
+        assert _etag_matches(" * ", etag)
+        assert not _etag_matches('"abcd", W/"ab"', etag)
+        assert not _etag_matches(None, etag)
+        assert not _etag_matches("", etag)
+
+
+class TestRevisionSlotWrites:
+    """Integration tests for creating and updating revision slots."""
+
+    def _seed_adoptable(self, db_session, tag):
+        """Seed an exam plus one student session that a new 19:00 slot would adopt."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag=tag)
+        session_date = ctx["slot"].session_date
+        adoptable = SessionLog(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            session_date=session_date, time_slot="19:00 - 20:30",
+            location="Main Center", session_status=SessionStatus.MAKEUP_CLASS.value,
+        )
+        db_session.add(adoptable)
+        db_session.commit()
+        ctx.update(
+            adoptable_id=adoptable.id, session_date=session_date,
+            event_id=ctx["event"].id, tutor_id=ctx["tutor"].id, slot_id=ctx["slot"].id,
+        )
+        return ctx
+
+    def test_create_adopts_in_one_transaction(self, client, db_session):
+        """Creating a slot adopts matching sessions without re-reading the event after commit."""
+        ctx = self._seed_adoptable(db_session, "CR")
+        commits = []
+        record_commit = commits.append
+        event.listen(db_session, "after_commit", record_commit)
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(
+                "/api/exam-revision/slots",
+                json={
+                    "calendar_event_id": ctx["event_id"],
+                    "session_date": ctx["session_date"].isoformat(),
+                    "time_slot": "19:00 - 20:30", "tutor_id": ctx["tutor_id"],
+                    "location": "Main Center",
+                },
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["enrolled_count"] == 1
+        assert body["tutor_name"] is not None
+        assert body["calendar_event"]["id"] == ctx["event_id"]
+        # Slot insert and adoption share one transaction
+        assert len(commits) == 1
+        event.remove(db_session, "after_commit", record_commit)
+        assert db_session.get(SessionLog, ctx["adoptable_id"]).exam_revision_slot_id == body["id"]
+        # Only the initial lookup; the event is never refreshed after a commit
+        event_reads = [q for q in queries if q.startswith("SELECT") and "FROM calendar_events" in q]
+        assert len(event_reads) == 1
+        # The response is built from the instances already loaded, with no
+        # post-commit reload of the new slot
+        assert not [
+            q for q in queries
+            if q.startswith("SELECT") and "FROM exam_revision_slots" in q and "exam_revision_slots.id = " in q
+        ]
+        # Adoption is one set-based UPDATE with the student criteria as a
+        # subquery, not a SELECT of matching sessions followed by per-row writes
+        [adopt] = [q for q in queries if q.startswith("UPDATE session_log")]
+        assert "IN (SELECT students.id" in adopt
+
+    def test_create_looks_up_event_and_tutor_together(self, client, db_session):
+        """The event and tutor come from one query; a missing one is still named in the 404."""
+        ctx = self._seed_adoptable(db_session, "ET")
+        payload = {
+            "calendar_event_id": ctx["event_id"],
+            "session_date": ctx["session_date"].isoformat(),
+            "time_slot": "19:00 - 20:30", "tutor_id": ctx["tutor_id"],
+            "location": "Main Center",
+        }
+        cookies = {"access_token": ctx["token"]}
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post("/api/exam-revision/slots", json=payload, cookies=cookies)
+        assert resp.status_code == 200, resp.text
+        [lookup] = [q for q in queries if q.startswith("SELECT") and "FROM calendar_events" in q]
+        assert "JOIN tutors ON tutors.id = " in lookup
+        # Only the authenticated user is read from tutors on its own
+        assert len([q for q in queries if q.startswith("SELECT") and "FROM tutors" in q]) == 1
+
+        resp = client.post("/api/exam-revision/slots", json={**payload, "tutor_id": 9999}, cookies=cookies)
+        assert resp.status_code == 404
+        assert resp.json()["detail"] == "Tutor with ID 9999 not found"
+        resp = client.post("/api/exam-revision/slots", json={**payload, "calendar_event_id": 9999}, cookies=cookies)
+        assert resp.status_code == 404
+        assert resp.json()["detail"] == "Calendar event with ID 9999 not found"
+
+    def test_create_skips_adopt_for_event_without_criteria(self, client, db_session):
+        """An event with no school/grade/stream adopts nothing instead of the whole cell."""
+        ctx = self._seed_adoptable(db_session, "NC")
+        event = ctx["event"]
+        event.school = event.grade = event.academic_stream = None
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(
+                "/api/exam-revision/slots",
+                json={
+                    "calendar_event_id": ctx["event_id"],
+                    "session_date": ctx["session_date"].isoformat(),
+                    "time_slot": "19:00 - 20:30", "tutor_id": ctx["tutor_id"],
+                    "location": "Main Center",
+                },
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["enrolled_count"] == 0
+        assert db_session.get(SessionLog, ctx["adoptable_id"]).exam_revision_slot_id is None
+        assert not [q for q in queries if q.startswith("UPDATE session_log")]
+
+    def test_notes_only_update_skips_rechecks(self, client, db_session):
+        """A PATCH that changes nothing but notes runs no enrollment, duplicate, conflict or adopt queries."""
+        ctx = self._seed_adoptable(db_session, "NO")
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.patch(
+                f"/api/exam-revision/slots/{ctx['slot_id']}",
+                json={"notes": "Bring calculators", "time_slot": "17:00 - 18:30"},
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["notes"] == "Bring calculators"
+        assert not [q for q in queries if "session_log" in q]
+        slot_reads = [q for q in queries if q.startswith("SELECT") and "FROM exam_revision_slots" in q]
+        assert len(slot_reads) == 2  # initial fetch and post-commit reload
+
+    def test_update_adopts_and_reloads_without_sessions(self, client, db_session):
+        """Moving a slot onto a session's time adopts it; the reload skips the sessions collection."""
+        ctx = self._seed_adoptable(db_session, "UP")
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.patch(
+                f"/api/exam-revision/slots/{ctx['slot_id']}",
+                json={"time_slot": "19:00 - 20:30"},
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["enrolled_count"] == 1
+        assert resp.json()["time_slot"] == "19:00 - 20:30"
+        assert db_session.get(SessionLog, ctx["adoptable_id"]).exam_revision_slot_id == ctx["slot_id"]
+        slot_reads = [q for q in queries if q.startswith("SELECT") and "FROM exam_revision_slots" in q]
+        assert all("JOIN session_log" not in q for q in slot_reads)
+        assert "session_log" not in slot_reads[-1]
+
+    def test_create_warns_only_for_overlapping_tutor_sessions(self, client, db_session):
+        """Tutor conflicts come from a narrow column query, filtered by time overlap."""
+        ctx = self._seed_adoptable(db_session, "TC")
+        student_id = ctx["students"][0].id
+        for time_slot in ("17:00 - 18:30", "9:00 - 10:30"):
+            db_session.add(SessionLog(
+                student_id=student_id, tutor_id=ctx["tutor_id"],
+                session_date=ctx["session_date"], time_slot=time_slot,
+                location="Other Center", session_status=SessionStatus.SCHEDULED.value,
+            ))
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(
+                "/api/exam-revision/slots",
+                json={
+                    "calendar_event_id": ctx["event_id"],
+                    "session_date": ctx["session_date"].isoformat(),
+                    "time_slot": "17:30 - 18:45", "tutor_id": ctx["tutor_id"],
+                    "location": "Other Center",
+                },
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["warning"] == (
+            "Tutor has 1 conflicting session(s): Eligible TC 0 (17:00 - 18:30)"
+        )
+        conflict_query = next(q for q in queries if "session_log.tutor_id = ?" in q)
+        assert "session_log.financial_status" not in conflict_query
+
+    def test_create_checks_duplicates_and_overlaps_in_one_query(self, client, db_session):
+        """Same-day slots are read once for both checks, with their tutors joined."""
+        ctx = self._seed_adoptable(db_session, "DO")
+        payload = {
+            "calendar_event_id": ctx["event_id"],
+            "session_date": ctx["session_date"].isoformat(),
+            "time_slot": "17:00 - 18:30", "tutor_id": ctx["tutor_id"],
+            "location": "Main Center",
+        }
+        cookies = {"access_token": ctx["token"]}
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post("/api/exam-revision/slots", json=payload, cookies=cookies)
+        assert resp.status_code == 400
+        assert "already exists" in resp.json()["detail"]
+        assert len([q for q in queries if "FROM exam_revision_slots" in q]) == 1
+
+        resp = client.post(
+            "/api/exam-revision/slots",
+            json={**payload, "time_slot": "18:00 - 19:00"}, cookies=cookies,
+        )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["warning"].startswith(
+            f"Overlapping slot(s) at same location: 17:00 - 18:30 ({ctx['tutor'].tutor_name})"
+        )
+
+    def test_adoption_is_one_bulk_update_scoped_to_exam_students(self, client, db_session):
+        """Matching sessions are linked by a single UPDATE that skips other schools' students."""
+        ctx = self._seed_adoptable(db_session, "BU")
+        outsider = Student(school_student_id="OUT001", student_name="Outsider", grade="F2", school="Elsewhere")
+        db_session.add(outsider)
+        db_session.commit()
+        outsider_session = SessionLog(
+            student_id=outsider.id, tutor_id=ctx["tutor_id"],
+            session_date=ctx["session_date"], time_slot="19:00 - 20:30",
+            location="Main Center", session_status=SessionStatus.SCHEDULED.value,
+        )
+        db_session.add(outsider_session)
+        db_session.commit()
+        outsider_session_id = outsider_session.id
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.post(
+                "/api/exam-revision/slots",
+                json={
+                    "calendar_event_id": ctx["event_id"],
+                    "session_date": ctx["session_date"].isoformat(),
+                    "time_slot": "19:00 - 20:30", "tutor_id": ctx["tutor_id"],
+                    "location": "Main Center",
+                },
+                cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["enrolled_count"] == 1
+        assert len([q for q in queries if q.startswith("UPDATE session_log")]) == 1
+        assert db_session.get(SessionLog, ctx["adoptable_id"]).exam_revision_slot_id == resp.json()["id"]
+        assert db_session.get(SessionLog, outsider_session_id).exam_revision_slot_id is None
+
+    def test_force_delete_loads_sessions_separately(self, client, db_session):
+        """Force delete unenrolls students without joining sessions onto the slot row."""
+        ctx = self._seed_adoptable(db_session, "FD")
+        db_session.get(SessionLog, ctx["adoptable_id"]).exam_revision_slot_id = ctx["slot_id"]
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.delete(
+                f"/api/exam-revision/slots/{ctx['slot_id']}",
+                params={"force": True}, cookies={"access_token": ctx["token"]},
+            )
+        assert resp.status_code == 200, resp.text
+        assert "1 student(s) were unenrolled" in resp.json()["message"]
+        assert db_session.get(SessionLog, ctx["adoptable_id"]) is None
+        slot_reads = [q for q in queries if q.startswith("SELECT") and "FROM exam_revision_slots" in q]
+        assert slot_reads and all("JOIN session_log" not in q for q in slot_reads)
+
+    def test_delete_unlinks_non_enrolled_sessions(self, client, db_session):
+        """A slot with only a cancelled session deletes cleanly and leaves the session unlinked."""
+        ctx = self._seed_adoptable(db_session, "DU")
+        cancelled = db_session.get(SessionLog, ctx["adoptable_id"])
+        cancelled.session_status = "Cancelled"
+        cancelled.exam_revision_slot_id = ctx["slot_id"]
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.delete(f"/api/exam-revision/slots/{ctx['slot_id']}", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["message"] == f"Revision slot {ctx['slot_id']} deleted successfully"
+        assert db_session.get(ExamRevisionSlot, ctx["slot_id"]) is None
+        assert db_session.get(SessionLog, ctx["adoptable_id"]).exam_revision_slot_id is None
+        # Only enrolled statuses are ever selected from session_log
+        session_reads = [q for q in queries if q.startswith("SELECT") and "FROM session_log" in q]
+        assert session_reads and all("session_log.session_status IN" in q for q in session_reads)
+
+    def test_delete_refuses_enrolled_slot_from_a_count(self, client, db_session):
+        """Without force, an occupied slot is refused after counting, not loading, its sessions."""
+        ctx = self._seed_adoptable(db_session, "DC")
+        enrolled = db_session.get(SessionLog, ctx["adoptable_id"])
+        enrolled.exam_revision_slot_id = ctx["slot_id"]
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.delete(f"/api/exam-revision/slots/{ctx['slot_id']}", cookies={"access_token": ctx["token"]})
+        assert resp.status_code == 400
+        assert resp.json()["detail"].startswith("Cannot delete slot with 1 enrolled student(s)")
+        session_reads = [q for q in queries if q.startswith("SELECT") and "FROM session_log" in q]
+        assert len(session_reads) == 1
+        assert session_reads[0].startswith("SELECT count(session_log.id)")
+        assert db_session.get(ExamRevisionSlot, ctx["slot_id"]) is not None
+
+    def test_attended_enrollment_cannot_be_removed(self, client, db_session):
+        """Either completed status blocks removing a revision enrollment."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="AT")
+        slot = ctx["slot"]
+        statuses = (SessionStatus.ATTENDED.value, SessionStatus.ATTENDED_MAKEUP.value)
+        for student, status in zip(ctx["students"], statuses):
+            session = SessionLog(
+                student_id=student.id, tutor_id=ctx["tutor"].id,
+                session_date=slot.session_date, time_slot=slot.time_slot,
+                location="Main Center", session_status=status, exam_revision_slot_id=slot.id,
+            )
+            db_session.add(session)
+            db_session.commit()
+            resp = client.delete(
+                f"/api/exam-revision/slots/{slot.id}/enrollments/{session.id}",
+                cookies={"access_token": ctx["token"]},
+            )
+            assert resp.status_code == 400
+            assert resp.json()["detail"] == "Cannot remove enrollment for attended session"
+
+    def test_force_delete_reverts_consumed_sessions_in_one_update(self, client, db_session):
+        """Every consumed session returns to Pending Make-up via a single UPDATE."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=2, tag="RV")
+        slot_id = ctx["slot"].id
+        cookies = {"access_token": ctx["token"]}
+        consumed_ids = []
+        for student in ctx["students"]:
+            consumed = db_session.query(SessionLog).filter(
+                SessionLog.student_id == student.id,
+                SessionLog.location == "Main Center",
+                SessionLog.session_status == SessionStatus.RESCHEDULED_PENDING.value,
+            ).one()
+            consumed_ids.append(consumed.id)
+            resp = client.post(
+                f"/api/exam-revision/slots/{slot_id}/enroll",
+                json={"student_id": student.id, "consume_session_id": consumed.id},
+                cookies=cookies,
+            )
+            assert resp.status_code == 200, resp.text
+
+        with capture_queries(db_session.get_bind()) as queries:
+            resp = client.delete(f"/api/exam-revision/slots/{slot_id}", params={"force": True}, cookies=cookies)
+        assert resp.status_code == 200, resp.text
+        assert "2 student(s) were unenrolled" in resp.json()["message"]
+        reverts = [q for q in queries if q.startswith("UPDATE session_log SET session_status")]
+        assert len(reverts) == 1
+
+        db_session.expire_all()
+        for consumed_id in consumed_ids:
+            consumed = db_session.get(SessionLog, consumed_id)
+            assert consumed.session_status == SessionStatus.RESCHEDULED_PENDING.value
+            assert consumed.rescheduled_to_id is None
+
+    def test_force_delete_keeps_attended_enrollments(self, client, db_session):
+        """Attended revision sessions are unlinked, not deleted, and their source is left booked."""
+        ctx = TestEligibleStudents()._seed(db_session, n_students=1, tag="FA")
+        slot = ctx["slot"]
+        source = SessionLog(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            session_date=slot.session_date - timedelta(days=10), time_slot=slot.time_slot,
+            location="Main Center", session_status=SessionStatus.RESCHEDULED_BOOKED.value,
+        )
+        db_session.add(source)
+        db_session.commit()
+        attended = SessionLog(
+            student_id=ctx["students"][0].id, tutor_id=ctx["tutor"].id,
+            session_date=slot.session_date, time_slot=slot.time_slot,
+            location="Main Center", session_status=SessionStatus.ATTENDED_MAKEUP.value,
+            make_up_for_id=source.id, exam_revision_slot_id=slot.id,
+        )
+        db_session.add(attended)
+        db_session.commit()
+        attended_id, source_id, slot_id = attended.id, source.id, slot.id
+
+        resp = client.delete(
+            f"/api/exam-revision/slots/{slot_id}", params={"force": True},
+            cookies={"access_token": ctx["token"]},
+        )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["message"] == f"Revision slot {slot_id} deleted successfully"
+        db_session.expire_all()
+        assert db_session.get(SessionLog, attended_id).exam_revision_slot_id is None
+        assert db_session.get(SessionLog, source_id).session_status == SessionStatus.RESCHEDULED_BOOKED.value
+
+
+class TestRevertStatus:
+    """Tests for the booked -> pending status mapping used when unenrolling."""
+
+    def test_each_booked_status_reverts_to_its_pending_variant(self):
+        for booked, pending in _REVERT_STATUS.items():
+            assert booked.replace("Make-up Booked", "Pending Make-up") == pending
+        assert set(_REVERT_STATUS.values()) == set(PENDING_MAKEUP_STATUSES)
+
+    def test_covers_every_booked_status(self):
+        """A booked status added to constants without a revert entry would stay booked on unenroll."""
+        assert set(_REVERT_STATUS) == set(MAKEUP_BOOKED_STATUSES)
+
+
+class TestRouterHandlers:
+    """Checks that apply to every exam revision endpoint."""
+
+    def test_handlers_run_on_threadpool(self):
+        """Every handler is a plain def: they all use the blocking Session,
+        which would stall the event loop from inside an async def."""
+        async_handlers = [
+            route.path for route in router.routes
+            if inspect.iscoroutinefunction(route.endpoint)
+        ]
+        assert async_handlers == []
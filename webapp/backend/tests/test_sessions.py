@@ -20,7 +20,7 @@ from utils.makeup_validators import (
     validate_makeup_constraints,
 )
 from utils.response_builders import _find_root_original_session_date, batch_find_root_original_session_dates
-from tests.helpers import make_auth_token
+from tests.helpers import make_auth_token, capture_queries
 
 
 # ============================================================================
@@ -716,6 +716,33 @@ class TestSummerRescheduleDeadline:
             target_location="Main Center",
         )
 
+    def test_makeup_constraints_report_conflicting_session_id(
+        self, db_session, summer_enrollment, sample_tutor
+    ):
+        """The student-conflict check selects only the clashing session's ID."""
+        origin = self._summer_session(db_session, summer_enrollment, sample_tutor, date(2026, 7, 6))
+        clash = self._summer_session(db_session, summer_enrollment, sample_tutor, date(2026, 8, 3))
+        clash.session_status = "Scheduled"
+        db_session.commit()
+
+        with capture_queries(db_session.get_bind()) as queries:
+            with pytest.raises(HTTPException) as exc_info:
+                validate_makeup_constraints(
+                    db=db_session,
+                    student_id=summer_enrollment.student_id,
+                    consume_session=origin,
+                    target_date=clash.session_date,
+                    target_time_slot=clash.time_slot,
+                    target_location=clash.location,
+                    exclude_session_id=origin.id,
+                )
+        assert exc_info.value.detail == (
+            f"Student already has a session at this slot (Session #{clash.id})"
+        )
+        conflict_query = queries[-1]
+        assert conflict_query.startswith("SELECT session_log.id")
+        assert "session_log.notes" not in conflict_query
+
     def test_makeup_constraints_block_summer_after_31_august(
         self, db_session, summer_enrollment, sample_tutor
     ):
@@ -887,6 +914,62 @@ class TestBatchFindRootOriginalSessionDates:
         assert makeup.id in result
         assert result[makeup.id] == date(2026, 1, 12)
 
+    def test_deep_chain_resolved_in_one_query(self, db_session, sample_enrollment, sample_student, sample_tutor):
+        """A four-level chain is walked in a single round-trip."""
+        previous = None
+        chain = []
+        for week in range(4):
+            session = SessionLog(
+                enrollment_id=sample_enrollment.id,
+                student_id=sample_student.id,
+                tutor_id=sample_tutor.id,
+                session_date=date(2026, 1, 5) + timedelta(weeks=week),
+                time_slot="15:00-16:00",
+                location="Main Center",
+                session_status="Rescheduled - Pending Make-up",
+                make_up_for_id=previous.id if previous else None,
+            )
+            db_session.add(session)
+            db_session.commit()
+            chain.append(session)
+            previous = session
+        for session in chain:
+            db_session.refresh(session)
+
+        with capture_queries(db_session.get_bind()) as queries:
+            result = batch_find_root_original_session_dates(chain, db_session)
+        assert len(queries) == 1
+        assert result == {s.id: date(2026, 1, 5) for s in chain[1:]}
+
+    def test_cyclic_chain_terminates(self, db_session, sample_enrollment, sample_student, sample_tutor):
+        """Corrupt data where two sessions point at each other must not loop forever."""
+        first = SessionLog(
+            enrollment_id=sample_enrollment.id,
+            student_id=sample_student.id,
+            tutor_id=sample_tutor.id,
+            session_date=date(2026, 1, 5),
+            time_slot="15:00-16:00",
+            location="Main Center",
+            session_status="Make-up Class",
+        )
+        second = SessionLog(
+            enrollment_id=sample_enrollment.id,
+            student_id=sample_student.id,
+            tutor_id=sample_tutor.id,
+            session_date=date(2026, 1, 12),
+            time_slot="15:00-16:00",
+            location="Main Center",
+            session_status="Make-up Class",
+        )
+        db_session.add_all([first, second])
+        db_session.commit()
+        first.make_up_for_id = second.id
+        second.make_up_for_id = first.id
+        db_session.commit()
+
+        result = batch_find_root_original_session_dates([first, second], db_session)
+        assert set(result) == {first.id, second.id}
+
 
 # ============================================================================
 # Session Ownership Verification Tests
@@ -1426,3 +1509,36 @@ class TestLessonNumberDuplicateGuard:
             cookies={"access_token": token},
         )
         assert resp.status_code == 200
+
+
+class TestCalendarEventsList:
+    """GET /calendar/events counts revision slots in bulk."""
+
+    def test_revision_slots_counted_in_one_query(self, client, db_session, sample_tutor):
+        from unittest.mock import patch
+        from models import CalendarEvent, ExamRevisionSlot
+
+        for i in range(3):
+            event = CalendarEvent(
+                event_id=f"evt-list-{i}", title=f"Exam {i}",
+                start_date=date.today() + timedelta(days=i + 1), event_type="Exam",
+            )
+            db_session.add(event)
+            db_session.flush()
+            for _ in range(i):
+                db_session.add(ExamRevisionSlot(
+                    calendar_event_id=event.id, session_date=event.start_date,
+                    time_slot=f"1{i}:00 - 1{i}:30", tutor_id=sample_tutor.id,
+                    location="Main Center",
+                ))
+        db_session.commit()
+        token = make_auth_token(sample_tutor.id)
+
+        with patch("services.google_calendar_service.sync_calendar_events"):
+            with capture_queries(db_session.get_bind()) as queries:
+                resp = client.get("/api/calendar/events", cookies={"access_token": token})
+        assert resp.status_code == 200, resp.text
+        assert [e["revision_slot_count"] for e in resp.json()] == [0, 1, 2]
+        slot_reads = [q for q in queries if "FROM exam_revision_slots" in q]
+        assert len(slot_reads) == 1
+        assert "GROUP BY exam_revision_slots.calendar_event_id" in slot_reads[0]
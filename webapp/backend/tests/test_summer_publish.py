@@ -786,8 +786,12 @@ class TestDownstreamSummerHandling:
         db_session.commit()
 
         import asyncio
+        from fastapi import Response
         result = asyncio.get_event_loop().run_until_complete(
-            get_overdue_enrollments(location=None, tutor_id=None, db=db_session)
+            get_overdue_enrollments(
+                response=Response(), location=None, tutor_id=None,
+                limit=None, offset=0, db=db_session,
+            )
         )
         assert any(o.id == enrollment.id for o in result)
 
@@ -0,0 +1,67 @@
+"""
+Commit-driven invalidation for the per-process response caches.
+
+A router registers a clear function together with the models its cached
+views read. Any committed ORM write to one of those models, whether a unit of
+work flush or a bulk query.update()/update() statement run through a Session,
+then clears the cache once the transaction commits, whichever router made
+the write. Rolled-back writes clear nothing.
+
+Raw SQL text is not seen here; code that writes a registered table with raw
+SQL calls mark_written() for it. Writes committed by another worker process
+still reach a cache only when its entries expire.
+
+Usage:
+    invalidate_on_commit((Enrollment, Student), clear_enrollment_list_cache)
+    db.execute(text("INSERT INTO calendar_events ..."))
+    mark_written(db, CalendarEvent)
+"""
+from typing import Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# session.info key holding the clear functions owed at the next commit
+_PENDING_KEY = "pending_cache_clears"
+
+_registry: list[tuple[frozenset, Callable[[], None]]] = []
+
+
+def invalidate_on_commit(models: Iterable[type], clear: Callable[[], None]) -> None:
+    """Call clear() after any commit that wrote to one of models."""
+    _registry.append((frozenset(models), clear))
+
+
+def mark_written(session: Session, *models: type) -> None:
+    """Record that session's transaction wrote to models (for raw SQL writes)."""
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for registered, clear in _registry:
+        if not registered.isdisjoint(models):
+            pending.add(clear)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    # new/dirty/deleted still describe what this flush wrote
+    written = {type(obj) for obj in (*session.new, *session.dirty, *session.deleted)}
+    if written:
+        mark_written(session, *written)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _after_bulk_write(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            mark_written(orm_execute_state.session, mapper.class_)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    for clear in session.info.pop(_PENDING_KEY, ()):
+        clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
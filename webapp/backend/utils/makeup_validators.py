@@ -209,8 +209,10 @@ def validate_makeup_constraints(
                     logger.warning(f"Could not check enrollment deadline: {e}")
 
     # 4. Check for student conflict at the target slot
-    # Exclude non-blocking statuses (matches active_student_slot_guard logic in models.py)
-    conflict_query = db.query(SessionLog).filter(
+    # Exclude non-blocking statuses (matches active_student_slot_guard logic in models.py).
+    # Only the ID goes into the error, so no session row is hydrated; the
+    # lookup is a range on idx_session_log_student_date.
+    conflict_query = db.query(SessionLog.id).filter(
         SessionLog.student_id == student_id,
         SessionLog.session_date == target_date,
         SessionLog.time_slot == target_time_slot,
@@ -222,9 +224,9 @@ def validate_makeup_constraints(
     if exclude_session_id:
         conflict_query = conflict_query.filter(SessionLog.id != exclude_session_id)
 
-    existing_session = conflict_query.first()
-    if existing_session:
+    existing_session_id = conflict_query.limit(1).scalar()
+    if existing_session_id is not None:
         raise HTTPException(
             status_code=400,
-            detail=f"Student already has a session at this slot (Session #{existing_session.id})"
+            detail=f"Student already has a session at this slot (Session #{existing_session_id})"
         )
@@ -4,8 +4,8 @@ Shared query helper functions.
 Centralizes common SQLAlchemy query patterns like joinedload options
 to reduce duplication across routers.
 """
-from sqlalchemy.orm import Session, joinedload
-from models import Enrollment, SessionLog, MakeupProposal, MakeupProposalSlot, PrimaryProspect, SummerApplication
+from sqlalchemy.orm import Session, joinedload, contains_eager
+from models import Enrollment, Student, Tutor, SessionLog, MakeupProposal, MakeupProposalSlot, PrimaryProspect, SummerApplication
 
 
 def enrollment_with_relations():
@@ -24,6 +24,39 @@ def enrollment_with_relations():
     ]
 
 
+# Student/tutor columns the enrollment list rows read. Both tables are wide,
+# and list endpoints hydrate one of each per row.
+ENROLLMENT_LIST_STUDENT_COLUMNS = (
+    Student.student_name,
+    Student.grade,
+    Student.school,
+    Student.school_student_id,
+    Student.lang_stream,
+)
+ENROLLMENT_LIST_TUTOR_COLUMNS = (Tutor.tutor_name,)
+
+
+def enrollment_list_relations(student_joined: bool = False):
+    """
+    Options for enrollment list endpoints: student, tutor and discount, with
+    student and tutor trimmed to the columns the list rows display.
+
+    Pass student_joined=True when the query already joins Enrollment.student
+    (e.g. to sort by name); the student is then populated from that join.
+    Use an outer join so enrollments without a student row are not dropped.
+
+    Usage:
+        query.options(*enrollment_list_relations())
+        query.outerjoin(Enrollment.student).options(*enrollment_list_relations(student_joined=True))
+    """
+    student = contains_eager(Enrollment.student) if student_joined else joinedload(Enrollment.student)
+    return [
+        student.load_only(*ENROLLMENT_LIST_STUDENT_COLUMNS),
+        joinedload(Enrollment.tutor).load_only(*ENROLLMENT_LIST_TUTOR_COLUMNS),
+        joinedload(Enrollment.discount),
+    ]
+
+
 def enrollment_with_student_tutor():
     """
     Joinedload options for enrollment queries without discount.
@@ -6,10 +6,14 @@ from SQLAlchemy models with loaded relationships.
 """
 from typing import Optional
 from datetime import date
-from sqlalchemy.orm import Session
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session, aliased
 from models import SessionLog, Tutor, SummerSession, SummerCourseSlot, SummerLesson
 from schemas import SessionResponse, SessionExerciseResponse, LinkedSessionInfo
 
+# Guards the recursive make-up chain walk against cyclic make_up_for_id data.
+MAX_MAKEUP_CHAIN_DEPTH = 50
+
 
 def _find_root_original_session_date(session: SessionLog, db: Session):
     """
@@ -42,44 +46,41 @@ def batch_find_root_original_session_dates(
     """
     Batch-resolve root original session dates for a list of sessions.
 
+    Walks every make_up_for_id chain in a single recursive CTE round-trip.
     Returns a dict mapping session_id -> root_original_date for sessions
     that are makeups. Non-makeup sessions are excluded from the result.
     """
-    makeup_sessions = [s for s in sessions if s.make_up_for_id]
-    if not makeup_sessions:
+    makeup_ids = [s.id for s in sessions if s.make_up_for_id]
+    if not makeup_ids:
         return {}
 
-    # Build a map of all sessions we already have
-    known_sessions = {s.id: s for s in sessions}
-
-    # Collect parent IDs we need to trace
-    ids_to_fetch = {s.make_up_for_id for s in makeup_sessions}
-
-    # Iteratively load parent sessions until all chains are resolved
-    while ids_to_fetch - set(known_sessions.keys()):
-        missing_ids = list(ids_to_fetch - set(known_sessions.keys()))
-        parents = db.query(SessionLog).filter(
-            SessionLog.id.in_(missing_ids)
-        ).all()
-        if not parents:
-            break
-        for p in parents:
-            known_sessions[p.id] = p
-            if p.make_up_for_id:
-                ids_to_fetch.add(p.make_up_for_id)
+    chain = select(
+        SessionLog.id.label("start_id"),
+        SessionLog.make_up_for_id,
+        SessionLog.session_date,
+        literal(0).label("depth"),
+    ).where(SessionLog.id.in_(makeup_ids)).cte("makeup_chain", recursive=True)
+
+    parent = aliased(SessionLog)
+    chain = chain.union_all(
+        select(
+            chain.c.start_id,
+            parent.make_up_for_id,
+            parent.session_date,
+            chain.c.depth + 1,
+        ).join(parent, parent.id == chain.c.make_up_for_id)
+        .where(chain.c.depth < MAX_MAKEUP_CHAIN_DEPTH)
+    )
 
-    # Trace each makeup session to its root
+    # The deepest row reached for each session is its root (or the last
+    # resolvable ancestor when a parent is missing).
     result = {}
-    for s in makeup_sessions:
-        visited = set()
-        current = s
-        while current.make_up_for_id and current.id not in visited:
-            visited.add(current.id)
-            parent = known_sessions.get(current.make_up_for_id)
-            if not parent:
-                break
-            current = parent
-        result[s.id] = current.session_date
+    deepest = {}
+    rows = db.execute(select(chain.c.start_id, chain.c.depth, chain.c.session_date))
+    for start_id, depth, session_date in rows:
+        if depth >= deepest.get(start_id, -1):
+            deepest[start_id] = depth
+            result[start_id] = session_date
 
     return result
 